@@ -0,0 +1,47 @@
+"""
+This benchmark compares reading time series and maps from the JSON and the binary database formats.
+"""
+
+import time
+import numpy as np
+import pyperf
+from benchmarks.utils import build_map
+from spinedb_api import TimeSeriesFixedResolution, TimeSeriesVariableResolution, from_database, to_database
+
+
+def value_from_database(loops, db_value, value_type):
+    duration = 0.0
+    for _ in range(loops):
+        start = time.perf_counter()
+        from_database(db_value, value_type)
+        duration += time.perf_counter() - start
+    return duration
+
+
+def build_values(step_count):
+    stamps = np.datetime64("2024-01-01T00:00:00") + np.arange(step_count).astype("timedelta64[h]")
+    values = np.sin(np.linspace(0.0, 100.0, step_count))
+    return {
+        "TimeSeriesFixedResolution": TimeSeriesFixedResolution("2024-01-01T00:00", "1h", values, False, False),
+        "TimeSeriesVariableResolution": TimeSeriesVariableResolution(stamps, values, False, False),
+        "Map": build_map(step_count),
+    }
+
+
+def run_benchmark(file_name):
+    runner = pyperf.Runner(loops=10)
+    for name, value in build_values(8760).items():
+        for binary in (False, True):
+            db_value, value_type = to_database(value, binary=binary)
+            benchmark = runner.bench_time_func(
+                f"from_database[{name}(8760), {'binary' if binary else 'JSON'}]",
+                value_from_database,
+                db_value,
+                value_type,
+            )
+            if file_name and benchmark is not None:
+                pyperf.add_runs(file_name, benchmark)
+
+
+if __name__ == "__main__":
+    run_benchmark("")
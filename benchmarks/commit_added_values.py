@@ -0,0 +1,74 @@
+"""
+This benchmark tests the performance of committing a few new parameter values
+into databases that already contain a varying number of values.
+Commit latency should not grow with the size of the parameter_value table.
+"""
+
+import pathlib
+from tempfile import TemporaryDirectory
+import time
+import pyperf
+from spinedb_api import DatabaseMapping, to_database
+
+NEW_VALUE_COUNT = 10
+
+
+def build_database(url: str, existing_value_count: int) -> None:
+    value, value_type = to_database(2.3)
+    with DatabaseMapping(url, create=True) as db_map:
+        db_map.add_entity_class(name="Widget")
+        db_map.add_parameter_definition(entity_class_name="Widget", name="weight")
+        for i in range(existing_value_count):
+            name = f"widget_{i}"
+            db_map.add_entity(entity_class_name="Widget", name=name)
+            db_map.add_parameter_value(
+                entity_class_name="Widget",
+                entity_byname=(name,),
+                parameter_definition_name="weight",
+                alternative_name="Base",
+                value=value,
+                type=value_type,
+            )
+        db_map.commit_session("Add initial data.")
+
+
+def commit_added_values(loops: int, url: str) -> float:
+    value, value_type = to_database(5.0)
+    duration = 0.0
+    with DatabaseMapping(url) as db_map:
+        db_map.fetch_all("alternative", "entity_class", "entity", "parameter_definition", "parameter_value")
+        for loop in range(loops):
+            for i in range(NEW_VALUE_COUNT):
+                name = f"new_widget_{loop}_{i}"
+                db_map.add_entity(entity_class_name="Widget", name=name)
+                db_map.add_parameter_value(
+                    entity_class_name="Widget",
+                    entity_byname=(name,),
+                    parameter_definition_name="weight",
+                    alternative_name="Base",
+                    value=value,
+                    type=value_type,
+                )
+            start = time.perf_counter()
+            db_map.commit_session("Add new values.")
+            duration += time.perf_counter() - start
+    return duration
+
+
+def run_benchmark(file_name: str) -> None:
+    runner = pyperf.Runner(loops=5)
+    for existing_value_count in (100, 10000, 100000):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + str(pathlib.Path(temp_dir) / "db.sqlite")
+            build_database(url, existing_value_count)
+            benchmark = runner.bench_time_func(
+                f"commit_session[{NEW_VALUE_COUNT} new values, {existing_value_count} existing]",
+                commit_added_values,
+                url,
+            )
+        if file_name and benchmark is not None:
+            pyperf.add_runs(file_name, benchmark)
+
+
+if __name__ == "__main__":
+    run_benchmark("")
@@ -1,9 +1,11 @@
-""" This benchmark tests the performance of reading a DateTime value from database. """
+"""This benchmark tests the performance of reading DateTime values and time stamps from database."""
 
 import datetime
+import json
 import time
 from typing import Any, Sequence, Tuple
 import pyperf
+from benchmarks.utils import build_time_series
 from spinedb_api import DateTime, from_database, to_database
 
 
@@ -38,6 +40,12 @@ def value_from_database(loops: int, db_values_and_types: Sequence[Tuple[Any, str
     return duration
 
 
+def time_series_as_two_columns(db_value: bytes) -> bytes:
+    value_dict = json.loads(db_value)
+    value_dict["data"] = [[stamp, value] for stamp, value in value_dict["data"].items()]
+    return json.dumps(value_dict).encode()
+
+
 def run_benchmark(file_name):
     runner = pyperf.Runner(loops=10)
     inner_loops = 1000
@@ -47,6 +55,15 @@ def run_benchmark(file_name):
     )
     if file_name:
         pyperf.add_runs(file_name, benchmark)
+    db_value, db_type = to_database(build_time_series(8760))
+    runs = {
+        "from_database[TimeSeriesVariableResolution(8760), dictionary]": db_value,
+        "from_database[TimeSeriesVariableResolution(8760), two columns]": time_series_as_two_columns(db_value),
+    }
+    for name, time_series_db_value in runs.items():
+        benchmark = runner.bench_time_func(name, value_from_database, [(time_series_db_value, db_type)])
+        if file_name and benchmark is not None:
+            pyperf.add_runs(file_name, benchmark)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+"""
+This benchmark compares fetching an entire database into a normal and a read-only database mapping.
+"""
+
+import pathlib
+from tempfile import TemporaryDirectory
+import time
+import pyperf
+from spinedb_api import DatabaseMapping, to_database
+
+ENTITY_COUNT = 10000
+
+
+def build_database(url: str) -> None:
+    value, value_type = to_database(2.3)
+    with DatabaseMapping(url, create=True) as db_map:
+        db_map.add_entity_class(name="Widget")
+        db_map.add_parameter_definition(entity_class_name="Widget", name="weight")
+        for i in range(ENTITY_COUNT):
+            name = f"widget_{i}"
+            db_map.add_entity(entity_class_name="Widget", name=name)
+            db_map.add_parameter_value(
+                entity_class_name="Widget",
+                entity_byname=(name,),
+                parameter_definition_name="weight",
+                alternative_name="Base",
+                value=value,
+                type=value_type,
+            )
+        db_map.commit_session("Add test data.")
+
+
+def fetch_all(loops: int, url: str, read_only: bool) -> float:
+    duration = 0.0
+    for _ in range(loops):
+        with DatabaseMapping(url, read_only=read_only) as db_map:
+            start = time.perf_counter()
+            db_map.fetch_all()
+            duration += time.perf_counter() - start
+        db_map.close()
+    return duration
+
+
+def run_benchmark(file_name: str) -> None:
+    runner = pyperf.Runner(loops=3)
+    with TemporaryDirectory() as temp_dir:
+        url = "sqlite:///" + str(pathlib.Path(temp_dir) / "db.sqlite")
+        build_database(url)
+        benchmarks = [
+            runner.bench_time_func(f"fetch_all[{ENTITY_COUNT} entities and values]", fetch_all, url, False),
+            runner.bench_time_func(f"fetch_all[{ENTITY_COUNT} entities and values, read-only]", fetch_all, url, True),
+        ]
+    if file_name:
+        for benchmark in benchmarks:
+            if benchmark is not None:
+                pyperf.add_runs(file_name, benchmark)
+
+
+if __name__ == "__main__":
+    run_benchmark("")
@@ -0,0 +1,57 @@
+"""
+This benchmark measures the memory it takes to keep fetched parameter values in a database mapping.
+
+Memory is measured with :mod:`tracemalloc` rather than ``pyperf``
+since the latter tracks the peak memory of the whole worker process only.
+"""
+
+import gc
+import pathlib
+from tempfile import TemporaryDirectory
+import tracemalloc
+from spinedb_api import DatabaseMapping, to_database
+
+
+def build_database(url: str, value_count: int) -> None:
+    value, value_type = to_database(2.3)
+    with DatabaseMapping(url, create=True) as db_map:
+        db_map.add_entity_class(name="Widget")
+        db_map.add_parameter_definition(entity_class_name="Widget", name="weight")
+        for i in range(value_count):
+            name = f"widget_{i}"
+            db_map.add_entity(entity_class_name="Widget", name=name)
+            db_map.add_parameter_value(
+                entity_class_name="Widget",
+                entity_byname=(name,),
+                parameter_definition_name="weight",
+                alternative_name="Base",
+                value=value,
+                type=value_type,
+            )
+        db_map.commit_session("Add test data.")
+
+
+def measure_fetched_values(url: str) -> tuple[int, int]:
+    with DatabaseMapping(url) as db_map:
+        db_map.fetch_all("alternative", "entity_class", "entity", "parameter_definition")
+        gc.collect()
+        tracemalloc.start()
+        start_size, _ = tracemalloc.get_traced_memory()
+        values = db_map.fetch_all("parameter_value")
+        gc.collect()
+        end_size, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return (end_size - start_size) // len(values), (peak_size - start_size) // len(values)
+
+
+def run_benchmark() -> None:
+    for value_count in (1000, 10000, 100000):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + str(pathlib.Path(temp_dir) / "db.sqlite")
+            build_database(url, value_count)
+            retained, peak = measure_fetched_values(url)
+        print(f"fetch_all('parameter_value')[{value_count} values]: {retained} B/value retained, {peak} B/value peak")
+
+
+if __name__ == "__main__":
+    run_benchmark()
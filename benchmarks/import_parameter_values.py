@@ -0,0 +1,60 @@
+"""
+This benchmark measures importing parameter values with ``import_data()``
+into an in-memory mapping of a database that contains the referenced entities.
+"""
+
+import time
+import pyperf
+from spinedb_api import DatabaseMapping, import_data
+
+ENTITY_COUNT = 1000
+
+
+def build_import_data(value_count: int) -> dict:
+    alternative_count = value_count // ENTITY_COUNT
+    alternatives = [f"alternative_{i}" for i in range(alternative_count)]
+    entity_names = [f"widget_{i}" for i in range(ENTITY_COUNT)]
+    return {
+        "alternatives": alternatives,
+        "entity_classes": [("Widget",)],
+        "entities": [("Widget", name) for name in entity_names],
+        "parameter_definitions": [("Widget", "weight")],
+        "parameter_values": [
+            ("Widget", name, "weight", float(i), alternative)
+            for alternative in alternatives
+            for i, name in enumerate(entity_names)
+        ],
+    }
+
+
+def import_parameter_values(loops: int, data: dict) -> float:
+    parameter_values = data["parameter_values"]
+    other_data = {key: items for key, items in data.items() if key != "parameter_values"}
+    duration = 0.0
+    for _ in range(loops):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            import_data(db_map, **other_data)
+            start = time.perf_counter()
+            count, errors = import_data(db_map, parameter_values=parameter_values)
+            duration += time.perf_counter() - start
+            assert count == len(parameter_values) and not errors
+        db_map.close()
+    return duration
+
+
+def run_benchmark(file_name: str) -> None:
+    runner = pyperf.Runner(loops=3)
+    benchmarks = []
+    for value_count in (10000, 100000, 1000000):
+        data = build_import_data(value_count)
+        benchmarks.append(
+            runner.bench_time_func(f"import_data[{value_count} parameter values]", import_parameter_values, data)
+        )
+    if file_name:
+        for benchmark in benchmarks:
+            if benchmark is not None:
+                pyperf.add_runs(file_name, benchmark)
+
+
+if __name__ == "__main__":
+    run_benchmark("")
@@ -1,10 +1,10 @@
 """
-This benchmark tests the performance of reading a Map type value from database.
+This benchmark tests the performance of reading Map and time series type values from database.
 """
 
 import time
 import pyperf
-from benchmarks.utils import build_even_map
+from benchmarks.utils import build_even_map, build_fixed_resolution_time_series, build_time_series
 from spinedb_api import from_database, to_database
 
 
@@ -20,11 +20,13 @@ def value_from_database(loops, db_value, value_type):
 def run_benchmark(file_name):
     runner = pyperf.Runner(loops=3)
     runs = {
-        "value_from_database[Map(10, 10, 100)]": {"dimensions": (10, 10, 100)},
-        "value_from_database[Map(1000)]": {"dimensions": (10000,)},
+        "value_from_database[Map(10, 10, 100)]": lambda: build_even_map((10, 10, 100)),
+        "value_from_database[Map(1000)]": lambda: build_even_map((10000,)),
+        "value_from_database[TimeSeriesFixedResolution(8760)]": lambda: build_fixed_resolution_time_series(8760),
+        "value_from_database[TimeSeriesVariableResolution(8760)]": lambda: build_time_series(8760),
     }
-    for name, parameters in runs.items():
-        db_value, value_type = to_database(build_even_map(parameters["dimensions"]))
+    for name, build_value in runs.items():
+        db_value, value_type = to_database(build_value())
         benchmark = runner.bench_time_func(
             name,
             value_from_database,
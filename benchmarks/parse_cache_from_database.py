@@ -0,0 +1,86 @@
+"""
+This benchmark compares reading values from database with a cold and a warm parse cache
+against parsing without the cache.
+"""
+
+import time
+from typing import Any, Sequence, Tuple
+import pyperf
+from benchmarks.utils import build_even_map, build_time_series
+from spinedb_api import (
+    Map,
+    clear_parse_cache,
+    from_database,
+    parse_cache_info,
+    set_parse_cache_limits,
+    to_database,
+)
+
+
+def build_string_indexed_map(size: int, map_number: int) -> Map:
+    return Map([f"key_{map_number}_{i}" for i in range(size)], [float(i) for i in range(size)])
+
+
+def values_without_cache(loops: int, db_values_and_types: Sequence[Tuple[Any, str]]) -> float:
+    max_entries, max_bytes = parse_cache_info()[-2:]
+    set_parse_cache_limits(0, 0)
+    duration = 0.0
+    for _ in range(loops):
+        start = time.perf_counter()
+        for db_value, db_type in db_values_and_types:
+            from_database(db_value, db_type)
+        duration += time.perf_counter() - start
+    set_parse_cache_limits(max_entries, max_bytes)
+    return duration
+
+
+def values_with_cold_cache(loops: int, db_values_and_types: Sequence[Tuple[Any, str]]) -> float:
+    duration = 0.0
+    for _ in range(loops):
+        clear_parse_cache()
+        start = time.perf_counter()
+        for db_value, db_type in db_values_and_types:
+            from_database(db_value, db_type)
+        duration += time.perf_counter() - start
+    clear_parse_cache()
+    return duration
+
+
+def values_with_warm_cache(loops: int, db_values_and_types: Sequence[Tuple[Any, str]]) -> float:
+    clear_parse_cache()
+    for db_value, db_type in db_values_and_types:
+        from_database(db_value, db_type)
+    duration = 0.0
+    for _ in range(loops):
+        start = time.perf_counter()
+        for db_value, db_type in db_values_and_types:
+            from_database(db_value, db_type)
+        duration += time.perf_counter() - start
+    clear_parse_cache()
+    return duration
+
+
+def run_benchmark(file_name):
+    runner = pyperf.Runner(loops=3)
+    value_sets = {
+        "50 x Map(2000)[str]": lambda: [build_string_indexed_map(2000, n) for n in range(50)],
+        "Map(10, 10, 100)": lambda: [build_even_map((10, 10, 100))],
+        "TimeSeriesVariableResolution(8760)": lambda: [build_time_series(8760)],
+    }
+    benchmark_functions = {
+        "no_cache": values_without_cache,
+        "cold_cache": values_with_cold_cache,
+        "warm_cache": values_with_warm_cache,
+    }
+    for value_set_name, build_values in value_sets.items():
+        db_values_and_types = [to_database(value) for value in build_values()]
+        for function_name, function in benchmark_functions.items():
+            benchmark = runner.bench_time_func(
+                f"from_database_{function_name}[{value_set_name}]", function, db_values_and_types
+            )
+            if file_name and benchmark is not None:
+                pyperf.add_runs(file_name, benchmark)
+
+
+if __name__ == "__main__":
+    run_benchmark("")
@@ -1,7 +1,7 @@
 import datetime
 import math
 from typing import Sequence
-from spinedb_api import DateTime, Map
+from spinedb_api import DateTime, Map, TimeSeriesFixedResolution, TimeSeriesVariableResolution
 
 
 def build_map(size: int) -> Map:
@@ -27,3 +27,15 @@ def build_even_map(shape: Sequence[int] = (10, 10, 10)) -> Map:
         xs.append(DateTime(start + datetime.timedelta(hours=i)))
         ys.append(build_even_map(shape[1:]))
     return Map(xs, ys)
+
+
+def build_time_series(size: int) -> TimeSeriesVariableResolution:
+    start = datetime.datetime(year=2024, month=1, day=1)
+    stamps = [start + datetime.timedelta(hours=i) for i in range(size)]
+    values = [math.sin(i / size * math.pi / 2.0) + i / size for i in range(size)]
+    return TimeSeriesVariableResolution(stamps, values, ignore_year=False, repeat=False)
+
+
+def build_fixed_resolution_time_series(size: int) -> TimeSeriesFixedResolution:
+    values = [math.sin(i / size * math.pi / 2.0) + i / size for i in range(size)]
+    return TimeSeriesFixedResolution("2024-01-01T00:00", "1h", values, ignore_year=False, repeat=False)
@@ -31,11 +31,12 @@ from .export_functions import (
     export_parameter_values,
     export_scenario_alternatives,
     export_scenarios,
+    iter_export_data,
 )
 from .filters.alternative_filter import apply_alternative_filter_to_parameter_value_sq
 from .filters.execution_filter import apply_execution_filter
 from .filters.renamer import apply_renaming_to_entity_class_sq, apply_renaming_to_parameter_definition_sq
-from .filters.scenario_filter import apply_scenario_filter_to_subqueries
+from .filters.scenario_filter import apply_scenario_filter_to_subqueries, resolve_scenarios
 from .filters.tools import (
     append_filter_config,
     apply_filter_stack,
@@ -83,7 +84,7 @@ from .import_functions import (
     import_scenario_alternatives,
     import_scenarios,
 )
-from .import_mapping.generator import get_mapped_data
+from .import_mapping.generator import get_mapped_data, iter_mapped_data
 from .import_mapping.import_mapping_compat import import_mapping_from_dict
 from .parameter_value import (
     Array,
@@ -95,14 +96,19 @@ from .parameter_value import (
     TimeSeries,
     TimeSeriesFixedResolution,
     TimeSeriesVariableResolution,
+    ValueMetadata,
+    clear_parse_cache,
     convert_containers_to_maps,
     convert_leaf_maps_to_specialized_containers,
     convert_map_to_dict,
     convert_map_to_table,
     duration_to_relativedelta,
     from_database,
+    parse_cache_info,
     relativedelta_to_duration,
+    set_parse_cache_limits,
     to_database,
+    value_metadata,
 )
 from .version import __version__, __version_tuple__
 
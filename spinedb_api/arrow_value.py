@@ -22,6 +22,7 @@ Apache Arrow - Spine interoperability layer.
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 import datetime
+import itertools
 from typing import Any, Optional, SupportsFloat, Union
 from dateutil import relativedelta
 import numpy
@@ -30,10 +31,22 @@ from .parameter_value import (
     NUMPY_DATETIME_DTYPE,
     TIME_SERIES_DEFAULT_RESOLUTION,
     TIME_SERIES_DEFAULT_START,
+    Array,
+    DateTime,
+    Duration,
+    IndexedValue,
+    Map,
     ParameterValueFormatError,
+    TimeSeries,
+    TimeSeriesFixedResolution,
+    TimeSeriesVariableResolution,
+    binary_value_arrays,
     duration_to_relativedelta,
+    is_binary_db_value,
     load_db_value,
+    relativedelta_to_duration,
 )
+from .parameter_value import to_database as parsed_value_to_database
 
 _DATA_TYPE_TO_ARROW_TYPE = {
     "date_time": pyarrow.timestamp("s"),
@@ -49,11 +62,17 @@ _DATA_CONVERTER = {
     "date_time": lambda data: numpy.array(data, dtype="datetime64[s]"),
 }
 
+_TIME_SERIES_METADATA_KEYS = (b"ignore_year", b"repeat")
+
+_LEAF_ARROW_TYPES = (pyarrow.float64(), pyarrow.string(), pyarrow.bool_(), pyarrow.null())
+
 
 def from_database(db_value: bytes, value_type: str) -> Any:
     """Parses a database value."""
     if db_value is None:
         return None
+    if is_binary_db_value(db_value):
+        return binary_to_record_batch(db_value, value_type)
     loaded = load_db_value(db_value, value_type)
     if isinstance(loaded, dict):
         return from_dict(loaded, value_type)
@@ -62,6 +81,63 @@ def from_database(db_value: bytes, value_type: str) -> Any:
     return loaded
 
 
+def table_from_database(
+    db_values: Iterable[tuple[bytes, Optional[str]]], keys: Optional[Iterable[Any]] = None, key_name: str = "key"
+) -> pyarrow.Table:
+    """Decodes many database values into a single table.
+
+    The rows of each value are prefixed by a key column that tells which value the rows came from.
+    Scalar values become single rows in the ``value`` column.
+    Columns missing from some values are filled with nulls;
+    columns that share a name must have compatible types across values.
+
+    Args:
+        db_values: database values and their types
+        keys: a key for each value; defaults to the position of the value in ``db_values``
+        key_name: name of the key column
+
+    Returns:
+        decoded values
+    """
+    if keys is None:
+        keys = itertools.count()
+    tables = []
+    for key, (db_value, value_type) in zip(keys, db_values):
+        record_batch = from_database(db_value, value_type)
+        if not isinstance(record_batch, pyarrow.RecordBatch):
+            record_batch = pyarrow.RecordBatch.from_arrays([pyarrow.array([record_batch])], names=["value"])
+        table = pyarrow.Table.from_batches([record_batch])
+        tables.append(table.add_column(0, key_name, pyarrow.repeat(key, len(table))))
+    if not tables:
+        return pyarrow.table({key_name: pyarrow.array([], pyarrow.int64()), "value": pyarrow.array([], pyarrow.null())})
+    return pyarrow.concat_tables(tables, promote_options="permissive")
+
+
+def binary_to_record_batch(db_value: bytes, value_type: str) -> pyarrow.RecordBatch:
+    """Converts a value in the binary format to record batch straight from its arrays."""
+    _, header, indexes, values = binary_value_arrays(db_value)
+    y_array = pyarrow.array(values, type=pyarrow.float64())
+    try:
+        index_name = header["index_name"]
+        if value_type == TimeSeries.TYPE:
+            if indexes is None:
+                indexes = time_stamps(numpy.datetime64(header["start"]), header["resolution"], len(values))
+            x_array = pyarrow.array(indexes, type=pyarrow.timestamp("s"))
+            metadata = {index_name: _time_series_metadata(header["ignore_year"], header["repeat"])}
+            return pyarrow.RecordBatch.from_arrays(
+                [x_array, y_array], schema=make_schema([x_array, y_array], [index_name, "value"], metadata)
+            )
+    except KeyError as error:
+        raise ParameterValueFormatError(f'"{error.args[0]}" is missing in the binary value header') from error
+    if value_type == Array.TYPE:
+        x_array = pyarrow.array(numpy.arange(len(values)), type=pyarrow.int64())
+    else:
+        x_array = pyarrow.array(indexes)
+        if index_name == Map.DEFAULT_INDEX_NAME:
+            index_name = "col_1"
+    return pyarrow.RecordBatch.from_arrays([x_array, y_array], names=[index_name, "value"])
+
+
 def from_dict(loaded_value: dict, value_type: str) -> pyarrow.RecordBatch:
     """Converts a value dict to parsed value."""
     if value_type == "array":
@@ -74,15 +150,258 @@ def from_dict(loaded_value: dict, value_type: str) -> pyarrow.RecordBatch:
         x_array = pyarrow.array(range(0, len(y_array)), type=pyarrow.int64())
         return pyarrow.RecordBatch.from_arrays([x_array, y_array], names=[loaded_value.get("index_name", "i"), "value"])
     if value_type == "map":
+        record_batch = even_map_to_record_batch(loaded_value)
+        if record_batch is not None:
+            return record_batch
         return crawled_to_record_batch(crawl_map_uneven, loaded_value)
     if value_type == "time_series":
-        return crawled_to_record_batch(crawl_time_series, loaded_value)
+        return time_series_to_record_batch(loaded_value)
+    if value_type == "date_time":
+        return datetime.datetime.fromisoformat(loaded_value["data"])
     raise NotImplementedError(f"unknown value type {value_type}")
 
 
-def to_database(parsed_value: Any) -> tuple[bytes, str]:
-    """Converts parsed value into database value."""
-    raise NotImplementedError()
+def time_series_to_record_batch(loaded_value: dict) -> pyarrow.RecordBatch:
+    """Converts a time series dict to record batch with bulk array conversions."""
+    data = loaded_value["data"]
+    index_name = loaded_value.get("index_name", "t")
+    loaded_index = loaded_value.get("index", {})
+    if isinstance(data, dict):
+        stamps = numpy.array(list(data), dtype=NUMPY_DATETIME_DTYPE)
+        values = list(data.values())
+    elif data and isinstance(data[0], list):
+        stamps, values = zip(*data)
+        stamps = numpy.array(stamps, dtype=NUMPY_DATETIME_DTYPE)
+    else:
+        start = numpy.datetime64(loaded_index.get("start", TIME_SERIES_DEFAULT_START))
+        resolution = loaded_index.get("resolution", TIME_SERIES_DEFAULT_RESOLUTION)
+        stamps = time_stamps(start, resolution, len(data))
+        values = data
+    x_array = pyarrow.array(stamps, type=pyarrow.timestamp("s"))
+    y_array = pyarrow.array(values, type=pyarrow.float64())
+    metadata = {
+        index_name: _time_series_metadata(loaded_index.get("ignore_year", False), loaded_index.get("repeat", False))
+    }
+    arrays = [x_array, y_array]
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=make_schema(arrays, [index_name, "value"], metadata))
+
+
+def _time_series_metadata(ignore_year: bool, repeat: bool) -> dict[str, str]:
+    return {"ignore_year": "true" if ignore_year else "false", "repeat": "true" if repeat else "false"}
+
+
+def even_map_to_record_batch(loaded_value: dict) -> Optional[pyarrow.RecordBatch]:
+    """Converts a map dict to record batch level by level instead of row by row.
+
+    Works for maps where all leaves are at the same depth,
+    each level has a single index type and name, and the leaves have a single scalar type.
+
+    Returns:
+        record batch or None if the map does not meet the requirements
+    """
+    maps = [loaded_value]
+    index_arrays = []
+    index_names = []
+    child_counts = []
+    depth = 0
+    while True:
+        depth += 1
+        index_type = maps[0]["index_type"]
+        index_name = maps[0].get("index_name", f"col_{depth}")
+        for map_ in maps:
+            if map_["index_type"] != index_type or map_.get("index_name", f"col_{depth}") != index_name:
+                return None
+        xs = []
+        ys = []
+        counts = []
+        for map_ in maps:
+            map_xs, map_ys = _split_map_data(map_["data"])
+            if not map_xs:
+                return None
+            xs += map_xs
+            ys += map_ys
+            counts.append(len(map_xs))
+        index_array = _index_array(xs, index_type)
+        if index_array is None:
+            return None
+        index_arrays.append(index_array)
+        index_names.append(index_name)
+        child_counts.append(counts)
+        nested_count = sum(1 for y in ys if isinstance(y, dict))
+        if nested_count == 0:
+            break
+        if nested_count != len(ys) or any(y.get("type") != "map" for y in ys):
+            return None
+        maps = ys
+    value_array = _leaf_array(ys)
+    if value_array is None:
+        return None
+    # Number of leaf rows under each index, from the deepest level up.
+    leaf_counts = numpy.ones(len(value_array), dtype=numpy.int64)
+    columns = [value_array]
+    for index_array, counts in zip(reversed(index_arrays), reversed(child_counts[1:] + [None])):
+        if counts is not None:
+            leaf_counts = numpy.add.reduceat(leaf_counts, numpy.cumsum([0] + counts[:-1]))
+        columns.append(index_array.take(numpy.repeat(numpy.arange(len(index_array)), leaf_counts)))
+    columns.reverse()
+    return pyarrow.RecordBatch.from_arrays(columns, names=index_names + ["value"])
+
+
+def _split_map_data(data: Union[dict, list]) -> tuple[list, list]:
+    if isinstance(data, dict):
+        return list(data), list(data.values())
+    if not data:
+        return [], []
+    try:
+        xs, ys = zip(*data)
+    except ValueError as error:
+        raise ParameterValueFormatError('"data" is not a nested two column array.') from error
+    return list(xs), list(ys)
+
+
+def _index_array(xs: list, index_type: str) -> Optional[pyarrow.Array]:
+    if index_type not in ("float", "str", "date_time"):
+        return None
+    if index_type in _DATA_CONVERTER:
+        xs = _DATA_CONVERTER[index_type](xs)
+    try:
+        return pyarrow.array(xs, type=_DATA_TYPE_TO_ARROW_TYPE[index_type])
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return None
+
+
+def _leaf_array(ys: list) -> Optional[pyarrow.Array]:
+    try:
+        array = pyarrow.array(ys)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return None
+    if pyarrow.types.is_integer(array.type):
+        array = array.cast(pyarrow.float64())
+    if array.type not in _LEAF_ARROW_TYPES or (array.null_count and array.type != pyarrow.null()):
+        # Mixed and null values are stored in union arrays by crawled_to_record_batch().
+        return None
+    return array
+
+
+def to_database(parsed_value: Any, binary: bool = False) -> tuple[bytes, Optional[str]]:
+    """Converts parsed value into database value.
+
+    Args:
+        parsed_value: a scalar or a record batch such as returned by :func:`from_database`
+        binary: if True, encode values that have a binary representation in the binary format
+
+    Returns:
+        database value and its type
+    """
+    if isinstance(parsed_value, pyarrow.RecordBatch):
+        parsed_value = record_batch_to_indexed_value(parsed_value)
+    elif isinstance(parsed_value, datetime.datetime):
+        parsed_value = DateTime(parsed_value)
+    return parsed_value_to_database(parsed_value, binary)
+
+
+def record_batch_to_indexed_value(record_batch: pyarrow.RecordBatch) -> IndexedValue:
+    """Converts a record batch back to array, time series or map.
+
+    A single integer index column gives an array,
+    a single time stamp column with time series metadata gives a time series,
+    and anything else gives a map that is nested as deep as there are index columns.
+    """
+    if record_batch.num_columns < 2:
+        raise ParameterValueFormatError("record batch needs at least an index and a value column")
+    fields = list(record_batch.schema)
+    value_column = record_batch.column(record_batch.num_columns - 1)
+    if len(fields) == 2:
+        if pyarrow.types.is_integer(fields[0].type):
+            values = [_to_parsed_scalar(y) for y in value_column.to_pylist()]
+            value_type = _parsed_scalar_type(_ARROW_TYPE_TO_DATA_TYPE.get(value_column.type))
+            return Array(values, value_type, fields[0].name)
+        if _is_time_series_field(fields[0]):
+            return _time_series_from_columns(fields[0], record_batch.column(0), value_column)
+    if record_batch.num_rows == 0:
+        index_type = _parsed_scalar_type(_ARROW_TYPE_TO_DATA_TYPE.get(fields[0].type)) or str
+        return Map([], [], index_type, _map_index_name(fields[0].name, 1))
+    index_columns = [column.to_pylist() for column in record_batch.columns[:-1]]
+    return _map_from_rows(fields, index_columns, value_column.to_pylist(), 0, 0, record_batch.num_rows)
+
+
+def _is_time_series_field(field: pyarrow.Field) -> bool:
+    return _time_stamp_type(field.type) is not None and all(
+        key in (field.metadata or {}) for key in _TIME_SERIES_METADATA_KEYS
+    )
+
+
+def _time_stamp_type(data_type: pyarrow.DataType) -> Optional[pyarrow.DataType]:
+    """Returns the time stamp type of a time stamp column or of the time stamp member of a union column."""
+    if pyarrow.types.is_timestamp(data_type):
+        return data_type
+    if pyarrow.types.is_union(data_type):
+        for i in range(data_type.num_fields):
+            if pyarrow.types.is_timestamp(data_type.field(i).type):
+                return data_type.field(i).type
+    return None
+
+
+def _time_series_from_columns(field: pyarrow.Field, stamps: pyarrow.Array, values: pyarrow.Array) -> TimeSeries:
+    ignore_year = field.metadata[b"ignore_year"] == b"true"
+    repeat = field.metadata[b"repeat"] == b"true"
+    stamps = stamps.cast(pyarrow.timestamp("s")).to_numpy(zero_copy_only=False)
+    values = values.cast(pyarrow.float64()).to_numpy(zero_copy_only=False)
+    if len(stamps) > 1:
+        steps = numpy.diff(stamps)
+        if steps[0] > numpy.timedelta64(0, "s") and numpy.all(steps == steps[0]):
+            step = relativedelta.relativedelta(seconds=int(steps[0] / numpy.timedelta64(1, "s"))).normalized()
+            return TimeSeriesFixedResolution(
+                str(stamps[0]), relativedelta_to_duration(step), values, ignore_year, repeat, field.name
+            )
+    return TimeSeriesVariableResolution(stamps, values, ignore_year, repeat, field.name)
+
+
+def _map_from_rows(
+    fields: list[pyarrow.Field], index_columns: list[list], values: list, depth: int, start: int, stop: int
+) -> IndexedValue:
+    """Builds a (nested) map from rows start...stop of the index columns starting at given depth."""
+    xs = index_columns[depth]
+    next_xs = index_columns[depth + 1] if depth + 1 < len(index_columns) else None
+    if _is_time_series_field(fields[depth]) and (next_xs is None or all(x is None for x in next_xs[start:stop])):
+        stamps = pyarrow.array(xs[start:stop], type=_time_stamp_type(fields[depth].type))
+        return _time_series_from_columns(fields[depth], stamps, pyarrow.array(values[start:stop]))
+    indexes = []
+    map_values = []
+    row = start
+    while row < stop:
+        x = xs[row]
+        end = row + 1
+        if next_xs is not None and next_xs[row] is not None:
+            while end < stop and xs[end] == x and next_xs[end] is not None:
+                end += 1
+            map_values.append(_map_from_rows(fields, index_columns, values, depth + 1, row, end))
+        else:
+            map_values.append(_to_parsed_scalar(values[row]))
+        indexes.append(_to_parsed_scalar(x))
+        row = end
+    return Map(indexes, map_values, index_name=_map_index_name(fields[depth].name, depth + 1))
+
+
+def _map_index_name(name: str, depth: int) -> str:
+    """Returns the default map index name for column names generated by from_database()."""
+    return Map.DEFAULT_INDEX_NAME if name == f"col_{depth}" else name
+
+
+def _to_parsed_scalar(x: Any) -> Any:
+    if isinstance(x, datetime.datetime):
+        return DateTime(x)
+    if isinstance(x, datetime.timedelta):
+        return Duration(
+            relativedelta.relativedelta(days=x.days, seconds=x.seconds, microseconds=x.microseconds).normalized()
+        )
+    if isinstance(x, int) and not isinstance(x, bool):
+        return float(x)
+    return x
+
+
+def _parsed_scalar_type(data_type: Optional[str]) -> Optional[type]:
+    return {"date_time": DateTime, "duration": Duration, "float": float, "str": str}.get(data_type)
 
 
 def type_of_loaded(loaded_value: Any) -> str:
@@ -233,7 +552,15 @@ def time_series_resolution(resolution: Union[str, list[str]]) -> list[relativede
 
 
 def time_stamps(start, resolution, count):
+    if count == 0:
+        return numpy.array([], dtype=NUMPY_DATETIME_DTYPE)
     resolution_as_deltas = time_series_resolution(resolution)
+    if len(resolution_as_deltas) == 1:
+        delta = resolution_as_deltas[0]
+        if not delta.years and not delta.months:
+            step = ((delta.days * 24 + delta.hours) * 60 + delta.minutes) * 60 + delta.seconds
+            start = start.astype(NUMPY_DATETIME_DTYPE)
+            return start + numpy.arange(count) * numpy.timedelta64(step, "s")
     cycle_count = -(-count // len(resolution_as_deltas))
     deltas = [start.tolist()] + (cycle_count * resolution_as_deltas)[: count - 1]
     np_deltas = numpy.array(deltas)
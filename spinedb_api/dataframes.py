@@ -103,18 +103,29 @@ and a special `SQLAlchemy <docs.sqlalchemy.org/en/14/>`_ query prepared::
                 .filter(query.c.alternative_name=="Base")
         ).subquery()
         df = fetch_as_dataframe(db_map, final_query, maps)
+
+Decoding the values can be spread over worker processes
+by passing an executor such as :class:`concurrent.futures.ProcessPoolExecutor` to :func:`fetch_as_dataframe`::
+
+    with ProcessPoolExecutor() as executor:
+        df = fetch_as_dataframe(db_map, final_query, maps, executor)
 """
 
 from __future__ import annotations
 import collections
-from typing import Any, Union
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+import functools
+import itertools
+from typing import Any, Optional, Union
+import numpy
 import pandas as pd
 import pyarrow
 from sqlalchemy.sql import Subquery
 from spinedb_api import DatabaseMapping, Map, SpineDBAPIError
 from spinedb_api.arrow_value import from_database
 from spinedb_api.db_mapping_base import PublicItem
-from spinedb_api.parameter_value import NON_ZERO_RANK_TYPES, RANK_1_TYPES, VALUE_TYPES, DateTime
+from spinedb_api.parameter_value import FLOAT_VALUE_TYPE, NON_ZERO_RANK_TYPES, RANK_1_TYPES, VALUE_TYPES, DateTime
 
 SpineScalarValue = Union[float, str, bool]
 SpineValue = Union[SpineScalarValue, None, pyarrow.RecordBatch]
@@ -126,6 +137,7 @@ IdToNameAndClassMap = dict[int, tuple[str, int]]
 
 
 _BASIC_COLUMNS = ["entity_class_name", "parameter_definition_name", "alternative_name"]
+_DECODE_CHUNK_SIZE = 10000
 
 
 def to_dataframe(item: PublicItem) -> pd.DataFrame:
@@ -146,7 +158,7 @@ def to_dataframe(item: PublicItem) -> pd.DataFrame:
         {
             "parameter_definition_name": pd.Series(item["parameter_definition_name"], dtype="category"),
             "alternative_name": pd.Series(item["alternative_name"], dtype="category"),
-            "value": [_record_batch_to_dataframe(value)],
+            "value": [value],
             "type": [item["type"]],
         }
     )
@@ -346,12 +358,12 @@ def _resolve_elements(
     entity_name_and_class_map: IdToNameAndClassMap,
     entity_element_map: IdToIdListMap,
 ) -> pd.DataFrame:
+    entity_names = _entity_name_table(entity_class_name_map, entity_name_and_class_map)
+    entity_elements = _entity_element_table(entity_element_map)
     groups = dataframe.groupby("entity_class_id", sort=False)
     resolved_groups = []
     for _, group in groups:
-        resolved_columns = _resolve_elements_for_single_class(
-            group["entity_id"], entity_class_name_map, entity_name_and_class_map, entity_element_map
-        )
+        resolved_columns = _resolve_elements_for_single_class(group["entity_id"], entity_names, entity_elements)
         group_frame = group.drop(columns=["entity_class_id", "entity_id"])
         column_names = _unique_series_names(resolved_columns)
         for name, column in zip(reversed(column_names), reversed(resolved_columns)):
@@ -360,26 +372,46 @@ def _resolve_elements(
     return pd.concat(resolved_groups)
 
 
+def _entity_name_table(
+    entity_class_name_map: IdToNameMap, entity_name_and_class_map: IdToNameAndClassMap
+) -> pd.DataFrame:
+    entity_names = pd.DataFrame.from_dict(entity_name_and_class_map, orient="index", columns=["name", "class_id"])
+    entity_names["class_name"] = entity_names["class_id"].map(entity_class_name_map)
+    return entity_names
+
+
+def _entity_element_table(entity_element_map: IdToIdListMap) -> pd.DataFrame:
+    element_ids = pd.Series(entity_element_map, dtype=object).explode()
+    return pd.DataFrame(
+        {
+            "entity_id": element_ids.index,
+            "position": element_ids.groupby(level=0).cumcount().to_numpy(),
+            "element_id": element_ids.to_numpy(),
+        }
+    ).infer_objects()
+
+
 def _resolve_elements_for_single_class(
-    entity_id_series: pd.Series,
-    entity_class_name_map: IdToNameMap,
-    entity_name_and_class_map: IdToNameAndClassMap,
-    entity_element_map: IdToIdListMap,
+    entity_id_series: pd.Series, entity_names: pd.DataFrame, entity_elements: pd.DataFrame
 ) -> list[pd.Series]:
-    element_series = {}
-    for entity_id in entity_id_series:
-        try:
-            elements = entity_element_map[entity_id]
-        except KeyError:
-            elements = [entity_id]
-        for position, element_id in enumerate(elements):
-            entity_name, class_id = entity_name_and_class_map[element_id]
-            class_name = entity_class_name_map[class_id]
-            series = element_series.setdefault((class_name, position), [])
-            series.append(entity_name)
-    return [
-        pd.Series(entities, name=class_name, dtype="string") for (class_name, _), entities in element_series.items()
-    ]
+    codes, entity_ids = pd.factorize(entity_id_series)
+    class_elements = entity_elements[entity_elements["entity_id"].isin(entity_ids)]
+    if class_elements.empty:
+        element_ids = pd.DataFrame({0: entity_ids})
+    else:
+        element_ids = class_elements.pivot(index="entity_id", columns="position", values="element_id").loc[entity_ids]
+    resolved = []
+    for position in element_ids.columns:
+        elements = entity_names.loc[element_ids[position].to_numpy()]
+        resolved.append(
+            pd.Series(
+                elements["name"].to_numpy()[codes],
+                index=entity_id_series.index,
+                name=elements["class_name"].iat[0],
+                dtype="string",
+            )
+        )
+    return resolved
 
 
 def _unique_series_names(series_list: list[pd.Series]) -> list[str]:
@@ -398,17 +430,78 @@ def _unique_series_names(series_list: list[pd.Series]) -> list[str]:
     return names
 
 
-def _convert_values_from_database(dataframe_row: pd.Series, list_value_map: IdToListValueMap) -> pd.Series:
-    if dataframe_row.iloc[-1] is not None:
-        value, value_type = list_value_map[dataframe_row[-1]]
-    else:
-        value = dataframe_row.iloc[-3]
-        value_type = dataframe_row.iloc[-2]
-    value = _record_batch_to_dataframe(from_database(value, value_type))
-    return pd.Series({"value": value, "type": value_type})
+def _resolve_list_values(dataframe: pd.DataFrame, list_value_map: IdToListValueMap) -> pd.DataFrame:
+    is_list_value = dataframe["list_value_id"].notna()
+    if is_list_value.any():
+        list_values = pd.DataFrame.from_dict(list_value_map, orient="index", columns=["value", "type"])
+        list_value_ids = dataframe.loc[is_list_value, "list_value_id"].astype("int64")
+        dataframe = dataframe.copy()
+        dataframe.loc[is_list_value, "value"] = list_values["value"].loc[list_value_ids].to_numpy()
+        dataframe.loc[is_list_value, "type"] = list_values["type"].loc[list_value_ids].to_numpy()
+    return dataframe.drop(columns=["list_value_id"])
+
+
+def _decode_values(db_values: pd.Series, value_type: str, executor: Optional[Executor]) -> Union[list, numpy.ndarray]:
+    db_values = db_values.tolist()
+    if value_type == FLOAT_VALUE_TYPE:
+        floats = _decode_floats(db_values)
+        if floats is not None:
+            return floats
+    if executor is None or len(db_values) <= _DECODE_CHUNK_SIZE:
+        return _decode_chunk(db_values, value_type)
+    chunks = (db_values[i : i + _DECODE_CHUNK_SIZE] for i in range(0, len(db_values), _DECODE_CHUNK_SIZE))
+    return list(itertools.chain.from_iterable(executor.map(_decode_chunk, chunks, itertools.repeat(value_type))))
+
+
+def _decode_chunk(db_values: list[bytes], value_type: str) -> list[SpineValue]:
+    return [from_database(db_value, value_type) for db_value in db_values]
+
+
+def _decode_floats(db_values: list[bytes]) -> Optional[numpy.ndarray]:
+    try:
+        return numpy.array(db_values, dtype=numpy.bytes_).astype(numpy.float64)
+    except (TypeError, ValueError):
+        return None
+
+
+def _stack_record_batches(
+    record_batches: list[pyarrow.RecordBatch], attributes: dict
+) -> tuple[pd.DataFrame, list[int]]:
+    positions_by_schema = {}
+    for position, record_batch in enumerate(record_batches):
+        positions_by_schema.setdefault(record_batch.schema, []).append(position)
+    row_counts = [record_batch.num_rows for record_batch in record_batches]
+    frames = []
+    for schema, positions in positions_by_schema.items():
+        table = pyarrow.Table.from_batches([record_batches[position] for position in positions], schema=schema)
+        frame = _record_batch_to_dataframe(table)
+        attributes.update(frame.attrs)
+        frames.append(frame)
+    if len(frames) == 1:
+        return frames[0], row_counts
+    stacked = pd.concat(frames, ignore_index=True)
+    value_positions = numpy.concatenate(
+        [
+            numpy.repeat(positions, [row_counts[position] for position in positions])
+            for positions in positions_by_schema.values()
+        ]
+    )
+    stacked = stacked.take(numpy.argsort(value_positions, kind="stable")).reset_index(drop=True)
+    return stacked, row_counts
+
+
+def _expand_rows(rows: pd.DataFrame, row_counts: list[int], values: pd.DataFrame) -> pd.DataFrame:
+    repeated_rows = rows.take(numpy.repeat(numpy.arange(rows.shape[0]), row_counts))
+    return pd.concat((repeated_rows.reset_index(drop=True), values.reset_index(drop=True)), axis="columns")
 
 
-def _expand_values(dataframe: pd.DataFrame) -> pd.DataFrame:
+def _decoded_values(values: pd.Series, value_type: str) -> list[SpineValue]:
+    return values.tolist()
+
+
+def _expand_values(
+    dataframe: pd.DataFrame, decode_values: Callable[[pd.Series, str], Sequence[SpineValue]] = _decoded_values
+) -> pd.DataFrame:
     grouped = dataframe.groupby("type", sort=False)
     expanded = []
     attributes = {}
@@ -418,20 +511,22 @@ def _expand_values(dataframe: pd.DataFrame) -> pd.DataFrame:
         except KeyError:
             continue
         block_of_single_type = dataframe.iloc[group, :]
-        for i in range(block_of_single_type.shape[0]):
-            row = block_of_single_type.iloc[i : i + 1, :]
-            value = row.iat[0, -2]
-            row = row.drop(columns=["value", "type"])
-            left = pd.concat(value.shape[0] * [row], ignore_index=True)
-            expanded.append(pd.concat((left, value), axis="columns"))
-            attributes.update(value.attrs)
+        record_batches = decode_values(block_of_single_type["value"], expandable_type)
+        values, row_counts = _stack_record_batches(record_batches, attributes)
+        expanded.append(_expand_rows(block_of_single_type.drop(columns=["value", "type"]), row_counts, values))
     for non_expandable_type in VALUE_TYPES - NON_ZERO_RANK_TYPES:
         try:
             group = grouped.indices[non_expandable_type]
         except KeyError:
             continue
-        non_expanded = dataframe.iloc[group]
-        expanded.append(non_expanded.drop(columns=["type"]))
+        non_expanded = dataframe.iloc[group].drop(columns=["type"])
+        values = decode_values(non_expanded["value"], non_expandable_type)
+        non_expanded["value"] = pd.Series(values, index=non_expanded.index)
+        expanded.append(non_expanded)
+    return _join_expanded(expanded, attributes)
+
+
+def _join_expanded(expanded: list[pd.DataFrame], attributes: dict) -> pd.DataFrame:
     expanded = pd.concat(expanded, ignore_index=True)
     expanded.attrs = attributes
     if expanded.columns.get_loc("value") == expanded.shape[1] - 1:
@@ -440,8 +535,8 @@ def _expand_values(dataframe: pd.DataFrame) -> pd.DataFrame:
     return pd.concat((expanded, y_column), axis="columns")
 
 
-def _record_batch_to_dataframe(x: SpineValue) -> Union[SpineScalarValue, None, pd.DataFrame]:
-    if isinstance(x, pyarrow.RecordBatch):
+def _record_batch_to_dataframe(x: Union[SpineValue, pyarrow.Table]) -> Union[SpineScalarValue, None, pd.DataFrame]:
+    if isinstance(x, (pyarrow.RecordBatch, pyarrow.Table)):
         dataframe = x.to_pandas()
         attributes = {}
         for column in x.schema.names:
@@ -454,23 +549,34 @@ def _record_batch_to_dataframe(x: SpineValue) -> Union[SpineScalarValue, None, p
     return x
 
 
-def fetch_as_dataframe(db_map: DatabaseMapping, value_sq: Subquery, fetched_maps: FetchedMaps) -> pd.DataFrame:
-    """Fetches parameter values from database returning them as dataframe."""
+def fetch_as_dataframe(
+    db_map: DatabaseMapping, value_sq: Subquery, fetched_maps: FetchedMaps, executor: Optional[Executor] = None
+) -> pd.DataFrame:
+    """Fetches parameter values from database returning them as dataframe.
+
+    Values are decoded type by type and indexed values are expanded into rows all at once.
+
+    Args:
+        db_map: database mapping
+        value_sq: parameter value subquery, see :func:`parameter_value_sq`
+        fetched_maps: entity, entity class and list value maps
+        executor: if given, large blocks of values are decoded in chunks using the executor,
+            e.g. :class:`concurrent.futures.ProcessPoolExecutor`
+
+    Returns:
+        parameter values
+    """
     dataframe = pd.DataFrame(db_map.query(value_sq))
     if dataframe.empty:
         return dataframe
     dataframe["entity_class_name"] = dataframe["entity_class_name"].astype("category")
     dataframe["parameter_definition_name"] = dataframe["parameter_definition_name"].astype("category")
     dataframe["alternative_name"] = dataframe["alternative_name"].astype("category")
-    value_series = dataframe.apply(
-        _convert_values_from_database, axis="columns", result_type="expand", args=(fetched_maps.list_value_map,)
-    )
-    dataframe = dataframe.drop(columns=["value", "type", "list_value_id"])
-    dataframe = pd.concat((dataframe, value_series), axis="columns")
+    dataframe = _resolve_list_values(dataframe, fetched_maps.list_value_map)
     dataframe = _resolve_elements(
         dataframe,
         fetched_maps.entity_class_name_map,
         fetched_maps.entity_name_and_class_map,
         fetched_maps.entity_element_map,
     )
-    return _expand_values(dataframe)
+    return _expand_values(dataframe, functools.partial(_decode_values, executor=executor))
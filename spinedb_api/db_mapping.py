@@ -23,6 +23,7 @@ from functools import partialmethod
 from itertools import chain
 import logging
 import os
+import time
 from types import MethodType
 from typing import Any, ClassVar, Optional, Type
 from alembic.config import Config
@@ -38,7 +39,7 @@ from sqlalchemy.orm import Query, Session
 from sqlalchemy.pool import NullPool, StaticPool
 from .compatibility import CompatibilityTransformations, compatibility_transformations
 from .db_mapping_base import DatabaseMappingBase, MappedItemBase, MappedTable, PublicItem
-from .db_mapping_commit_mixin import DatabaseMappingCommitMixin
+from .db_mapping_commit_mixin import DatabaseMappingCommitMixin, IdAllocator
 from .db_mapping_query_mixin import DatabaseMappingQueryMixin
 from .exception import NothingToCommit, NothingToRollback, SpineDBAPIError, SpineDBVersionError, SpineIntegrityError
 from .filters.tools import (
@@ -60,6 +61,7 @@ from .helpers import (
 )
 from .mapped_item_status import Status
 from .mapped_items import ITEM_CLASS_BY_TYPE
+from .scenario_resolver import ScenarioResolver
 from .spine_db_client import get_db_url_from_server
 from .temp_id import TempId, resolve
 
@@ -157,6 +159,9 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
         memory=False,
         commit_lock=None,
         sqlite_timeout=1800,
+        id_allocator=None,
+        commit_check_interval=0.0,
+        read_only=False,
     ):
         """
         Args:
@@ -171,6 +176,15 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
             commit_lock (threading.Lock, optional): If given, committing to the DB is done with the lock.
             memory (bool, optional): Whether to use a SQLite memory DB as replacement for the original one.
             sqlite_timeout (int, optional): The number of seconds to wait before raising SQLite connection errors.
+            id_allocator (:class:`~spinedb_api.db_mapping_commit_mixin.IdAllocator`, optional): Allocates ids
+                for new rows on commit. Defaults to allocating ids after the largest existing id;
+                use :class:`~spinedb_api.db_mapping_commit_mixin.GapFillingIdAllocator` to reuse freed ids.
+            commit_check_interval (float, optional): Time in seconds during which the result of checking the DB
+                for new commits is reused instead of querying again.
+                Commits by other clients may go unnoticed for this long.
+                Defaults to 0, i.e. the DB is checked every time.
+            read_only (bool, optional): If True, the mapping rejects modifications
+                and fetches items in bulk without checking them against the mapping or the DB's integrity.
         """
         super().__init__()
         # FIXME: We should also check the server memory property and use it here
@@ -190,6 +204,11 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
             raise SpineDBAPIError("Could not parse the given URL. Please check that it is valid.") from error
         self.username = username if username else "anon"
         self._commit_lock = commit_lock
+        if id_allocator is not None:
+            self._id_allocator: IdAllocator = id_allocator
+        self._commit_check_interval = commit_check_interval
+        self._last_commit_check: tuple[float, int] | None = None
+        self._read_only = read_only
         self._memory = memory
         self._memory_dirty = False
         self._original_engine = self.create_engine(
@@ -207,12 +226,18 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
         self._tablenames = [t.name for t in self._metadata.sorted_tables]
         self._session = None
         self._context_open_count = 0
+        self._scenario_resolver = ScenarioResolver(self)
         self.filter_configs = []
         filter_configs = filter_configs if apply_filters else None
         if filter_configs is not None:
             stack = load_filters(filter_configs)
             apply_filter_stack(self, stack)
 
+    @property
+    def scenario_resolver(self) -> ScenarioResolver:
+        """Resolver for the alternatives, entity activity and parameter values in effect in scenarios."""
+        return self._scenario_resolver
+
     def __enter__(self):
         if self._closed:
             return None
@@ -251,8 +276,31 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
         return ITEM_CLASS_BY_TYPE[item_type]
 
     def _query_commit_count(self) -> int:
+        """Returns the id of the latest commit in the DB.
+
+        Commit ids grow monotonically, so this works as a commit counter
+        that is much cheaper to query than the actual number of commits.
+        """
+        if self._last_commit_check is not None and self._commit_check_interval > 0.0:
+            checked_at, commit_count = self._last_commit_check
+            if time.monotonic() - checked_at < self._commit_check_interval:
+                return commit_count
         with self:
-            return self.query(self.commit_sq).count()
+            commit = self._metadata.tables["commit"]
+            latest_commit_id = (
+                self.query(commit.c.id).filter(commit.c.comment != "").order_by(commit.c.id.desc()).limit(1).scalar()
+            )
+        commit_count = latest_commit_id if latest_commit_id is not None else 0
+        self._last_commit_check = (time.monotonic(), commit_count)
+        return commit_count
+
+    def _query_ids(self, item_type: ItemType) -> set[int]:
+        sq = self._make_sq(item_type)
+        return {id_ for id_, in self._session.query(sq.c.id)}
+
+    def _commits_in_id_order(self) -> bool:
+        # Concurrent transactions on server backends may commit out of id order.
+        return self.sa_url.drivername.startswith("sqlite")
 
     def make_item(self, item_type: ItemType, **item) -> MappedItemBase:
         return ITEM_CLASS_BY_TYPE[item_type](self, **item)
@@ -577,7 +625,10 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
         mapped_table.check_fields(kwargs, valid_types=(type(None),))
         if not fetched:
             self._do_fetch_more(mapped_table, offset=0, limit=None, real_commit_count=None, **kwargs)
-        return [i.public_item for i in mapped_table.values() if i.is_valid() and _fields_equal(i, kwargs)]
+        kwargs = mapped_table.resolve_db_ids(kwargs)
+        return [
+            i.public_item for i in mapped_table.candidate_items(kwargs) if i.is_valid() and _fields_equal(i, kwargs)
+        ]
 
     def find_by_type(self, item_type: ItemType, **kwargs) -> list[PublicItem]:
         return self.find(self._mapped_tables[item_type], **kwargs)
@@ -729,8 +780,11 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
         mapped_table.check_fields(kwargs, valid_types=(type(None),))
         if fetch:
             self._do_fetch_more(mapped_table, offset=0, limit=None, real_commit_count=None, **kwargs)
-        get_items = mapped_table.valid_values if skip_removed else mapped_table.values
-        return [x.public_item for x in get_items() if all(x.get(k) == v for k, v in kwargs.items())]
+        return [
+            x.public_item
+            for x in mapped_table.candidate_items(kwargs)
+            if (not skip_removed or x.is_valid()) and all(x.get(k) == v for k, v in kwargs.items())
+        ]
 
     def item_active_in_scenario(self, item: PublicItem, scenario_id: TempId) -> bool | None:
         """Checks if an item is active in a given scenario.
@@ -747,20 +801,7 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
         Returns:
             True if the item is active, False if not, None if no entity alternatives are specified.
         """
-        scenario_table = self._mapped_tables["scenario"]
-        scenario = scenario_table.find_item_by_id(scenario_id)
-        entity_alternative_table = self._mapped_tables["entity_alternative"]
-        entity_alternatives = self.find(entity_alternative_table, entity_id=item["id"])
-        alts_ordered_by_rank = scenario["alternative_id_list"]
-        alt_id_to_active = {}
-        for ent_alt in entity_alternatives:
-            alt_id_to_active[ent_alt["alternative_id"]] = ent_alt["active"]
-        result = None
-        for id_ in reversed(alts_ordered_by_rank):
-            if id_ in alt_id_to_active:
-                result = alt_id_to_active[id_]
-                break
-        return result
+        return self._scenario_resolver.entity_alternative_activity(scenario_id, item["id"])
 
     @staticmethod
     def _modify_items(
@@ -1080,11 +1121,16 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
         Args:
             *item_types: One or more of <spine_item_types>. If none given, then the entire DB is fetched.
         """
-        item_types = set(self.item_types()) if not item_types else set(item_types) & set(self.item_types())
+        if item_types:
+            item_types = {self.real_item_type(item_type) for item_type in item_types}
+        else:
+            item_types = set(self.item_types())
         commit_count = self._query_commit_count()
         items = []
-        for item_type in item_types:
-            item_type = self.real_item_type(item_type)
+        # Fetch referenced tables first so they are not fetched silently as references of other tables.
+        for item_type in self._sorted_item_types:
+            if item_type not in item_types:
+                continue
             mapped_table = self.mapped_table(item_type)
             items += [item.public_item for item in self.do_fetch_all(mapped_table, commit_count)]
         return items
@@ -1141,6 +1187,7 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
         Returns:
             compatibility transformations
         """
+        self.check_writable()
         if not comment:
             raise SpineDBAPIError("Commit message cannot be empty.")
         if self._commit_lock is not None:
@@ -1181,6 +1228,7 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
                 self._session.connection(), apply=apply_compatibility_transforms
             )
             self._session.commit()
+            self._last_commit_check = None
             self._commit_count = self._query_commit_count()
         return transformation_info
 
@@ -1203,6 +1251,7 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
                     item.commit(commit_id)
                 for item in removed_items:
                     item.commit(commit_id)
+                self._last_commit_check = None
             else:
                 transformation_info = ([], [])
         return transformation_info
@@ -1256,6 +1305,10 @@ class DatabaseMapping(DatabaseMappingQueryMixin, DatabaseMappingCommitMixin, Dat
                 to_add.append(item)
         return to_add, to_update, to_remove
 
+    def refresh_session(self) -> None:
+        self._last_commit_check = None
+        super().refresh_session()
+
     def rollback_session(self) -> None:
         """Discards all the changes from the in-memory mapping."""
         if not self._rollback():
@@ -14,6 +14,8 @@ from collections.abc import Callable, Iterable, Iterator
 from contextlib import suppress
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from operator import attrgetter
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar, Optional, Type, TypedDict, Union
 from sqlalchemy import Subquery
 from sqlalchemy.orm import Query
@@ -25,6 +27,9 @@ from .temp_id import TempId, resolve
 if TYPE_CHECKING:
     from .db_mapping import DatabaseMapping
 
+_NO_ITEMS: MappingProxyType = MappingProxyType({})
+"""Shared read-only placeholder for item containers that have not been needed yet."""
+
 
 @dataclass(frozen=True)
 class DirtyItems:
@@ -49,6 +54,7 @@ class DatabaseMappingBase:
         self._mapped_tables = {item_type: MappedTable(self, item_type) for item_type in self.all_item_types()}
         self._fetched: dict[ItemType, int] = {}
         self._commit_count: int | None = None
+        self._read_only = False
         item_types = self.item_types()
         self._sorted_item_types: list[ItemType] = []
         while item_types:
@@ -66,6 +72,16 @@ class DatabaseMappingBase:
         """Closes this DB mapping."""
         self._closed = True
 
+    @property
+    def read_only(self) -> bool:
+        """True if the mapping rejects modifications."""
+        return self._read_only
+
+    def check_writable(self) -> None:
+        """Raises SpineDBAPIError if the mapping is read-only."""
+        if self._read_only:
+            raise SpineDBAPIError("database mapping is read-only")
+
     @staticmethod
     def item_types() -> list[ItemType]:
         """Returns a list of public item types from the DB mapping schema (equivalent to the table names)."""
@@ -99,13 +115,21 @@ class DatabaseMappingBase:
         raise NotImplementedError()
 
     def _query_commit_count(self):
-        """Returns the number of rows in the commit table in the DB.
+        """Returns a number that grows every time a commit is made to the DB.
 
         Returns:
             int
         """
         raise NotImplementedError()
 
+    def _query_ids(self, item_type: ItemType) -> set[int]:
+        """Returns the ids of all items of given type in the DB."""
+        raise NotImplementedError()
+
+    def _commits_in_id_order(self) -> bool:
+        """Checks if transactions become visible in the order of their commit ids."""
+        raise NotImplementedError()
+
     def make_item(self, item_type: ItemType, **item) -> MappedItemBase:
         raise NotImplementedError
 
@@ -198,6 +222,8 @@ class DatabaseMappingBase:
             mapped_table.remove_unique(item)
         for mapped_table, item in to_remove:
             del mapped_table[dict.__getitem__(item, "id")]
+        for mapped_table in self._mapped_tables.values():
+            mapped_table.clear_secondary_indexes()
         self._commit_count = None
         self._fetched.clear()
 
@@ -249,11 +275,12 @@ class DatabaseMappingBase:
             self._commit_count = self._query_commit_count()
         return self._commit_count
 
-    def _do_make_query(self, item_type: ItemType, **kwargs) -> Query:
+    def _do_make_query(self, item_type: ItemType, newer_than_commit: Optional[int] = None, **kwargs) -> Query:
         """Returns a :class:`~spinedb_api.query.Query` object to fetch items of given type.
 
         Args:
             item_type: item type
+            newer_than_commit: if given, fetch only items committed after this commit id
             **kwargs: query filters
 
         Returns:
@@ -261,6 +288,8 @@ class DatabaseMappingBase:
         """
         sq = self._make_sq(item_type)
         qry = self._make_query(sq)
+        if newer_than_commit is not None:
+            qry = qry.filter(sq.c.commit_id > newer_than_commit)
         for key, value in kwargs.items():
             if isinstance(value, tuple):
                 continue
@@ -277,14 +306,16 @@ class DatabaseMappingBase:
                     pass
         return qry
 
-    def _get_next_chunk(self, item_type: ItemType, offset: int, limit: int, **kwargs) -> list[dict]:
+    def _get_next_chunk(
+        self, item_type: ItemType, offset: int, limit: int, newer_than_commit: Optional[int] = None, **kwargs
+    ) -> list[dict]:
         """Gets chunk of items from the DB.
 
         Returns:
             list of dictionary items.
         """
         with self:
-            qry = self._do_make_query(item_type, **kwargs)
+            qry = self._do_make_query(item_type, newer_than_commit, **kwargs)
             if not qry:
                 return []
             if not limit:
@@ -292,30 +323,50 @@ class DatabaseMappingBase:
             return [x._asdict() for x in qry.limit(limit).offset(offset)]
 
     def _do_fetch_more(
-        self, mapped_table: MappedTable, offset: int, limit: Optional[int], real_commit_count: Optional[int], **kwargs
+        self,
+        mapped_table: MappedTable,
+        offset: int,
+        limit: Optional[int],
+        real_commit_count: Optional[int],
+        newer_than_commit: Optional[int] = None,
+        **kwargs,
     ) -> list[MappedItemBase]:
-        """Fetches items from the DB and adds them to the mapping."""
+        """Fetches items from the DB and adds them to the mapping.
+
+        If ``newer_than_commit`` is given, only items committed after that commit are fetched
+        and the fields of unmodified items in the mapping are updated from the DB.
+        """
         item_type = mapped_table.item_type
         ref_types = self.item_factory(item_type).ref_types()
         if real_commit_count is None:
             real_commit_count = self._query_commit_count()
         if kwargs and item_type in ref_types:
             return self.do_fetch_all(self._mapped_tables[item_type], commit_count=real_commit_count)
-        chunk = self._get_next_chunk(mapped_table.item_type, offset, limit, **kwargs)
+        chunk = self._get_next_chunk(mapped_table.item_type, offset, limit, newer_than_commit, **kwargs)
         if not chunk:
             return []
         for ref_type in ref_types:
             if ref_type != mapped_table.item_type and self._fetched.get(ref_type, -1) != real_commit_count:
                 # We need to fetch the most recent references because their ids might have changed in the DB
                 self.do_fetch_all(self._mapped_tables[ref_type], commit_count=real_commit_count)
+        if self._read_only:
+            return self._add_fetched_items_without_checks(
+                mapped_table, chunk, update_existing=newer_than_commit is not None
+            )
         items = []
         new_items = []
         is_db_dirty = self._get_commit_count() != real_commit_count
+        orphans = []
         # Add items first
         for x in chunk:
+            orphaned_referrers = (
+                self._drop_item_with_reused_id(mapped_table, x) if newer_than_commit is not None else None
+            )
             item, fresh = mapped_table.handle_fetched_item(x, not is_db_dirty)
             if item is None:
                 continue
+            if orphaned_referrers is not None:
+                orphans.append((item, orphaned_referrers))
             if fresh:
                 mapped_table.do_add_item(item)
                 if mapped_table.purged:
@@ -324,6 +375,8 @@ class DatabaseMappingBase:
                 new_items.append(item)
             else:
                 item.handle_refetch()
+                if newer_than_commit is not None and item.is_committed():
+                    mapped_table.update_committed_item(item, x)
                 items.append(item)
         # Once all items are added, add the unique key values
         # Otherwise items that refer to other items that come later in the query will be seen as corrupted
@@ -333,6 +386,32 @@ class DatabaseMappingBase:
                 continue
             mapped_table.add_unique(item)
             items.append(item)
+        for item, (old_id, referrers) in orphans:
+            if dict.get(mapped_table, dict.__getitem__(item, "id")) is item:
+                mapped_table.reattach_referrers(old_id, item, referrers)
+        return items
+
+    def _add_fetched_items_without_checks(
+        self, mapped_table: MappedTable, chunk: list[dict], update_existing: bool
+    ) -> list[MappedItemBase]:
+        """Adds fetched items to a read-only mapping trusting the integrity of the DB.
+
+        Items are not compared to existing ones by unique keys nor polished beyond setting defaults,
+        they do not register as referrers, and their unique keys are indexed on first lookup.
+        """
+        items = []
+        for x in chunk:
+            if update_existing:
+                self._drop_item_with_reused_id(mapped_table, x)
+            item = mapped_table.get(x["id"])
+            if item is not None and update_existing:
+                mapped_table.update_committed_item(item, x)
+            elif item is None:
+                item = self.make_item(mapped_table.item_type, **x)
+                MappedItemBase.polish(item)
+                mapped_table.do_add_item(item)
+                mapped_table.add_unique_later(item)
+            items.append(item)
         return items
 
     def do_fetch_all(self, mapped_table: MappedTable, commit_count: Optional[int] = None) -> list[MappedItemBase]:
@@ -342,11 +421,67 @@ class DatabaseMappingBase:
         """
         if commit_count is None:
             commit_count = self._get_commit_count()
-        if self._fetched.get(mapped_table.item_type, -1) < commit_count:
+        fetched_commit_count = self._fetched.get(mapped_table.item_type)
+        if fetched_commit_count is None or fetched_commit_count < commit_count:
             self._fetched[mapped_table.item_type] = commit_count
+            if (
+                fetched_commit_count is not None
+                and self._commits_in_id_order()
+                and self._has_commit_ids(mapped_table.item_type)
+            ):
+                return self._do_fetch_changes(mapped_table, fetched_commit_count, commit_count)
             return self._do_fetch_more(mapped_table, offset=0, limit=None, real_commit_count=commit_count)
         return []
 
+    def _has_commit_ids(self, item_type: ItemType) -> bool:
+        """Checks if items of given type record the commit that last changed them."""
+        return "commit_id" in self._make_sq(item_type).c
+
+    def _do_fetch_changes(
+        self, mapped_table: MappedTable, fetched_commit_count: int, commit_count: int
+    ) -> list[MappedItemBase]:
+        """Brings a fetched table up to date with the DB.
+
+        Fetches only the items committed after the previous fetch
+        and drops unmodified items that have been removed from the DB.
+        """
+        items = self._do_fetch_more(
+            mapped_table, offset=0, limit=None, real_commit_count=commit_count, newer_than_commit=fetched_commit_count
+        )
+        if mapped_table.item_type not in self._fetched:
+            # Referrers of a dropped item were dropped from this very table.
+            self._fetched[mapped_table.item_type] = commit_count
+            items += self._do_fetch_more(mapped_table, offset=0, limit=None, real_commit_count=commit_count)
+        with self:
+            db_ids = self._query_ids(mapped_table.item_type)
+        for item in list(mapped_table.values()):
+            if not item.is_committed() or item.removed:
+                continue
+            db_id = dict.__getitem__(item, "id").db_id
+            if db_id is not None and db_id not in db_ids:
+                mapped_table.drop_item(item)
+        return items
+
+    def _drop_item_with_reused_id(
+        self, mapped_table: MappedTable, db_item: dict
+    ) -> Optional[tuple[TempId, list[MappedItemBase]]]:
+        """Drops an unmodified item if the DB has given its id to an item with different unique keys.
+
+        Such a row is either a new item reusing the id of a removed one or a renamed item;
+        since the two are indistinguishable, the tables of dropped referrers get fetched again in full.
+        Referrers with uncommitted changes are kept so they can be reattached to the fetched item.
+
+        Returns:
+            id of the dropped item and its kept referrers, or None if nothing was dropped
+        """
+        item = mapped_table.get(db_item["id"])
+        if item is None or not item.is_committed() or mapped_table._same_item(item, db_item):
+            return None
+        kept_referrers = []
+        for item_type in mapped_table.drop_item(item, kept_referrers):
+            self._fetched.pop(item_type, None)
+        return dict.__getitem__(item, "id"), kept_referrers
+
     def item(self, mapped_table: MappedTable, **kwargs) -> PublicItem:
         raise NotImplementedError()
 
@@ -362,9 +497,12 @@ class MappedTable(dict):
         self._db_map = db_map
         self.item_type = item_type
         self._ids_by_unique_key_value: dict[tuple[str, ...], dict[tuple[str, ...], list[TempId]]] = {}
+        self._secondary_indexes: dict[str, dict[Any, dict[TempId, None]]] = {}
+        self._ids_waiting_for_unique_keys: list[TempId] = []
         self._temp_id_lookup: dict[int, TempId] = {}
-        self.wildcard_item = MappedItemBase(self._db_map, id=Asterisk)
-        self.wildcard_item.item_type = self.item_type
+        self.wildcard_item = _WildcardItem(self._db_map, self.item_type)
+        # Incremented whenever items are added to, updated in or removed from the table.
+        self.change_count = 0
 
     @property
     def purged(self) -> bool:
@@ -378,10 +516,38 @@ class MappedTable(dict):
         id_ = self._temp_id_lookup.get(id_, id_)
         return super().get(id_, default)
 
+    def temp_id(self, id_: TempId | int) -> TempId | int:
+        """Returns the TempId that has been resolved to given db id or ``id_`` itself if there is none."""
+        return self._temp_id_lookup.get(id_, id_)
+
+    def resolve_db_ids(self, fields: dict) -> dict:
+        """Replaces db ids in the id and reference fields of given fields by the TempIds resolved to them.
+
+        Args:
+            fields: fields and values
+
+        Returns:
+            fields with normalized ids
+        """
+        references = self._db_map.item_factory(self.item_type)._references
+        resolved = {}
+        for field, value in fields.items():
+            if field == "id":
+                value = self.temp_id(value)
+            elif (ref_type := references.get(field)) is not None:
+                ref_table = self._db_map.mapped_table(ref_type)
+                if isinstance(value, (list, tuple)):
+                    value = tuple(ref_table.temp_id(x) if isinstance(x, int) else x for x in value)
+                elif isinstance(value, int):
+                    value = ref_table.temp_id(value)
+            resolved[field] = value
+        return resolved
+
     def _unique_key_value_to_item(
         self, key: tuple[str, ...], value: Any, fetch: bool = True
     ) -> Optional[MappedItemBase]:
         value = tuple(tuple(x) if isinstance(x, list) else x for x in value)
+        self._add_waiting_unique_keys()
         try:
             ids = self._ids_by_unique_key_value[key][value]
         except KeyError:
@@ -397,6 +563,98 @@ class MappedTable(dict):
     def valid_values(self) -> Iterator[MappedItemBase]:
         return (x for x in self.values() if x.is_valid())
 
+    def candidate_items(self, fields: dict) -> Iterable[MappedItemBase]:
+        """Returns items that may match given fields.
+
+        Reference fields, single field unique keys and external fields that lead to those
+        are looked up from secondary indexes; other fields are ignored.
+        Callers must still check the returned items against all fields.
+
+        Args:
+            fields: fields and values to match
+
+        Returns:
+            candidate items in mapping order
+        """
+        candidate_ids = None
+        for field, value in fields.items():
+            ids = self._ids_matching(field, value)
+            if ids is None:
+                continue
+            candidate_ids = ids if candidate_ids is None else candidate_ids & ids
+            if not candidate_ids:
+                return []
+        if candidate_ids is None:
+            return self.values()
+        # TempIds are handed out in decreasing order, so this sorts the items in insertion order.
+        candidates = (dict.get(self, id_) for id_ in sorted(candidate_ids, key=attrgetter("private_id"), reverse=True))
+        return [item for item in candidates if item is not None]
+
+    def _ids_matching(self, field: str, value: Any) -> Optional[set[TempId]]:
+        """Returns ids of items that may have given value in given field
+        or None if the field cannot be looked up from an index."""
+        if isinstance(value, (list, tuple)):
+            return None
+        factory = self._db_map.item_factory(self.item_type)
+        if field in factory._references or (field,) in factory.unique_keys:
+            return self._indexed_ids(field, (value,))
+        source_and_target_key = factory._external_fields.get(field)
+        if source_and_target_key is None or source_and_target_key[0] not in factory._references:
+            return None
+        source_key, target_key = source_and_target_key
+        ref_ids = self._db_map.mapped_table(factory._references[source_key])._ids_matching(target_key, value)
+        if ref_ids is None:
+            return None
+        return self._indexed_ids(source_key, ref_ids)
+
+    def _indexed_ids(self, field: str, values: Iterable[Any]) -> set[TempId]:
+        index = self._secondary_index(field)
+        ids = set()
+        for value in values:
+            key = self._index_key(field, value)
+            ids.update(index.get(key, ()))
+            if isinstance(key, TempId) and key.db_id is not None:
+                # Items that were indexed before their reference got fetched are keyed by db id.
+                ids.update(index.get(key.db_id, ()))
+        return ids
+
+    def _secondary_index(self, field: str) -> dict[Any, dict[TempId, None]]:
+        """Returns secondary index for given field building it if necessary."""
+        index = self._secondary_indexes.get(field)
+        if index is None:
+            index = self._secondary_indexes[field] = {}
+            for id_, item in self.items():
+                index.setdefault(self._index_key(field, dict.get(item, field)), {})[id_] = None
+        return index
+
+    def _index_key(self, field: str, value: Any) -> Any:
+        """Converts db ids to TempIds so that items referring to the same item share index key."""
+        if isinstance(value, int):
+            ref_type = self._db_map.item_factory(self.item_type)._references.get(field)
+            if ref_type is None:
+                return value
+            return self._db_map.mapped_table(ref_type)._temp_id_lookup.get(value, value)
+        return value
+
+    def _add_to_secondary_indexes(self, item: MappedItemBase) -> None:
+        id_ = dict.__getitem__(item, "id")
+        for field, index in self._secondary_indexes.items():
+            index.setdefault(self._index_key(field, dict.get(item, field)), {})[id_] = None
+
+    def _remove_from_secondary_indexes(self, item: MappedItemBase) -> None:
+        id_ = dict.__getitem__(item, "id")
+        for field, index in self._secondary_indexes.items():
+            value = dict.get(item, field)
+            for key in {value, self._index_key(field, value)}:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.pop(id_, None)
+
+    def clear_secondary_indexes(self) -> None:
+        """Drops secondary indexes; they are rebuilt when needed."""
+        self._secondary_indexes.clear()
+        self.change_count += 1
+
     def find_item(self, item: dict, fetch: bool = True) -> MappedItemBase:
         """Returns a MappedItemBase that matches the given dictionary-item.
 
@@ -446,6 +704,7 @@ class MappedTable(dict):
             raise error
 
     def make_candidate_item(self, item: dict) -> Optional[MappedItemBase]:
+        self._db_map.check_writable()
         candidate_item = self._db_map.make_item(self.item_type, **item)
         self._check_required_keys(candidate_item)
         self._prepare_item(candidate_item, None, item)
@@ -453,6 +712,7 @@ class MappedTable(dict):
         return candidate_item
 
     def check_merged_item(self, merged_item: dict, current_item: MappedItemBase, original_update: dict) -> dict:
+        self._db_map.check_writable()
         candidate_item = self._db_map.make_item(self.item_type, **merged_item)
         self._prepare_item(candidate_item, current_item, original_update)
         checked_item = candidate_item._asdict()
@@ -489,6 +749,7 @@ class MappedTable(dict):
                 raise SpineDBAPIError(f"there's already a {self.item_type} with {dict(zip(key, value))}")
 
     def item_to_remove(self, id_: TempId | int | AsteriskType) -> MappedItemBase:
+        self._db_map.check_writable()
         if id_ is Asterisk:
             return self.wildcard_item
         return self.find_item_by_id(id_)
@@ -498,7 +759,22 @@ class MappedTable(dict):
         for key, value in item.unique_values_for_item(item):
             self._ids_by_unique_key_value.setdefault(key, {}).setdefault(value, []).append(id_)
 
+    def add_unique_later(self, item: MappedItemBase) -> None:
+        """Defers adding item's unique keys until the first lookup by unique key."""
+        self._ids_waiting_for_unique_keys.append(dict.__getitem__(item, "id"))
+
+    def _add_waiting_unique_keys(self) -> None:
+        if not self._ids_waiting_for_unique_keys:
+            return
+        ids = self._ids_waiting_for_unique_keys
+        self._ids_waiting_for_unique_keys = []
+        for id_ in ids:
+            item = dict.get(self, id_)
+            if item is not None:
+                self.add_unique(item)
+
     def remove_unique(self, item: MappedItemBase) -> None:
+        self._add_waiting_unique_keys()
         id_ = dict.__getitem__(item, "id")
         for key, value in item.unique_values_for_item(item):
             ids = self._ids_by_unique_key_value.get(key, {}).get(value, [])
@@ -522,6 +798,8 @@ class MappedTable(dict):
         if db_id is not None:
             new_id.resolve(db_id)
         self[new_id] = item
+        self._add_to_secondary_indexes(item)
+        self.change_count += 1
 
     def handle_fetched_item(self, item: dict, is_db_clean: bool) -> tuple[MappedItemBase, bool]:
         """Called when an item is fetched from the DB. Returns a corresponding mapped item
@@ -592,6 +870,7 @@ class MappedTable(dict):
             raise SpineDBAPIError("\n".join(errors))
 
     def add_item(self, item: dict | MappedItemBase) -> MappedItemBase:
+        self._db_map.check_writable()
         if not isinstance(item, MappedItemBase):
             item = self._make_item(item, ignore_polishing_errors=False)
         self.do_add_item(item)
@@ -601,13 +880,118 @@ class MappedTable(dict):
         item.added_to_mapped_table()
         return item
 
+    def add_checked_items(self, items: Iterable[MappedItemBase]) -> None:
+        """Adds items that the caller has already checked for integrity.
+
+        Unlike :meth:`add_item`, unique keys of the items are indexed only when they are first needed.
+        """
+        self._db_map.check_writable()
+        for item in items:
+            self.do_add_item(item)
+            self.add_unique_later(item)
+            item.become_referrer()
+            item.status = Status.to_add
+            item.added_to_mapped_table()
+
     def update_item(self, item: dict, target_item: MappedItemBase, updated_fields: set[str]) -> None:
+        self._db_map.check_writable()
         target_item.cascade_remove_unique()
+        self._remove_from_secondary_indexes(target_item)
         target_item.update(item)
+        self._add_to_secondary_indexes(target_item)
+        self.change_count += 1
         target_item.cascade_add_unique()
         update_referrers = not updated_fields.issubset(target_item.fields_not_requiring_cascade_update)
         target_item.cascade_update(update_referrers)
 
+    def update_committed_item(self, item: MappedItemBase, db_item: dict) -> None:
+        """Overwrites the fields of an unmodified item with newer ones fetched from the DB."""
+        fresh_item = self._make_item(db_item, ignore_polishing_errors=True)
+        changes = {
+            key: value
+            for key, value in fresh_item._asdict().items()
+            if key != "id" and resolve(dict.get(item, key)) != resolve(value)
+        }
+        if not changes:
+            return
+        self._add_waiting_unique_keys()
+        item.cascade_remove_unique()
+        self._remove_from_secondary_indexes(item)
+        self._remove_from_referenced_items(item, changes)
+        dict.update(item, changes)
+        item.become_referrer()
+        self._add_to_secondary_indexes(item)
+        self.change_count += 1
+        item.cascade_add_unique()
+        item.cascade_update(True)
+
+    def drop_item(self, item: MappedItemBase, kept_referrers: Optional[list[MappedItemBase]] = None) -> set[ItemType]:
+        """Removes an item that no longer exists in the DB from the mapping together with its referrers.
+
+        Unlike :meth:`remove_item`, this does not mark anything for removal on commit.
+
+        Args:
+            item: item to drop
+            kept_referrers: if given, referrers that have uncommitted changes
+                are not dropped but appended to this list, see :meth:`reattach_referrers`
+
+        Returns:
+            item types of the dropped referrers
+        """
+        referrer_types = set()
+        for referrer in list(item._referrers.values()):
+            referrer_table = self._db_map.mapped_table(referrer.item_type)
+            if dict.get(referrer_table, dict.__getitem__(referrer, "id")) is not referrer:
+                continue
+            if kept_referrers is not None and referrer.has_uncommitted_changes():
+                referrer.cascade_remove_unique()
+                referrer_table._remove_from_secondary_indexes(referrer)
+                kept_referrers.append(referrer)
+                continue
+            referrer_types.add(referrer.item_type)
+            referrer_types |= referrer_table.drop_item(referrer, kept_referrers)
+        self._remove_from_referenced_items(item, item._references)
+        self.remove_unique(item)
+        self._remove_from_secondary_indexes(item)
+        item.invalidate()
+        del self[dict.__getitem__(item, "id")]
+        self.change_count += 1
+        return referrer_types
+
+    def reattach_referrers(self, old_id: TempId, item: MappedItemBase, referrers: Iterable[MappedItemBase]) -> None:
+        """Makes referrers kept by :meth:`drop_item` refer to the item that replaced the dropped one.
+
+        Args:
+            old_id: id of the dropped item
+            item: item that replaced the dropped one
+            referrers: kept referrers of the dropped item
+        """
+        new_id = dict.__getitem__(item, "id")
+        for referrer in referrers:
+            for src_key, ref_type in referrer._references.items():
+                if ref_type != self.item_type:
+                    continue
+                ref_ids = dict.get(referrer, src_key)
+                if isinstance(ref_ids, tuple):
+                    dict.__setitem__(referrer, src_key, tuple(new_id if id_ == old_id else id_ for id_ in ref_ids))
+                elif ref_ids == old_id:
+                    dict.__setitem__(referrer, src_key, new_id)
+            item.add_referrer(referrer)
+            self._db_map.mapped_table(referrer.item_type)._add_to_secondary_indexes(referrer)
+            referrer.cascade_add_unique()
+            referrer.cascade_update(True)
+
+    def _remove_from_referenced_items(self, item: MappedItemBase, fields: Iterable[str]) -> None:
+        """Removes item from the referrers of the items it references via given fields."""
+        for src_key, ref_type in item._references.items():
+            if src_key not in fields:
+                continue
+            ref_table = self._db_map.mapped_table(ref_type)
+            ref_ids = dict.get(item, src_key)
+            for ref_id in ref_ids if isinstance(ref_ids, tuple) else (ref_ids,):
+                if ref_id is not None and (ref := ref_table.get(ref_id)) is not None:
+                    ref.remove_referrer(item)
+
     def remove_item(self, item: Optional[MappedItemBase]) -> Optional[MappedItemBase]:
         if not item:
             return None
@@ -620,6 +1004,7 @@ class MappedTable(dict):
         return item
 
     def restore_item(self, id_: TempId | int) -> Optional[MappedItemBase]:
+        self._db_map.check_writable()
         if id_ is Asterisk:
             self.purged = False
             for current_item in self.values():
@@ -637,9 +1022,12 @@ class MappedTable(dict):
 
     def reset(self) -> None:
         self._ids_by_unique_key_value.clear()
+        self._secondary_indexes.clear()
+        self._ids_waiting_for_unique_keys.clear()
         self._temp_id_lookup.clear()
         self.wildcard_item.status = Status.committed
         self.clear()
+        self.change_count += 1
 
 
 class FieldDict(TypedDict):
@@ -649,8 +1037,31 @@ class FieldDict(TypedDict):
 
 
 class MappedItemBase(dict):
-    """A dictionary that represents a db item."""
+    """A dictionary that represents a db item.
+
+    Items use ``__slots__`` and allocate referrer and callback containers only when needed
+    to keep mappings with millions of items small. Subclasses must declare ``__slots__``, too.
+    """
 
+    __slots__ = (
+        "db_map",
+        "_referrers",
+        "_weak_referrers",
+        "_restore_callbacks",
+        "_update_callbacks",
+        "_remove_callbacks",
+        "_has_valid_id",
+        "_removed",
+        "_valid",
+        "status",
+        "_removal_source",
+        "_status_when_removed",
+        "_status_when_committed",
+        "replaced_item_waiting_for_removal",
+        "_backup",
+        "_referenced_value_cache",
+        "_public_item",
+    )
     item_type: ClassVar[ItemType] = NotImplemented
     fields: ClassVar[dict[str, FieldDict]] = {}
     """A dictionary mapping fields to a another dict mapping "type" to a Python type,
@@ -699,11 +1110,11 @@ class MappedItemBase(dict):
         """
         super().__init__(**kwargs)
         self.db_map = db_map
-        self._referrers: dict[TempId, MappedItemBase] = {}
-        self._weak_referrers: dict[tuple[str, TempId], MappedItemBase] = {}
-        self.restore_callbacks: set[Callable[[MappedItemBase], bool]] = set()
-        self.update_callbacks: set[Callable[[MappedItemBase], bool]] = set()
-        self.remove_callbacks: set[Callable[[MappedItemBase], bool]] = set()
+        self._referrers: dict[TempId, MappedItemBase] = _NO_ITEMS
+        self._weak_referrers: dict[tuple[str, TempId], MappedItemBase] = _NO_ITEMS
+        self._restore_callbacks: Optional[set[Callable[[MappedItemBase], bool]]] = None
+        self._update_callbacks: Optional[set[Callable[[MappedItemBase], bool]]] = None
+        self._remove_callbacks: Optional[set[Callable[[MappedItemBase], bool]]] = None
         self._has_valid_id = True
         self._removed = False
         self._valid: Optional[bool] = None
@@ -713,8 +1124,59 @@ class MappedItemBase(dict):
         self._status_when_committed: Optional[Status] = None
         self.replaced_item_waiting_for_removal: Optional[MappedItemBase] = None
         self._backup: Optional[dict] = None
-        self._referenced_value_cache = {}
-        self.public_item = PublicItem(self)
+        self._referenced_value_cache: dict[tuple[str, str], Any] = _NO_ITEMS
+        self._public_item: Optional[PublicItem] = None
+
+    @property
+    def public_item(self) -> PublicItem:
+        """Returns the public counterpart of this item."""
+        if self._public_item is None:
+            self._public_item = PublicItem(self)
+        return self._public_item
+
+    @property
+    def restore_callbacks(self) -> set[Callable[[MappedItemBase], bool]]:
+        if self._restore_callbacks is None:
+            self._restore_callbacks = set()
+        return self._restore_callbacks
+
+    @restore_callbacks.setter
+    def restore_callbacks(self, callbacks: set[Callable[[MappedItemBase], bool]]) -> None:
+        self._restore_callbacks = callbacks
+
+    @property
+    def update_callbacks(self) -> set[Callable[[MappedItemBase], bool]]:
+        if self._update_callbacks is None:
+            self._update_callbacks = set()
+        return self._update_callbacks
+
+    @update_callbacks.setter
+    def update_callbacks(self, callbacks: set[Callable[[MappedItemBase], bool]]) -> None:
+        self._update_callbacks = callbacks
+
+    @property
+    def remove_callbacks(self) -> set[Callable[[MappedItemBase], bool]]:
+        if self._remove_callbacks is None:
+            self._remove_callbacks = set()
+        return self._remove_callbacks
+
+    @remove_callbacks.setter
+    def remove_callbacks(self, callbacks: set[Callable[[MappedItemBase], bool]]) -> None:
+        self._remove_callbacks = callbacks
+
+    def _call_callbacks(self, callbacks: Optional[set[Callable[[MappedItemBase], bool]]]) -> None:
+        """Calls given callbacks and drops the ones that return False."""
+        if not callbacks:
+            return
+        obsolete = set()
+        for callback in callbacks:
+            if not callback(self):
+                obsolete.add(callback)
+        callbacks -= obsolete
+
+    def _clear_referenced_value_cache(self) -> None:
+        if self._referenced_value_cache:
+            self._referenced_value_cache.clear()
 
     def as_item_dict(self) -> dict:
         return {key: self[key] for key in self.fields}
@@ -905,7 +1367,7 @@ class MappedItemBase(dict):
             if key in skip_keys:
                 continue
             self._do_resolve_internal_field(key)
-        self._referenced_value_cache.clear()
+        self._clear_referenced_value_cache()
 
     def _do_resolve_internal_field(self, key: str) -> None:
         src_key, target_key = self._internal_fields[key]
@@ -947,6 +1409,10 @@ class MappedItemBase(dict):
         self.validate()
         return self._valid
 
+    def invalidate(self) -> None:
+        """Marks this item invalid for good, e.g. after it has been dropped from the mapping."""
+        self._valid = False
+
     def validate(self) -> None:
         """Resolves all references and checks if the item is valid.
 
@@ -969,6 +1435,8 @@ class MappedItemBase(dict):
             id_ = dict.__getitem__(referrer, "id")
         except KeyError as error:
             raise RuntimeError("referrer is missing id") from error
+        if self._referrers is _NO_ITEMS:
+            self._referrers = {}
         self._referrers[id_] = referrer
 
     def remove_referrer(self, referrer: MappedItemBase) -> None:
@@ -977,7 +1445,8 @@ class MappedItemBase(dict):
             id_ = dict.__getitem__(referrer, "id")
         except KeyError:
             return
-        self._referrers.pop(id_, None)
+        if self._referrers:
+            self._referrers.pop(id_, None)
 
     def add_weak_referrer(self, referrer: MappedItemBase) -> None:
         """Adds a weak referrer to this item.
@@ -987,6 +1456,8 @@ class MappedItemBase(dict):
             id_ = dict.__getitem__(referrer, "id")
         except KeyError as error:
             raise RuntimeError("weak referrer is missing id") from error
+        if self._weak_referrers is _NO_ITEMS:
+            self._weak_referrers = {}
         self._weak_referrers[(referrer.item_type, id_)] = referrer
 
     def _update_weak_referrers(self) -> None:
@@ -1031,7 +1502,7 @@ class MappedItemBase(dict):
         """Restores this item (if removed) and all its referrers in cascade.
         Also, updates items' status and calls their restore callbacks.
         """
-        self._referenced_value_cache.clear()
+        self._clear_referenced_value_cache()
         if not self._removed:
             return
         if source is not self._removal_source:
@@ -1044,12 +1515,9 @@ class MappedItemBase(dict):
             raise RuntimeError("invalid status for item being restored")
         self._removed = False
         self._valid = None
+        self.db_map.mapped_table(self.item_type).change_count += 1
         # First restore this, then referrers
-        obsolete = set()
-        for callback in self.restore_callbacks:
-            if not callback(self):
-                obsolete.add(callback)
-        self.restore_callbacks -= obsolete
+        self._call_callbacks(self._restore_callbacks)
         for referrer in self._referrers.values():
             referrer.cascade_restore(source=self)
         self._update_weak_referrers()
@@ -1070,15 +1538,12 @@ class MappedItemBase(dict):
         self._removal_source = source
         self._removed = True
         self._valid = None
+        self.db_map.mapped_table(self.item_type).change_count += 1
         # First remove referrers, then this
         for referrer in self._referrers.values():
             referrer.cascade_remove(source=self)
         self._update_weak_referrers()
-        obsolete = set()
-        for callback in self.remove_callbacks:
-            if not callback(self):
-                obsolete.add(callback)
-        self.remove_callbacks -= obsolete
+        self._call_callbacks(self._remove_callbacks)
 
     def cascade_update(self, update_referrers: bool) -> None:
         """Updates this item and optionally all its referrers in cascade.
@@ -1086,7 +1551,7 @@ class MappedItemBase(dict):
         """
         if self._removed:
             return
-        self._referenced_value_cache.clear()
+        self._clear_referenced_value_cache()
         self.call_update_callbacks()
         if update_referrers:
             for referrer in self._referrers.values():
@@ -1094,15 +1559,11 @@ class MappedItemBase(dict):
             self._update_weak_referrers()
 
     def call_update_callbacks(self) -> None:
-        obsolete = set()
-        for callback in self.update_callbacks:
-            if not callback(self):
-                obsolete.add(callback)
-        self.update_callbacks -= obsolete
+        self._call_callbacks(self._update_callbacks)
 
     def cascade_add_unique(self) -> None:
         """Adds item and all its referrers unique keys and ids in cascade."""
-        self._referenced_value_cache.clear()
+        self._clear_referenced_value_cache()
         mapped_table = self.db_map.mapped_table(self.item_type)
         mapped_table.add_unique(self)
         for referrer in self._referrers.values():
@@ -1119,6 +1580,12 @@ class MappedItemBase(dict):
         """Returns whether this item is committed to the DB."""
         return self.status == Status.committed
 
+    def has_uncommitted_changes(self) -> bool:
+        """Returns whether this item or any of its referrers has changes that are not committed to the DB."""
+        return not self.is_committed() or any(
+            referrer.has_uncommitted_changes() for referrer in self._referrers.values()
+        )
+
     def commit(self, commit_id: TempId | None) -> None:
         """Sets this item as committed with the given commit id."""
         self._status_when_committed = self.status
@@ -1141,9 +1608,10 @@ class MappedItemBase(dict):
             ref = self._get_full_ref(source_key, ref_type)
             if isinstance(ref, tuple):
                 value = tuple(r[target_key] for r in ref)
-                self._referenced_value_cache[source_and_target_key] = value
-                return value
-            value = ref[target_key] if ref is not None else None
+            else:
+                value = ref[target_key] if ref is not None else None
+            if self._referenced_value_cache is _NO_ITEMS:
+                self._referenced_value_cache = {}
             self._referenced_value_cache[source_and_target_key] = value
             return value
         return super().__getitem__(key)
@@ -1221,7 +1689,19 @@ class MappedItemBase(dict):
         """Called after the item has been added to a mapped table as a new item (not after fetching etc.)."""
 
 
+class _WildcardItem(MappedItemBase):
+    """An item that stands for all items of a mapped table, e.g. when the table is purged."""
+
+    __slots__ = ("item_type",)
+
+    def __init__(self, db_map: DatabaseMapping, item_type: ItemType):
+        super().__init__(db_map, id=Asterisk)
+        self.item_type = item_type
+
+
 class PublicItem:
+    __slots__ = ("_mapped_item",)
+
     def __init__(self, mapped_item: MappedItemBase):
         self._mapped_item = mapped_item
 
@@ -10,7 +10,10 @@
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ######################################################################################################################
 
-from sqlalchemy import and_, or_
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from sqlalchemy import Table, and_, func, or_, select
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.sql.expression import bindparam
 from .exception import SpineDBAPIError
@@ -18,7 +21,56 @@ from .helpers import Asterisk, group_consecutive
 from .temp_id import TempId, resolve
 
 
+class IdAllocator(ABC):
+    """Allocates primary keys for rows that are about to be inserted into the DB.
+
+    Subclass this and pass an instance to :class:`~spinedb_api.DatabaseMapping`
+    to customize how ids are chosen, e.g. to use a dialect specific sequence.
+    """
+
+    @abstractmethod
+    def allocate(self, connection: Connection, table: Table, count: int) -> list[int]:
+        """Returns ids for new rows.
+
+        Args:
+            connection: connection to the DB; the allocation runs in the commit's transaction
+            table: target table
+            count: number of ids to allocate
+
+        Returns:
+            ascending list of ``count`` unused ids
+        """
+
+
+class MaxIdAllocator(IdAllocator):
+    """Allocates ids after the largest id currently in the table.
+
+    This is the default allocator. Finding the largest id is a single index lookup,
+    so the cost does not depend on the size of the table.
+    """
+
+    def allocate(self, connection: Connection, table: Table, count: int) -> list[int]:
+        max_id = connection.execute(select(func.max(table.c.id))).scalar()
+        next_id = (max_id or 0) + 1
+        return list(range(next_id, next_id + count))
+
+
+class GapFillingIdAllocator(IdAllocator):
+    """Reuses ids freed by removed rows before allocating new ones after the largest id.
+
+    This needs to read all ids in the table on every commit.
+    """
+
+    def allocate(self, connection: Connection, table: Table, count: int) -> list[int]:
+        current_ids = set(connection.execute(select(table.c.id)).scalars())
+        next_id = max(current_ids, default=0) + 1
+        available_ids = sorted(set(range(1, next_id)) - current_ids)[:count]
+        required_id_count = count - len(available_ids)
+        return available_ids + list(range(next_id, next_id + required_id_count))
+
+
 class DatabaseMappingCommitMixin:
+    _id_allocator: IdAllocator = MaxIdAllocator()
     _id_fields = {
         "entity_class_dimension": "entity_class_id",
         "entity_element": "entity_id",
@@ -36,12 +88,7 @@ class DatabaseMappingCommitMixin:
         """Add items to DB without checking integrity."""
         try:
             table = self._metadata.tables[tablename]
-            current_ids = {x.id for x in connection.execute(table.select())}
-            next_id = max(current_ids, default=0) + 1
-            available_ids = set(range(1, next_id)) - current_ids
-            required_id_count = len(items_to_add) - len(available_ids)
-            new_ids = set(range(next_id, next_id + required_id_count))
-            ids = sorted(available_ids | new_ids)
+            ids = self._id_allocator.allocate(connection, table, len(items_to_add))
             for id_, item in zip(ids, items_to_add):
                 temp_id = item["id"]
                 temp_id.resolve(id_)
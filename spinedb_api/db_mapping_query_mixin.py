@@ -10,7 +10,9 @@
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ######################################################################################################################
 
+from functools import cache
 from types import MethodType
+from typing import ClassVar
 from sqlalchemy import Integer, Table, and_, case, cast, func, or_
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql import Subquery
@@ -21,6 +23,9 @@ from .helpers import forward_sweep, group_concat
 class DatabaseMappingQueryMixin:
     """Provides the :meth:`query` method for performing custom ``SELECT`` queries."""
 
+    _shared_table_to_sq_attr: ClassVar[dict[tuple, dict[str, frozenset[str]]]] = {}
+    """Table to subquery attribute maps shared by mappings of the same class, schema and filter types."""
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Subqueries that select everything from each table
@@ -80,21 +85,36 @@ class DatabaseMappingQueryMixin:
         self._ext_entity_metadata_sq = None
         self._import_alternative_name = None
         self._table_to_sq_attr = {}
+        # Callbacks that release resources held by parameter value subquery overrides
+        self._parameter_value_sq_releases = []
 
     def _get_table_to_sq_attr(self):
         if not self._table_to_sq_attr:
-            self._table_to_sq_attr = self._make_table_to_sq_attr()
+            key = (
+                type(self),
+                tuple(sorted(self._metadata.tables)),
+                tuple(config["type"] for config in getattr(self, "filter_configs", ())),
+            )
+            table_to_sq_attr = self._shared_table_to_sq_attr.get(key)
+            if table_to_sq_attr is None:
+                table_to_sq_attr = self._shared_table_to_sq_attr[key] = self._make_table_to_sq_attr()
+            self._table_to_sq_attr = table_to_sq_attr
         return self._table_to_sq_attr
 
     def _make_table_to_sq_attr(self):
-        """Returns a dict mapping table names to subquery attribute names, involving that table."""
+        """Returns a dict mapping table names to subquery attribute names, involving that table.
+
+        The dependencies between subqueries are the same for all mappings that have the same schema
+        and have had the same types of filters applied to them,
+        so the result is shared through :attr:`_shared_table_to_sq_attr`.
+        """
 
         def _func(x, tables):
             if isinstance(x, Table):
                 tables.add(x.name)  # pylint: disable=cell-var-from-loop
 
         # This 'loads' our subquery attributes
-        for attr in dir(self):
+        for attr in _subquery_property_names(type(self)):
             getattr(self, attr)
         table_to_sq_attr = {}
         for attr, val in vars(self).items():
@@ -105,7 +125,7 @@ class DatabaseMappingQueryMixin:
             # Now `tables` contains all tables related to `val`
             for table in tables:
                 table_to_sq_attr.setdefault(table, set()).add(attr)
-        return table_to_sq_attr
+        return {table: frozenset(attrs) for table, attrs in table_to_sq_attr.items()}
 
     def _clear_subqueries(self, *tablenames):
         """Set to `None` subquery attributes involving the affected tables.
@@ -1509,15 +1529,19 @@ class DatabaseMappingQueryMixin:
         self._make_parameter_definition_sq = MethodType(method, self)
         self._clear_subqueries("parameter_definition")
 
-    def override_parameter_value_sq_maker(self, method):
+    def override_parameter_value_sq_maker(self, method, release=None):
         """
         Overrides the function that creates the ``parameter_value_sq`` property.
 
         Args:
             method (Callable): a function that accepts a :class:`DatabaseMapping` as its argument and
                 returns parameter value subquery as an :class:`Subquery` object
+            release (Callable, optional): a function without arguments that is called
+                when the original function is restored
         """
         self._make_parameter_value_sq = MethodType(method, self)
+        if release is not None:
+            self._parameter_value_sq_releases.append(release)
         self._clear_subqueries("parameter_value")
 
     def override_alternative_sq_maker(self, method):
@@ -1591,6 +1615,9 @@ class DatabaseMappingQueryMixin:
     def restore_parameter_value_sq_maker(self):
         """Restores the original function that creates the ``parameter_value_sq`` property."""
         self._make_parameter_value_sq = MethodType(DatabaseMappingQueryMixin._make_parameter_value_sq, self)
+        for release in self._parameter_value_sq_releases:
+            release()
+        self._parameter_value_sq_releases.clear()
         self._clear_subqueries("parameter_value")
 
     def restore_alternative_sq_maker(self):
@@ -1660,3 +1687,16 @@ class DatabaseMappingQueryMixin:
         return case(
             (self.wide_entity_sq.c.element_id_list != None, self.wide_relationship_sq.c.object_name_list), else_=None
         )
+
+
+@cache
+def _subquery_property_names(cls: type) -> tuple[str, ...]:
+    """Returns the names of the subquery properties of given mapping class.
+
+    Args:
+        cls: database mapping class
+
+    Returns:
+        property names
+    """
+    return tuple(name for name in dir(cls) if name.endswith("_sq") and isinstance(getattr(cls, name), property))
@@ -96,31 +96,55 @@ def export_data(
     Returns:
         exported data
     """
-    data = {
-        "entity_classes": export_entity_classes(db_map, entity_class_ids),
-        "superclass_subclasses": export_superclass_subclasses(db_map, superclass_subclass_ids),
-        "display_modes": export_display_modes(db_map, display_mode_ids),
-        "entity_class_display_modes": export_entity_class_display_modes(db_map, entity_class_display_mode_ids),
-        "entities": export_entities(db_map, entity_ids),
-        "entity_alternatives": export_entity_alternatives(db_map, entity_alternative_ids),
-        "entity_groups": export_entity_groups(db_map, entity_group_ids),
-        "parameter_value_lists": export_parameter_value_lists(
-            db_map, parameter_value_list_ids, parse_value=parse_value
-        ),
-        "parameter_groups": export_parameter_groups(db_map, parameter_group_ids),
-        "parameter_definitions": export_parameter_definitions(
-            db_map, parameter_definition_ids, parse_value=parse_value
-        ),
-        "parameter_types": export_parameter_types(db_map, parameter_type_ids),
-        "parameter_values": export_parameter_values(db_map, parameter_value_ids, parse_value=parse_value),
-        "alternatives": export_alternatives(db_map, alternative_ids),
-        "scenarios": export_scenarios(db_map, scenario_ids),
-        "scenario_alternatives": export_scenario_alternatives(db_map, scenario_alternative_ids),
-        "metadata": export_metadata(db_map, metadata_ids),
-        "entity_metadata": export_entity_metadata(db_map, entity_metadata_ids),
-        "parameter_value_metadata": export_parameter_value_metadata(db_map, parameter_value_metadata_ids),
-    }
-    return {key: value for key, value in data.items() if value}
+    return dict(
+        iter_export_data(
+            db_map,
+            entity_class_ids=entity_class_ids,
+            superclass_subclass_ids=superclass_subclass_ids,
+            display_mode_ids=display_mode_ids,
+            entity_class_display_mode_ids=entity_class_display_mode_ids,
+            entity_ids=entity_ids,
+            entity_group_ids=entity_group_ids,
+            parameter_value_list_ids=parameter_value_list_ids,
+            parameter_definition_ids=parameter_definition_ids,
+            parameter_type_ids=parameter_type_ids,
+            parameter_value_ids=parameter_value_ids,
+            parameter_group_ids=parameter_group_ids,
+            alternative_ids=alternative_ids,
+            scenario_ids=scenario_ids,
+            scenario_alternative_ids=scenario_alternative_ids,
+            entity_alternative_ids=entity_alternative_ids,
+            metadata_ids=metadata_ids,
+            entity_metadata_ids=entity_metadata_ids,
+            parameter_value_metadata_ids=parameter_value_metadata_ids,
+            parse_value=parse_value,
+        )
+    )
+
+
+def iter_export_data(
+    db_map: DatabaseMapping, parse_value: ParseCallable = from_database, **ids: Ids
+) -> Iterator[tuple[str, list]]:
+    """Exports data from a Spine DB one item type at a time.
+
+    Unlike :func:`export_data`, only the exported items of a single type are held in memory at once.
+
+    Args:
+        db_map: The db to pull data from.
+        parse_value: Callable to parse value blobs from database
+        **ids: same id keyword arguments as :func:`export_data`
+
+    Yields:
+        key in exported data and the exported items of that type; types without items are skipped
+    """
+    unknown_arguments = ids.keys() - _EXPORTERS.keys()
+    if unknown_arguments:
+        raise TypeError(f"unexpected keyword arguments: {', '.join(sorted(unknown_arguments))}")
+    for ids_argument, (key, export, parses_values) in _EXPORTERS.items():
+        item_ids = ids.get(ids_argument, Asterisk)
+        items = export(db_map, item_ids, parse_value=parse_value) if parses_values else export(db_map, item_ids)
+        if items:
+            yield key, items
 
 
 def _get_items(db_map: DatabaseMapping, tablename: ItemType, ids: Ids) -> Iterator[dict]:
@@ -325,3 +349,27 @@ def export_parameter_value_metadata(db_map: DatabaseMapping, ids: Ids = Asterisk
             for x in _get_items(db_map, "parameter_value_metadata", ids)
         )
     )
+
+
+_EXPORTERS: dict[str, tuple[str, Callable[..., list], bool]] = {
+    "entity_class_ids": ("entity_classes", export_entity_classes, False),
+    "superclass_subclass_ids": ("superclass_subclasses", export_superclass_subclasses, False),
+    "display_mode_ids": ("display_modes", export_display_modes, False),
+    "entity_class_display_mode_ids": ("entity_class_display_modes", export_entity_class_display_modes, False),
+    "entity_ids": ("entities", export_entities, False),
+    "entity_alternative_ids": ("entity_alternatives", export_entity_alternatives, False),
+    "entity_group_ids": ("entity_groups", export_entity_groups, False),
+    "parameter_value_list_ids": ("parameter_value_lists", export_parameter_value_lists, True),
+    "parameter_group_ids": ("parameter_groups", export_parameter_groups, False),
+    "parameter_definition_ids": ("parameter_definitions", export_parameter_definitions, True),
+    "parameter_type_ids": ("parameter_types", export_parameter_types, False),
+    "parameter_value_ids": ("parameter_values", export_parameter_values, True),
+    "alternative_ids": ("alternatives", export_alternatives, False),
+    "scenario_ids": ("scenarios", export_scenarios, False),
+    "scenario_alternative_ids": ("scenario_alternatives", export_scenario_alternatives, False),
+    "metadata_ids": ("metadata", export_metadata, False),
+    "entity_metadata_ids": ("entity_metadata", export_entity_metadata, False),
+    "parameter_value_metadata_ids": ("parameter_value_metadata", export_parameter_value_metadata, False),
+}
+"""Maps id keyword arguments of :func:`export_data` to exported data keys, export functions
+and whether the functions take ``parse_value``."""
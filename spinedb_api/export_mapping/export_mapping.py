@@ -26,7 +26,7 @@ from ..mapping import Mapping, Position, is_pivoted, is_regular, unflatten
 from ..parameter_value import (
     IndexedValue,
     convert_containers_to_maps,
-    from_database,
+    from_database_shared,
     from_database_to_dimension_count,
     from_database_to_single_value,
     type_for_scalar,
@@ -873,7 +873,7 @@ class ParameterDefaultValueTypeMapping(ParameterDefaultValueMapping):
             return f"{from_database_to_dimension_count(row.default_value, type_)}d_map"
         if type_ in ("time_series", "time_pattern", "array"):
             return type_
-        return type_ if type_ else type_for_scalar(from_database(row.default_value, row.default_type))
+        return type_ if type_ else type_for_scalar(from_database_shared(row.default_value, row.default_type))
 
     def _title_state(self, db_row):
         return {
@@ -1008,7 +1008,7 @@ class ParameterValueTypeMapping(ParameterValueMapping):
             return f"{from_database_to_dimension_count(row.value, type_)}d_map"
         if type_ in ("time_series", "time_pattern", "array"):
             return type_
-        return type_ if type_ else type_for_scalar(from_database(row.value, row.type))
+        return type_ if type_ else type_for_scalar(from_database_shared(row.value, row.type))
 
     def _title_state(self, db_row):
         return {"type_and_dimensions": (db_row.type, from_database_to_dimension_count(db_row.value, db_row.type))}
@@ -1624,7 +1624,7 @@ def _expand_indexed_data(data, mapping):
     """
     if not isinstance(mapping.parent, _MappingWithLeafMixin):
         # Get dict
-        current_leaf = from_database(data[0], data[1])
+        current_leaf = from_database_shared(data[0], data[1])
         if data[1] == "map":
             current_leaf = convert_containers_to_maps(current_leaf)
     else:
@@ -1652,7 +1652,7 @@ def _expand_index_names(data, mapping):
         str: index name
     """
     if not isinstance(mapping.parent, _MappingWithLeafMixin):
-        current_leaf = from_database(data[0], data[1])
+        current_leaf = from_database_shared(data[0], data[1])
         if data[1] == "map":
             current_leaf = convert_containers_to_maps(current_leaf)
     else:
@@ -48,6 +48,7 @@ from .renamer import (
     parameter_renamer_shorthand_to_config,
 )
 from .scenario_filter import (
+    MATERIALIZED_SCENARIO_SHORTHAND_TAG,
     SCENARIO_FILTER_TYPE,
     SCENARIO_SHORTHAND_TAG,
     scenario_filter_config,
@@ -276,6 +277,7 @@ def _parse_shorthand(shorthand):
         ENTITY_CLASS_RENAMER_SHORTHAND_TAG: entity_class_renamer_shorthand_to_config,
         PARAMETER_RENAMER_SHORTHAND_TAG: parameter_renamer_shorthand_to_config,
         SCENARIO_SHORTHAND_TAG: scenario_filter_shorthand_to_config,
+        MATERIALIZED_SCENARIO_SHORTHAND_TAG: scenario_filter_shorthand_to_config,
         EXECUTION_SHORTHAND_TAG: execution_filter_shorthand_to_config,
         VALUE_TRANSFORMER_SHORTHAND_TAG: value_transformer_shorthand_to_config,
     }
@@ -23,8 +23,13 @@ Value transformer supports four types of instructions:
 from collections.abc import Sequence
 from functools import partial
 from numbers import Number
-from sqlalchemy import Integer, LargeBinary, String, case, literal
-from sqlalchemy.sql.expression import cast, select, union_all
+import operator
+from uuid import uuid4
+import numpy as np
+from sqlalchemy import Column, Integer, LargeBinary, MetaData, String, Table, case, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.event import listen, remove
+from sqlalchemy.schema import CreateTable
 from ..exception import SpineDBAPIError
 from ..helpers import LONGTEXT_LENGTH
 from ..parameter_value import IndexedValue, Map, from_database, to_database
@@ -50,7 +55,7 @@ def apply_value_transform_to_parameter_value_sq(db_map, instructions):
     db_map.filter_configs.append(config)
     state = _ValueTransformerState(db_map, instructions)
     transform = partial(_make_parameter_value_transforming_sq, state=state)
-    db_map.override_parameter_value_sq_maker(transform)
+    db_map.override_parameter_value_sq_maker(transform, release=state.release)
 
 
 def value_transformer_config(instructions: dict[str, dict[str, Sequence[dict]]]) -> dict:
@@ -146,32 +151,111 @@ class _ValueTransformerState:
             instructions (dict): mapping from entity class name to parameter name to list of instructions
         """
         self.original_parameter_value_sq = db_map.parameter_value_sq
-        self.transformed = self._transform(db_map, instructions)
+        self._instructions = instructions
+        self._definition_sq = db_map.entity_parameter_definition_sq
+        self._value_sq = db_map.entity_parameter_value_sq
+        self._transformed = None
+        self._engine = db_map.engine
+        self._listening = False
+        self.transformed_value_table = Table(
+            "transformed_parameter_value_" + uuid4().hex,
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("transformed_value", LargeBinary(LONGTEXT_LENGTH)),
+            Column("transformed_type", String(255)),
+            prefixes=["TEMPORARY"],
+        )
+
+    def install(self, db_map) -> None:
+        """Makes the temporary table of transformed values available to queries.
 
-    @staticmethod
-    def _transform(db_map, instructions):
-        """Transforms applicable parameter values for caching.
+        The table is filled at the beginning of every transaction that does not have it yet
+        and right away if the session of the database map is in a transaction.
 
         Args:
             db_map (DatabaseMapping): a database map
-            instructions (dict): mapping from entity class name to parameter name to list of instructions
+        """
+        if not self._listening:
+            listen(self._engine, "begin", self._ensure_transformed_value_table)
+            listen(self._engine, "rollback", self._forget_transformed_value_table)
+            self._listening = True
+        session = db_map.session()
+        if session is not None and session.in_transaction():
+            self._ensure_transformed_value_table(session.connection())
+
+    def release(self) -> None:
+        """Stops filling the temporary table on new transactions."""
+        if self._listening:
+            remove(self._engine, "begin", self._ensure_transformed_value_table)
+            remove(self._engine, "rollback", self._forget_transformed_value_table)
+            self._listening = False
+
+    def _ensure_transformed_value_table(self, connection: Connection) -> None:
+        """Creates and fills the temporary table of transformed values unless the connection already has it.
+
+        The table is filled inside the current transaction, so it is filled again after a rollback.
+        """
+        table_name = self.transformed_value_table.name
+        if table_name in connection.info:
+            return
+        transformed = self.transformed_values(connection)
+        connection.execute(CreateTable(self.transformed_value_table, if_not_exists=True))
+        connection.execute(self.transformed_value_table.delete())
+        if transformed:
+            connection.execute(
+                self.transformed_value_table.insert(),
+                [
+                    {"id": id_, "transformed_value": value, "transformed_type": type_}
+                    for id_, (value, type_) in transformed.items()
+                ],
+            )
+        connection.info[table_name] = True
+
+    def _forget_transformed_value_table(self, connection: Connection) -> None:
+        """Marks the temporary table unfilled after a rollback."""
+        connection.info.pop(self.transformed_value_table.name, None)
+
+    def transformed_values(self, connection: Connection) -> dict[int, tuple[bytes, str]]:
+        """Returns transformed values, transforming them on first call.
+
+        Args:
+            connection: connection to use for reading the original values
+
+        Returns:
+            mapping from parameter value ids to transformed values
+        """
+        if self._transformed is None:
+            self._transformed = self._transform(connection)
+        return self._transformed
+
+    def _transform(self, connection: Connection) -> dict[int, tuple[bytes, str]]:
+        """Transforms applicable parameter values.
+
+        Args:
+            connection: connection to use for reading the original values
 
         Returns:
-            dict: mapping from parameter value ids to transformed values
+            mapping from parameter value ids to transformed values
         """
+        instructions = self._instructions
         class_names = set(instructions.keys())
         param_names = set(name for class_instructions in instructions.values() for name in class_instructions)
-        definition_ids = {
-            definition_row.id
-            for definition_row in db_map.query(db_map.entity_parameter_definition_sq).filter(
-                db_map.entity_parameter_definition_sq.c.entity_class_name.in_(class_names)
-                & db_map.entity_parameter_definition_sq.c.parameter_name.in_(param_names)
-            )
-        }
+        definition_sq = self._definition_sq
+        value_sq = self._value_sq
+        definition_ids = select(definition_sq.c.id).where(
+            definition_sq.c.entity_class_name.in_(class_names) & definition_sq.c.parameter_name.in_(param_names)
+        )
+        value_rows = connection.execute(
+            select(
+                value_sq.c.id,
+                value_sq.c.entity_class_name,
+                value_sq.c.parameter_name,
+                value_sq.c.value,
+                value_sq.c.type,
+            ).where(value_sq.c.parameter_id.in_(definition_ids))
+        )
         transformed = {}
-        for value_row in db_map.query(db_map.entity_parameter_value_sq).filter(
-            db_map.entity_parameter_value_sq.c.parameter_id.in_(definition_ids)
-        ):
+        for value_row in value_rows:
             # definition_ids may contain class-parameter name combinations that don't exist in instructions.
             param_instructions = instructions[value_row.entity_class_name].get(value_row.parameter_name)
             if param_instructions is not None:
@@ -193,35 +277,32 @@ def _make_parameter_value_transforming_sq(db_map, state):
         Alias: a value transforming parameter value subquery
     """
     subquery = state.original_parameter_value_sq
-    if not state.transformed:
-        return subquery
-    transformed_rows = [(id_, value, type_) for id_, (value, type_) in state.transformed.items()]
-    # Little optimization: SqlAlchemy can infer types from the first row, so we need to use cast only on that.
-    statements = [
-        select(
-            cast(literal(transformed_rows[0][0]), Integer()).label("id"),
-            cast(literal(transformed_rows[0][1]), LargeBinary(LONGTEXT_LENGTH)).label("transformed_value"),
-            cast(literal(transformed_rows[0][2]), String()).label("transformed_type"),
-        )
-    ]
-    statements += [select(literal(i), literal(v), literal(t)) for i, v, t in transformed_rows[1:]]
-    temp_sq = union_all(*statements).alias("transformed_values")
-    new_value = case((temp_sq.c.transformed_value != None, temp_sq.c.transformed_value), else_=subquery.c.value)
-    new_type = case((temp_sq.c.transformed_type != None, temp_sq.c.transformed_type), else_=subquery.c.type)
+    session = db_map.session()
+    if session is not None and not state.transformed_values(session.connection()):
+        # Nothing to transform so there is no need for the temporary table.
+        temp_sq = None
+        new_value = subquery.c.value
+        new_type = subquery.c.type
+    else:
+        state.install(db_map)
+        temp_sq = state.transformed_value_table
+        new_value = case((temp_sq.c.transformed_value != None, temp_sq.c.transformed_value), else_=subquery.c.value)
+        new_type = case((temp_sq.c.transformed_type != None, temp_sq.c.transformed_type), else_=subquery.c.type)
+    query = db_map.query(
+        subquery.c.id.label("id"),
+        subquery.c.parameter_definition_id,
+        subquery.c.entity_class_id,
+        subquery.c.entity_id,
+        new_value.label("value"),
+        new_type.label("type"),
+        subquery.c.list_value_id,
+        subquery.c.alternative_id,
+        subquery.c.commit_id.label("commit_id"),
+    )
+    if temp_sq is not None:
+        query = query.join(temp_sq, subquery.c.id == temp_sq.c.id, isouter=True)
     parameter_value_sq = (
-        db_map.query(
-            subquery.c.id.label("id"),
-            subquery.c.parameter_definition_id,
-            subquery.c.entity_class_id,
-            subquery.c.entity_id,
-            new_value.label("value"),
-            new_type.label("type"),
-            subquery.c.list_value_id,
-            subquery.c.alternative_id,
-            subquery.c.commit_id.label("commit_id"),
-        )
-        .join(temp_sq, subquery.c.id == temp_sq.c.id, isouter=True)
-        .join(db_map.entity_sq, db_map.entity_sq.c.id == subquery.c.entity_id)
+        query.join(db_map.entity_sq, db_map.entity_sq.c.id == subquery.c.entity_id)
         .join(db_map.entity_class_sq, db_map.entity_class_sq.c.id == subquery.c.entity_class_id)
         .subquery()
     )
@@ -245,6 +326,34 @@ def _transform(value, instructions):
     return value
 
 
+def _apply_to_numbers(value, number_operation):
+    """Applies an arithmetic operation to a number or to the numbers in an indexed value.
+
+    Numeric value arrays are processed with a single vectorized operation.
+
+    Args:
+        value (Any): value to process
+        number_operation (Callable): operation that accepts a number or a numeric NumPy array
+
+    Returns:
+        Any: processed value
+    """
+    if isinstance(value, Number):
+        return number_operation(value)
+    if isinstance(value, IndexedValue):
+        values = value.values
+        if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+            value.values = number_operation(values)
+            return value
+        if not isinstance(values, np.ndarray) and values and all(type(x) is float for x in values):
+            value.values = number_operation(np.array(values)).tolist()
+            return value
+        for i, element in enumerate(values):
+            values[i] = _apply_to_numbers(element, number_operation)
+        return value
+    return value
+
+
 def _negate(value, instruction):
     """Negates a value.
 
@@ -255,13 +364,7 @@ def _negate(value, instruction):
     Returns:
         Any: negated value
     """
-    if isinstance(value, Number):
-        return -value
-    if isinstance(value, IndexedValue):
-        for i, element in enumerate(value.values):
-            value.values[i] = _negate(element, instruction)
-        return value
-    return value
+    return _apply_to_numbers(value, operator.neg)
 
 
 def _invert(value, instruction):
@@ -274,13 +377,14 @@ def _invert(value, instruction):
     Returns:
         Any: reciprocal of value
     """
-    if isinstance(value, Number):
-        return 1.0 / value
-    if isinstance(value, IndexedValue):
-        for i, element in enumerate(value.values):
-            value.values[i] = _invert(element, instruction)
-        return value
-    return value
+    return _apply_to_numbers(value, _reciprocal)
+
+
+def _reciprocal(x):
+    # NumPy would return inf for zeros in arrays instead of raising.
+    if np.any(x == 0):
+        raise ZeroDivisionError("float division by zero")
+    return 1.0 / x
 
 
 def _multiply(value, instruction):
@@ -293,13 +397,7 @@ def _multiply(value, instruction):
     Returns:
         Any: multiplied value
     """
-    if isinstance(value, Number):
-        return instruction["rhs"] * value
-    if isinstance(value, IndexedValue):
-        for i, element in enumerate(value.values):
-            value.values[i] = _multiply(element, instruction)
-        return value
-    return value
+    return _apply_to_numbers(value, partial(operator.mul, instruction["rhs"]))
 
 
 def _generate_index(value, instruction):
@@ -21,6 +21,7 @@ from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import suppress
 from typing import Any, Optional, TypeAlias
 from . import DatabaseMapping, SpineDBAPIError
+from .db_mapping_base import MappedItemBase, PublicItem
 from .helpers import DisplayStatusValue, ItemType
 from .parameter_value import (
     ConflictResolution,
@@ -30,6 +31,7 @@ from .parameter_value import (
     get_conflict_fixer,
     to_database,
 )
+from .temp_id import TempId
 
 UnparseCallable: TypeAlias = Callable[[Value], tuple[bytes, Optional[str]]]
 Alternative: TypeAlias = str | tuple[str] | tuple[str, str]
@@ -146,7 +148,10 @@ def import_data(
     for item_type, items in get_data_for_import(
         db_map, all_errors, unparse_value=unparse_value, fix_value_conflict=conflict_fixer, **kwargs
     ):
-        added, updated, errors = db_map.add_update_items(item_type, *items, strict=False)
+        if item_type == "parameter_value" and not db_map.read_only:
+            added, updated, errors = _add_update_parameter_values(db_map, items, items.references)
+        else:
+            added, updated, errors = db_map.add_update_items(item_type, *items, strict=False)
         num_imports += len(added + updated)
         all_errors.extend(errors)
     return num_imports, all_errors
@@ -278,7 +283,7 @@ def get_data_for_import(
     if parameter_values:
         yield (
             "parameter_value",
-            _get_parameter_values_for_import(db_map, parameter_values, all_errors, unparse_value, fix_value_conflict),
+            _ParameterValuesForImport(db_map, parameter_values, all_errors, unparse_value, fix_value_conflict),
         )
     if object_parameter_values:  # Legacy
         yield from get_data_for_import(
@@ -742,12 +747,117 @@ def _get_parameter_definitions_for_import(
         yield dict(zip(key, (class_name, parameter_name, value, type_, *optionals)))
 
 
+class _ParameterValueReferences:
+    """Resolves the references of imported parameter values by name.
+
+    Lookup dictionaries are built once for the whole import
+    so resolving an item costs a single dictionary lookup per reference.
+    """
+
+    def __init__(self, db_map: DatabaseMapping):
+        """
+        Args:
+            db_map: database mapping
+        """
+        tables = {}
+        for item_type in ("entity_class", "entity", "parameter_definition", "alternative", "parameter_value"):
+            tables[item_type] = db_map.mapped_table(item_type)
+            db_map.do_fetch_all(tables[item_type])
+        self._class_ids = {item["name"]: item["id"] for item in tables["entity_class"].valid_values()}
+        self._entity_ids = {
+            (item["class_id"], item["entity_byname"]): item["id"] for item in tables["entity"].valid_values()
+        }
+        self._definitions = {
+            (item["entity_class_id"], item["name"]): item for item in tables["parameter_definition"].valid_values()
+        }
+        self._alternative_ids = {item["name"]: item["id"] for item in tables["alternative"].valid_values()}
+        self._values = {
+            (item["parameter_definition_id"], item["entity_id"], item["alternative_id"]): item
+            for item in tables["parameter_value"].valid_values()
+        }
+        self.has_removed_values = any(item.removed for item in tables["parameter_value"].values())
+
+    def resolve(
+        self, class_name: str, entity_byname: tuple[str, ...], definition_name: str, alternative_name: str
+    ) -> Optional[tuple[TempId, TempId, MappedItemBase, TempId]]:
+        """Resolves parameter value's references.
+
+        Args:
+            class_name: entity class name
+            entity_byname: entity byname
+            definition_name: parameter definition name
+            alternative_name: alternative name
+
+        Returns:
+            entity class id, entity id, parameter definition and alternative id
+            or None if any of the references cannot be resolved
+        """
+        class_id = self._class_ids.get(class_name)
+        if class_id is None:
+            return None
+        entity_id = self._entity_ids.get((class_id, entity_byname))
+        definition = self._definitions.get((class_id, definition_name))
+        alternative_id = self._alternative_ids.get(alternative_name)
+        if entity_id is None or definition is None or alternative_id is None:
+            return None
+        return class_id, entity_id, definition, alternative_id
+
+    def existing_value(
+        self, definition_id: TempId, entity_id: TempId, alternative_id: TempId
+    ) -> Optional[MappedItemBase]:
+        """Returns existing parameter value or None if value does not exist."""
+        return self._values.get((definition_id, entity_id, alternative_id))
+
+
+class _ParameterValuesForImport:
+    """Iterable of parameter value items for import.
+
+    Reference lookups are built on first use and shared with :func:`_add_update_parameter_values`.
+    """
+
+    def __init__(
+        self,
+        db_map: DatabaseMapping,
+        data: Iterable[ParameterValue],
+        all_errors: list[str],
+        unparse_value: UnparseCallable,
+        fix_conflict: ConflictResolutionCallable,
+    ):
+        """
+        Args:
+            db_map: database mapping
+            data: parameter values to import
+            all_errors: list where to append errors
+            unparse_value: function to call when parsing parameter values
+            fix_conflict: parameter value conflict resolution function
+        """
+        self._db_map = db_map
+        self._data = data
+        self._all_errors = all_errors
+        self._unparse_value = unparse_value
+        self._fix_conflict = fix_conflict
+        self._references = None
+
+    @property
+    def references(self) -> _ParameterValueReferences:
+        """Reference lookups of imported values."""
+        if self._references is None:
+            self._references = _ParameterValueReferences(self._db_map)
+        return self._references
+
+    def __iter__(self) -> Iterator[dict]:
+        return _get_parameter_values_for_import(
+            self._db_map, self._data, self._all_errors, self._unparse_value, self._fix_conflict, self.references
+        )
+
+
 def _get_parameter_values_for_import(
     db_map: DatabaseMapping,
     data: Iterable[ParameterValue],
     all_errors: list[str],
     unparse_value: UnparseCallable,
     fix_conflict: ConflictResolutionCallable,
+    references: _ParameterValueReferences,
 ) -> Iterator[dict]:
     seen = set()
     key = ("entity_class_name", "entity_byname", "parameter_definition_name", "alternative_name", "value", "type")
@@ -768,16 +878,84 @@ def _get_parameter_values_for_import(
         seen.add(unique_values)
         value, type_ = unparse_value(value)
         item = dict(zip(key, unique_values + (None, None)))
-        try:
-            pv = parameter_value_table.find_item(item)
-        except SpineDBAPIError:
-            pass
+        resolved = None if references.has_removed_values else references.resolve(*unique_values)
+        if resolved is not None:
+            _, entity_id, definition, alternative_id = resolved
+            pv = references.existing_value(definition["id"], entity_id, alternative_id)
         else:
+            try:
+                pv = parameter_value_table.find_item(item)
+            except SpineDBAPIError:
+                pv = None
+        if pv is not None:
             value, type_ = fix_conflict((value, type_), (pv["value"], pv["type"]))
         item.update({"value": value, "type": type_})
         yield item
 
 
+def _add_update_parameter_values(
+    db_map: DatabaseMapping, items: Iterable[dict], references: _ParameterValueReferences
+) -> tuple[list[PublicItem], list[PublicItem], list[str]]:
+    """Adds or updates parameter values.
+
+    New values whose references resolve directly and whose parameters have no value lists
+    are checked and added in bulk.
+    Others, including values that need updating, go through :meth:`DatabaseMapping.add_update_items`.
+
+    Args:
+        db_map: database mapping
+        items: parameter value items as yielded by ``_get_parameter_values_for_import()``
+        references: reference lookups of the items
+
+    Returns:
+        added items, updated items and errors
+    """
+    new_items = []
+    other_items = []
+    for item in items:
+        value = item["value"]
+        type_ = item["type"]
+        resolved = None
+        if not references.has_removed_values and isinstance(value, bytes) and isinstance(type_, str):
+            resolved = references.resolve(
+                item["entity_class_name"],
+                item["entity_byname"],
+                item["parameter_definition_name"],
+                item["alternative_name"],
+            )
+        if resolved is None:
+            other_items.append(item)
+            continue
+        class_id, entity_id, definition, alternative_id = resolved
+        if definition["parameter_value_list_id"] is not None:
+            other_items.append(item)
+            continue
+        definition_id = definition["id"]
+        existing_value = references.existing_value(definition_id, entity_id, alternative_id)
+        if existing_value is not None:
+            if existing_value["value"] != value or existing_value["type"] != type_:
+                other_items.append(item)
+            continue
+        new_items.append(
+            db_map.make_item(
+                "parameter_value",
+                entity_class_id=class_id,
+                entity_id=entity_id,
+                parameter_definition_id=definition_id,
+                alternative_id=alternative_id,
+                value=value,
+                type=type_,
+                list_value_id=None,
+            )
+        )
+    db_map.mapped_table("parameter_value").add_checked_items(new_items)
+    added = [item.public_item for item in new_items]
+    if not other_items:
+        return added, [], []
+    other_added, updated, errors = db_map.add_update_items("parameter_value", *other_items, strict=False)
+    return added + other_added, updated, errors
+
+
 def _get_alternatives_for_import(data: Iterable[Alternative]) -> Iterable[dict]:
     key = ("name", "description")
     return ({"name": x} if isinstance(x, str) else dict(zip(key, x)) for x in data)
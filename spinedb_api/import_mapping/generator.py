@@ -15,9 +15,11 @@ Contains `get_mapped_data()` that converts rows of tabular data into a dictionar
 using ``import_functions.import_data()``
 """
 
-from collections.abc import Callable, Iterable
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
 from copy import deepcopy
-from itertools import dropwhile
+from dataclasses import replace
+from itertools import dropwhile, islice
 from typing import Any, Optional, TypeVar
 from ..exception import ParameterValueFormatError
 from ..helpers import string_to_bool
@@ -35,6 +37,7 @@ from ..parameter_value import (
 )
 from .import_mapping import (
     ArrayValueRecord,
+    ImportKey,
     ImportMapping,
     MapValueRecord,
     SemiMappedData,
@@ -48,6 +51,9 @@ from .type_conversion import ConvertSpec
 
 _NO_VALUE = object()
 
+DEFAULT_CHUNK_SIZE = 10000
+"""Default number of rows :func:`iter_mapped_data` maps at a time."""
+
 T = TypeVar("T")
 
 
@@ -89,18 +95,144 @@ def get_mapped_data(
     Returns:
         Mapped data, ready for ``import_data()`` and conversion errors
     """
-    # Sanitize mappings
-    for k, mapping in enumerate(mappings):
-        if isinstance(mapping, (list, dict)):
-            mappings[k] = import_mapping_from_dict(mapping)
-        elif not isinstance(mapping, ImportMapping):
-            raise TypeError(f"mapping must be a dict or ImportMapping subclass, instead got: {type(mapping).__name__}")
+    _sanitize_mappings(mappings)
     mapped_data = {}
     errors = []
     rows = list(data_source)
     if not rows:
         return mapped_data, errors
-    column_count = len(max(rows, key=lambda x: len(x) if x else 0))
+    column_convert_fns, default_column_convert_fn, row_convert_fns, mapping_names = _resolve_defaults(
+        mappings, column_convert_fns, default_column_convert_fn, row_convert_fns, mapping_names
+    )
+    column_count = _column_count(rows)
+    for mapping, mapping_name in zip(mappings, mapping_names):
+        feeder = _make_row_feeder(
+            mapping,
+            mapping_name,
+            rows,
+            data_header,
+            table_name,
+            column_count,
+            column_convert_fns,
+            default_column_convert_fn,
+            row_convert_fns,
+            errors,
+        )
+        if feeder is None:
+            continue
+        feeder.feed(rows, 0, mapped_data, errors)
+        feeder.finish(mapped_data, errors)
+    _finalize_mapped_data(mapped_data, unparse_value, errors)
+    return mapped_data, errors
+
+
+def iter_mapped_data(
+    data_source: Iterable[list],
+    mappings: list[ImportMapping | list | dict],
+    data_header: list | None = None,
+    table_name: str = "",
+    column_convert_fns: dict[int, ConvertSpec] | None = None,
+    default_column_convert_fn: ConvertSpec | Callable[[Any], Any] | None = None,
+    row_convert_fns: ConvertSpec | Callable[[Any], Any] | None = None,
+    unparse_value: Callable[[Any], Any] = identity,
+    mapping_names: list[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[dict, list[str]]]:
+    """Streaming version of :func:`get_mapped_data`.
+
+    Rows are pulled from ``data_source`` ``chunk_size`` rows at a time
+    and mapped data is yielded after each chunk, ready to be passed to ``import_data()``.
+    The header rows of pivoted mappings must be within the first chunk.
+
+    Indexed parameter values and default values may span several chunks.
+    They are kept until a chunk ends with a row that does not add to them,
+    so the rows of each indexed value must be adjacent;
+    a value that continues after rows of other values is reported as an error.
+    Mappings that are pivoted only (i.e. read data from rows and not from columns)
+    need the entire table and are fed when ``data_source`` has been exhausted.
+    Before a chunk is fed, column references are checked against the widest row each mapping has read so far.
+
+    Args:
+        data_source: Yields rows (lists)
+        mappings: Mappings from data rows into mapped data for ``import_data()``
+        data_header: table header
+        table_name: table name
+        column_convert_fns: mapping from column number to convert function
+        default_column_convert_fn: default convert function for surplus columns
+        row_convert_fns: mapping from row number to convert function
+        unparse_value: a callable that converts values to database format
+        mapping_names: list of mapping names (order corresponds to order of mappings).
+        chunk_size: maximum number of rows to map at a time
+
+    Yields:
+        Mapped data, ready for ``import_data()`` and conversion errors
+    """
+    _sanitize_mappings(mappings)
+    row_iterator = iter(data_source)
+    rows = list(islice(row_iterator, chunk_size))
+    if not rows:
+        return
+    column_convert_fns, default_column_convert_fn, row_convert_fns, mapping_names = _resolve_defaults(
+        mappings, column_convert_fns, default_column_convert_fn, row_convert_fns, mapping_names
+    )
+    column_counts = len(mappings) * [0]
+    errors = []
+    feeders = []
+    for mapping, mapping_name in zip(mappings, mapping_names):
+        feeder = _make_row_feeder(
+            mapping,
+            mapping_name,
+            rows,
+            data_header,
+            table_name,
+            0,
+            column_convert_fns,
+            default_column_convert_fn,
+            row_convert_fns,
+            errors,
+        )
+        if feeder is not None:
+            feeders.append(feeder)
+    mapped_data = {}
+    finished_value_keys = set()
+    first_row_number = 0
+    while True:
+        _check_column_refs(mappings, mapping_names, data_header, table_name, rows, first_row_number, column_counts)
+        for feeder in feeders:
+            feeder.feed(rows, first_row_number, mapped_data, errors)
+        first_row_number += len(rows)
+        rows = list(islice(row_iterator, chunk_size))
+        if not rows:
+            break
+        open_records = {id(record) for feeder in feeders for record in feeder.open_records()}
+        unfinished_data = _split_off_unfinished_records(mapped_data, open_records)
+        _check_finished_records(mapped_data, finished_value_keys, errors)
+        _finalize_mapped_data(mapped_data, unparse_value, errors)
+        yield mapped_data, errors
+        mapped_data = unfinished_data
+        errors = []
+    for feeder in feeders:
+        feeder.finish(mapped_data, errors)
+    _check_finished_records(mapped_data, finished_value_keys, errors)
+    _finalize_mapped_data(mapped_data, unparse_value, errors)
+    yield mapped_data, errors
+
+
+def _sanitize_mappings(mappings: list[ImportMapping | list | dict]) -> None:
+    for k, mapping in enumerate(mappings):
+        if isinstance(mapping, (list, dict)):
+            mappings[k] = import_mapping_from_dict(mapping)
+        elif not isinstance(mapping, ImportMapping):
+            raise TypeError(f"mapping must be a dict or ImportMapping subclass, instead got: {type(mapping).__name__}")
+
+
+def _resolve_defaults(
+    mappings: list[ImportMapping],
+    column_convert_fns: dict[int, ConvertSpec] | None,
+    default_column_convert_fn: ConvertSpec | Callable[[Any], Any] | None,
+    row_convert_fns: ConvertSpec | Callable[[Any], Any] | None,
+    mapping_names: list[str] | None,
+) -> tuple[dict[int, ConvertSpec], ConvertSpec | Callable[[Any], Any], dict[int, ConvertSpec], list[str]]:
     if column_convert_fns is None:
         column_convert_fns = {}
     if row_convert_fns is None:
@@ -110,92 +242,393 @@ def get_mapped_data(
     if mapping_names is None:
         mapping_names = []
     _ensure_mapping_name_consistency(mappings, mapping_names)
-    for mapping, mapping_name in zip(mappings, mapping_names):
-        mapping = deepcopy(mapping)
-        mapping.polish(table_name, data_header, mapping_name, column_count)
-        mapping_errors = check_validity(mapping)
-        if mapping_errors:
-            errors += mapping_errors
-            continue
-        read_state = {}
-        # Find pivoted and unpivoted mappings
-        pivoted, non_pivoted, pivoted_from_header, last = _split_mapping(mapping)
-        # If there are no pivoted mappings, we can just feed the rows to our mapping directly
-        if not (pivoted or pivoted_from_header):
-            start_pos = mapping.read_start_row
-            for k, row in enumerate(rows[start_pos:]):
-                if not _is_valid_row(row):
-                    continue
-                row = _convert_row(row, column_convert_fns, start_pos + k, errors)
-                mapping.import_row(row, read_state, mapped_data)
+    return column_convert_fns, default_column_convert_fn, row_convert_fns, mapping_names
+
+
+def _column_count(rows: list[list]) -> int:
+    return len(max(rows, key=lambda x: len(x) if x else 0))
+
+
+def _check_column_refs(
+    mappings: list[ImportMapping],
+    mapping_names: list[str],
+    data_header: list | None,
+    table_name: str,
+    rows: list[list],
+    first_row_number: int,
+    column_counts: list[int],
+) -> None:
+    """Raises InvalidMappingComponent if a mapping refers to a column past the widest row it has read.
+
+    Args:
+        mappings: mappings
+        mapping_names: mapping names
+        data_header: table header
+        table_name: table name
+        rows: rows of the chunk that is about to be fed
+        first_row_number: number of the first row in source table
+        column_counts: widest row each mapping has read in previous chunks; updated in place
+    """
+    for k, (mapping, mapping_name) in enumerate(zip(mappings, mapping_names)):
+        start = max(mapping.read_start_row - first_row_number, 0)
+        if start >= len(rows):
             continue
-        # There are pivoted mappings. We unpivot the table
-        pivoted_by_leaf = all(
-            not is_pivoted(m.position) and m.position != Position.header for m in mapping.flatten()[:-1]
-        )
-        unpivoted_rows, pivoted_pos, non_pivoted_pos, unpivoted_column_pos = _unpivot_rows(
-            rows,
-            data_header,
-            pivoted,
-            non_pivoted,
-            pivoted_from_header,
+        column_count = _column_count(rows[start:] if start else rows)
+        if column_count > column_counts[k]:
+            column_counts[k] = column_count
+            deepcopy(mapping).polish(table_name, data_header, mapping_name, column_count)
+
+
+def _finalize_mapped_data(mapped_data: SemiMappedData, unparse_value: UnparseCallable, errors: list[str]) -> None:
+    _make_entity_classes(mapped_data)
+    _make_entities(mapped_data)
+    _make_entity_metadata(mapped_data)
+    _make_entity_alternatives(mapped_data, errors)
+    _make_parameter_definitions(mapped_data, unparse_value)
+    _make_parameter_values(mapped_data, unparse_value)
+    _make_parameter_value_metadata(mapped_data)
+
+
+def _split_off_unfinished_records(mapped_data: SemiMappedData, open_records: set[int]) -> SemiMappedData:
+    """Moves records that may still get data from subsequent rows out of mapped data.
+
+    Parameter definitions with indexed default values stay in mapped data without the default value
+    so other items in the chunk can refer to them.
+
+    Args:
+        mapped_data: semi-mapped data
+        open_records: ids of value records the last row of the chunk added to
+
+    Returns:
+        unfinished records
+    """
+    unfinished_data = {}
+    values = mapped_data.get("parameter_values")
+    if values:
+        unfinished_values = {
+            key: value for key, value in values.items() if isinstance(value, ValueRecord) and id(value) in open_records
+        }
+        if unfinished_values:
+            for key in unfinished_values:
+                del values[key]
+            unfinished_data["parameter_values"] = unfinished_values
+            value_metadata = mapped_data.get("parameter_value_metadata")
+            if value_metadata:
+                unfinished_metadata = {key: None for key in value_metadata if (*key[:3], key[5]) in unfinished_values}
+                for key in unfinished_metadata:
+                    del value_metadata[key]
+                if unfinished_metadata:
+                    unfinished_data["parameter_value_metadata"] = unfinished_metadata
+    definitions = mapped_data.get("parameter_definitions")
+    if definitions:
+        unfinished_definitions = {}
+        for key, record in definitions.items():
+            if isinstance(record.default_value, ValueRecord) and id(record.default_value) in open_records:
+                unfinished_definitions[key] = record
+                definitions[key] = replace(record, default_value=None)
+        if unfinished_definitions:
+            unfinished_data["parameter_definitions"] = unfinished_definitions
+    return unfinished_data
+
+
+def _check_finished_records(mapped_data: SemiMappedData, finished_keys: set[tuple], errors: list[str]) -> None:
+    """Reports indexed values that were already finished in a previous chunk.
+
+    Args:
+        mapped_data: semi-mapped data
+        finished_keys: keys of indexed values finished in previous chunks; updated in place
+        errors: list where to append errors
+    """
+    keys = [key for key, value in mapped_data.get("parameter_values", {}).items() if isinstance(value, ValueRecord)]
+    keys += [
+        key
+        for key, record in mapped_data.get("parameter_definitions", {}).items()
+        if isinstance(record.default_value, ValueRecord)
+    ]
+    for key in keys:
+        if key in finished_keys:
+            errors.append(f"Rows of indexed value {key} are not adjacent; the value is incomplete")
+        else:
+            finished_keys.add(key)
+
+
+class _RowFeeder(ABC):
+    """Feeds source rows to a polished mapping."""
+
+    def __init__(self, mapping: ImportMapping):
+        """
+        Args:
+            mapping: polished mapping
+        """
+        self._mapping = mapping
+        self._read_state = {}
+
+    @abstractmethod
+    def feed(self, rows: list[list], first_row_number: int, mapped_data: SemiMappedData, errors: list[str]) -> None:
+        """Imports rows to mapped data.
+
+        Args:
+            rows: source rows
+            first_row_number: number of the first row in source table
+            mapped_data: target semi-mapped data
+            errors: list where to append errors
+        """
+
+    def finish(self, mapped_data: SemiMappedData, errors: list[str]) -> None:
+        """Imports data that could not be imported before all rows were fed.
+
+        Args:
+            mapped_data: target semi-mapped data
+            errors: list where to append errors
+        """
+
+    def open_records(self) -> list[ValueRecord]:
+        """Returns the indexed value records the last fed row added to.
+
+        Returns:
+            value records
+        """
+        return _records_in_state(self._read_state)
+
+
+class _RegularRowFeeder(_RowFeeder):
+    """Feeds rows to a mapping that has no pivoted components."""
+
+    def __init__(self, mapping: ImportMapping, column_convert_fns: dict[int, ConvertSpec]):
+        """
+        Args:
+            mapping: polished mapping
+            column_convert_fns: mapping from column number to convert function
+        """
+        super().__init__(mapping)
+        self._column_convert_fns = column_convert_fns
+
+    def feed(self, rows, first_row_number, mapped_data, errors):
+        start_pos = self._mapping.read_start_row
+        for row_number, row in enumerate(rows, first_row_number):
+            if row_number < start_pos or not _is_valid_row(row):
+                continue
+            row = _convert_row(row, self._column_convert_fns, row_number, errors)
+            self._mapping.import_row(row, self._read_state, mapped_data)
+
+
+class _PivotedTableFeeder(_RowFeeder):
+    """Feeds rows to a mapping that reads data from rows only.
+
+    Unpivoting needs the entire table, so rows are buffered until :meth:`finish`.
+    """
+
+    def __init__(
+        self,
+        mapping: ImportMapping,
+        data_header: list[str],
+        pivoted: list[ImportMapping],
+        pivoted_from_header: list[ImportMapping],
+        last: ImportMapping,
+        row_convert_fns: dict[int, ConvertSpec],
+    ):
+        """
+        Args:
+            mapping: polished mapping
+            data_header: table header
+            pivoted: pivoted mappings
+            pivoted_from_header: mappings pivoted from header
+            last: last mapping
+            row_convert_fns: mapping from row number to convert function
+        """
+        super().__init__(mapping)
+        self._data_header = data_header
+        self._pivoted = pivoted
+        self._pivoted_from_header = pivoted_from_header
+        self._last = last
+        self._row_convert_fns = row_convert_fns
+        self._rows = []
+
+    def feed(self, rows, first_row_number, mapped_data, errors):
+        self._rows += rows
+
+    def finish(self, mapped_data, errors):
+        mapping = self._mapping
+        unpivoted_rows, pivoted_pos, _, unpivoted_column_pos = _unpivot_rows(
+            self._rows,
+            self._data_header,
+            self._pivoted,
+            [],
+            self._pivoted_from_header,
             mapping.skip_columns,
             mapping.read_start_row,
-            pivoted_by_leaf,
+            _is_pivoted_by_leaf(mapping),
         )
+        self._rows = []
         if not unpivoted_column_pos:
-            continue
+            return
+        self._last.position = -1
+        row_convert_fns = {
+            k: self._row_convert_fns[pos] for k, pos in enumerate(pivoted_pos) if pos in self._row_convert_fns
+        }
+        for k, m in enumerate(self._pivoted):
+            m.position = k
+        for k, row in enumerate(unpivoted_rows):
+            if not _is_valid_row(row):
+                continue
+            row = _convert_row(row, row_convert_fns, k, errors)
+            mapping.import_row(row, self._read_state, mapped_data)
+
+
+class _PartiallyPivotedRowFeeder(_RowFeeder):
+    """Feeds rows to a mapping that reads data from both rows and columns."""
+
+    def __init__(
+        self,
+        mapping: ImportMapping,
+        unpivoted_rows: list[list],
+        pivoted_pos: list[int],
+        non_pivoted_pos: list[int],
+        unpivoted_column_pos: list[int],
+        pivoted: list[ImportMapping],
+        last: ImportMapping,
+        column_convert_fns: dict[int, ConvertSpec],
+        default_column_convert_fn: ConvertSpec | Callable[[Any], Any],
+        row_convert_fns: dict[int, ConvertSpec],
+    ):
+        """
+        Args:
+            mapping: polished mapping
+            unpivoted_rows: unpivoted header rows
+            pivoted_pos: positions of pivoted rows
+            non_pivoted_pos: positions of non-pivoted columns
+            unpivoted_column_pos: column positions corresponding to unpivoted rows
+            pivoted: pivoted mappings
+            last: last mapping
+            column_convert_fns: mapping from column number to convert function
+            default_column_convert_fn: default convert function for surplus columns
+            row_convert_fns: mapping from row number to convert function
+        """
+        super().__init__(mapping)
+        self._unpivoted_rows = unpivoted_rows
+        self._unpivoted_column_pos = unpivoted_column_pos
+        self._column_convert_fns = column_convert_fns
+        self._default_column_convert_fn = default_column_convert_fn
+        self._row_convert_fns = {k: row_convert_fns[pos] for k, pos in enumerate(pivoted_pos) if pos in row_convert_fns}
         last.position = -1
-        # Reposition row convert functions
-        row_convert_fns = {k: row_convert_fns[pos] for k, pos in enumerate(pivoted_pos) if pos in row_convert_fns}
-        # If there are only pivoted mappings, we can just feed the unpivoted rows
-        if not non_pivoted:
-            # Reposition pivoted mappings:
-            for k, m in enumerate(pivoted):
-                m.position = k
-            for k, row in enumerate(unpivoted_rows):
-                if not _is_valid_row(row):
-                    continue
-                row = _convert_row(row, row_convert_fns, k, errors)
-                mapping.import_row(row, read_state, mapped_data)
-            continue
-        # There are both pivoted and unpivoted mappings
         # Reposition mappings:
         # - The last mapping (typically, parameter value) will read from the last position in the row
         # - The pivoted mappings will read from positions to the left of that
-        k = None
+        self._last_pivoted_index = None
         for k, m in enumerate(reversed(pivoted)):
             m.position = -(k + 2)
-        # Feed rows: To each regular row, we append each unpivoted row, plus the item at the intersection,
-        # and feed that to the mapping
+            self._last_pivoted_index = k
         last_pivoted_row_pos = max(pivoted_pos, default=0) + 1
-        last_non_pivoted_column_pos = max(non_pivoted_pos, default=0) + 1
-        start_pos = max(mapping.read_start_row, last_pivoted_row_pos)
-        min_row_length = max(unpivoted_column_pos)
-        for i, row in enumerate(rows[start_pos:]):
-            if len(row) < min_row_length + 1:
-                error = f"Could not process incomplete row {i + 1}"
+        self._last_non_pivoted_column_pos = max(non_pivoted_pos, default=0) + 1
+        self._start_pos = max(mapping.read_start_row, last_pivoted_row_pos)
+        self._min_row_length = max(unpivoted_column_pos)
+        self._open_records = []
+
+    def feed(self, rows, first_row_number, mapped_data, errors):
+        # To each regular row, we append each unpivoted row, plus the item at the intersection,
+        # and feed that to the mapping
+        for row_number, row in enumerate(rows, first_row_number):
+            if row_number < self._start_pos:
+                continue
+            if len(row) < self._min_row_length + 1:
+                error = f"Could not process incomplete row {row_number - self._start_pos + 1}"
                 errors.append(error)
                 continue
-            if not _is_valid_row(row[:last_non_pivoted_column_pos]):
+            if not _is_valid_row(row[: self._last_non_pivoted_column_pos]):
                 continue
-            row = _convert_row(row, column_convert_fns, start_pos + i, errors, default_column_convert_fn)
-            non_pivoted_row = row[:last_non_pivoted_column_pos]
-            for column_pos, unpivoted_row in zip(unpivoted_column_pos, unpivoted_rows):
+            row = _convert_row(row, self._column_convert_fns, row_number, errors, self._default_column_convert_fn)
+            non_pivoted_row = row[: self._last_non_pivoted_column_pos]
+            self._open_records = []
+            for column_pos, unpivoted_row in zip(self._unpivoted_column_pos, self._unpivoted_rows):
                 if not _is_valid_row(unpivoted_row):
                     continue
-                unpivoted_row = _convert_row(unpivoted_row, row_convert_fns, k, errors)
+                unpivoted_row = _convert_row(unpivoted_row, self._row_convert_fns, self._last_pivoted_index, errors)
                 full_row = non_pivoted_row + unpivoted_row
                 full_row.append(row[column_pos])
-                mapping.import_row(full_row, read_state, mapped_data)
-    _make_entity_classes(mapped_data)
-    _make_entities(mapped_data)
-    _make_entity_metadata(mapped_data)
-    _make_entity_alternatives(mapped_data, errors)
-    _make_parameter_definitions(mapped_data, unparse_value)
-    _make_parameter_values(mapped_data, unparse_value)
-    _make_parameter_value_metadata(mapped_data)
-    return mapped_data, errors
+                self._mapping.import_row(full_row, self._read_state, mapped_data)
+                self._open_records += _records_in_state(self._read_state)
+
+    def open_records(self):
+        return self._open_records
+
+
+def _make_row_feeder(
+    mapping: ImportMapping,
+    mapping_name: str,
+    head_rows: list[list],
+    data_header: list | None,
+    table_name: str,
+    column_count: int,
+    column_convert_fns: dict[int, ConvertSpec],
+    default_column_convert_fn: ConvertSpec | Callable[[Any], Any],
+    row_convert_fns: dict[int, ConvertSpec],
+    errors: list[str],
+) -> _RowFeeder | None:
+    """Polishes a copy of given mapping and creates a row feeder for it.
+
+    Args:
+        mapping: mapping
+        mapping_name: mapping's name
+        head_rows: first rows of the table, must include the rows pivoted mappings read from
+        data_header: table header
+        table_name: table name
+        column_count: number of columns in the table
+        column_convert_fns: mapping from column number to convert function
+        default_column_convert_fn: default convert function for surplus columns
+        row_convert_fns: mapping from row number to convert function
+        errors: list where to append errors
+
+    Returns:
+        row feeder or None if mapping is invalid or has nothing to import
+    """
+    mapping = deepcopy(mapping)
+    mapping.polish(table_name, data_header, mapping_name, column_count)
+    mapping_errors = check_validity(mapping)
+    if mapping_errors:
+        errors += mapping_errors
+        return None
+    # Find pivoted and unpivoted mappings
+    pivoted, non_pivoted, pivoted_from_header, last = _split_mapping(mapping)
+    # If there are no pivoted mappings, we can just feed the rows to our mapping directly
+    if not (pivoted or pivoted_from_header):
+        return _RegularRowFeeder(mapping, column_convert_fns)
+    # If there are only pivoted mappings, we need the entire table to unpivot it
+    if not non_pivoted:
+        return _PivotedTableFeeder(mapping, data_header, pivoted, pivoted_from_header, last, row_convert_fns)
+    # There are both pivoted and unpivoted mappings. We unpivot the header rows
+    unpivoted_rows, pivoted_pos, non_pivoted_pos, unpivoted_column_pos = _unpivot_rows(
+        head_rows,
+        data_header,
+        pivoted,
+        non_pivoted,
+        pivoted_from_header,
+        mapping.skip_columns,
+        mapping.read_start_row,
+        _is_pivoted_by_leaf(mapping),
+    )
+    if not unpivoted_column_pos:
+        return None
+    return _PartiallyPivotedRowFeeder(
+        mapping,
+        unpivoted_rows,
+        pivoted_pos,
+        non_pivoted_pos,
+        unpivoted_column_pos,
+        pivoted,
+        last,
+        column_convert_fns,
+        default_column_convert_fn,
+        row_convert_fns,
+    )
+
+
+def _records_in_state(state: dict) -> list[ValueRecord]:
+    records = (state.get(ImportKey.PARAMETER_VALUE_RECORD), state.get(ImportKey.PARAMETER_DEFAULT_VALUE_RECORD))
+    return [record for record in records if record is not None]
+
+
+def _is_pivoted_by_leaf(mapping: ImportMapping) -> bool:
+    return all(not is_pivoted(m.position) and m.position != Position.header for m in mapping.flatten()[:-1])
 
 
 def _last_column_convert_function(functions: Optional[dict]) -> Callable[[Any], Any]:
@@ -29,6 +29,7 @@ from .parameter_value import (
     ParameterValueFormatError,
     fancy_type_to_type_and_rank,
     from_database,
+    from_database_shared,
     to_database,
     type_and_rank_to_fancy_type,
 )
@@ -46,6 +47,7 @@ _ENTITY_CLASS_BYNAME_VALUE = (
 
 
 class CommitItem(MappedItemBase):
+    __slots__ = ()
     item_type = "commit"
     fields = {
         "comment": {"type": str, "value": "A comment describing the commit."},
@@ -61,6 +63,7 @@ class CommitItem(MappedItemBase):
 
 
 class EntityClassItem(MappedItemBase):
+    __slots__ = ()
     item_type = "entity_class"
     fields = {
         "name": {"type": str, "value": "The class name."},
@@ -144,6 +147,7 @@ _ENTITY_LOCATION_FIELDS = {"lat", "lon", "alt", "shape_name", "shape_blob"}
 
 
 class EntityItem(MappedItemBase):
+    __slots__ = ("_location_id", "_init_location")
     item_type = "entity"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
@@ -464,6 +468,7 @@ class EntityItem(MappedItemBase):
 
 
 class EntityGroupItem(MappedItemBase):
+    __slots__ = ()
     item_type = "entity_group"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
@@ -510,6 +515,7 @@ class EntityGroupItem(MappedItemBase):
 
 
 class EntityAlternativeItem(MappedItemBase):
+    __slots__ = ()
     item_type = "entity_alternative"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
@@ -558,6 +564,7 @@ class EntityAlternativeItem(MappedItemBase):
 
 
 class DisplayModeItem(MappedItemBase):
+    __slots__ = ()
     item_type = "display_mode"
     fields = {
         "name": {"type": str, "value": "The display mode name."},
@@ -569,6 +576,7 @@ class DisplayModeItem(MappedItemBase):
 
 
 class EntityClassDisplayModeItem(MappedItemBase):
+    __slots__ = ()
     item_type = "entity_class_display_mode"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
@@ -616,6 +624,7 @@ class EntityClassDisplayModeItem(MappedItemBase):
 
 
 class ParsedValueBase(MappedItemBase):
+    __slots__ = ("_parsed_value", "_arrow_value")
     _private_fields = {"list_value_id"}
     value_key: ClassVar[str] = "value"
     type_key: ClassVar[str] = "type"
@@ -692,7 +701,8 @@ class ParsedValueBase(MappedItemBase):
                 other[self.value_key], other[self.type_key] = to_database(other_parsed_value)
         elif other_type is not undefined and other_value is not undefined:
             if self[self.type_key] != other_type or (
-                self[self.value_key] != other_value and self.parsed_value != from_database(other_value, other_type)
+                self[self.value_key] != other_value
+                and self.parsed_value != from_database_shared(other_value, other_type)
             ):
                 other[self.value_key] = other_value
                 other[self.type_key] = other_type
@@ -700,6 +710,8 @@ class ParsedValueBase(MappedItemBase):
 
 
 class ParameterItemBase(ParsedValueBase):
+    __slots__ = ()
+
     def _value_not_in_list_error(self, parsed_value, list_name):
         raise NotImplementedError()
 
@@ -744,7 +756,7 @@ class ParameterItemBase(ParsedValueBase):
         if type_ == "list_value_ref":
             return
         value = super().__getitem__(self.value_key)
-        parsed_value = from_database(value, type_)
+        parsed_value = from_database_shared(value, type_)
         if parsed_value is None:
             return
         mapped_table = self.db_map.mapped_table("list_value")
@@ -759,6 +771,7 @@ class ParameterItemBase(ParsedValueBase):
 
 
 class ParameterDefinitionItem(ParameterItemBase):
+    __slots__ = ("_init_type_list",)
     item_type = "parameter_definition"
     value_key = "default_value"
     type_key = "default_type"
@@ -973,6 +986,7 @@ class ParameterDefinitionItem(ParameterItemBase):
 
 
 class ParameterTypeItem(MappedItemBase):
+    __slots__ = ()
     item_type = "parameter_type"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
@@ -1029,6 +1043,7 @@ class ParameterTypeItem(MappedItemBase):
 
 
 class ParameterGroupItem(MappedItemBase):
+    __slots__ = ()
     item_type = "parameter_group"
     fields = {
         "name": {"type": str, "value": "The parameter group name."},
@@ -1051,6 +1066,7 @@ class ParameterGroupItem(MappedItemBase):
 
 
 class ParameterValueItem(ParameterItemBase):
+    __slots__ = ()
     item_type = "parameter_value"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
@@ -1133,6 +1149,7 @@ class ParameterValueItem(ParameterItemBase):
 
 
 class ParameterValueListItem(MappedItemBase):
+    __slots__ = ()
     item_type = "parameter_value_list"
     fields = {"name": {"type": str, "value": "The parameter value list name."}}
     unique_keys = (("name",),)
@@ -1150,6 +1167,7 @@ class ParameterValueListItem(MappedItemBase):
 
 
 class ListValueItem(ParsedValueBase):
+    __slots__ = ()
     item_type = "list_value"
     fields = {
         "parameter_value_list_name": {"type": str, "value": "The parameter value list name."},
@@ -1183,6 +1201,7 @@ class ListValueItem(ParsedValueBase):
 
 
 class AlternativeItem(MappedItemBase):
+    __slots__ = ()
     item_type = "alternative"
     fields = {
         "name": {"type": str, "value": "The alternative name."},
@@ -1195,6 +1214,7 @@ class AlternativeItem(MappedItemBase):
 
 
 class ScenarioItem(MappedItemBase):
+    __slots__ = ()
     item_type = "scenario"
     fields = {
         "name": {"type": str, "value": "The scenario name."},
@@ -1212,16 +1232,12 @@ class ScenarioItem(MappedItemBase):
         if key == "alternative_name_list":
             return [x["alternative_name"] for x in self["sorted_scenario_alternatives"]]
         if key == "sorted_scenario_alternatives":
-            mapped_table = self.db_map.mapped_table("scenario_alternative")
-            self.db_map.do_fetch_all(mapped_table)
-            return sorted(
-                (x for x in mapped_table.valid_values() if x["scenario_id"] == self["id"]),
-                key=itemgetter("rank"),
-            )
+            return list(self.db_map.scenario_resolver.sorted_scenario_alternatives(self["id"]))
         return super().__getitem__(key)
 
 
 class ScenarioAlternativeItem(MappedItemBase):
+    __slots__ = ()
     item_type = "scenario_alternative"
     fields = {
         "scenario_name": {"type": str, "value": "The scenario name."},
@@ -1273,6 +1289,7 @@ class ScenarioAlternativeItem(MappedItemBase):
 
 
 class MetadataItem(MappedItemBase):
+    __slots__ = ()
     item_type = "metadata"
     fields = {
         "name": {"type": str, "value": "The metadata entry name."},
@@ -1283,6 +1300,7 @@ class MetadataItem(MappedItemBase):
 
 
 class EntityMetadataItem(MappedItemBase):
+    __slots__ = ()
     item_type = "entity_metadata"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
@@ -1321,6 +1339,7 @@ class EntityMetadataItem(MappedItemBase):
 
 
 class ParameterValueMetadataItem(MappedItemBase):
+    __slots__ = ()
     item_type = "parameter_value_metadata"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
@@ -1377,6 +1396,7 @@ class ParameterValueMetadataItem(MappedItemBase):
 
 
 class SuperclassSubclassItem(MappedItemBase):
+    __slots__ = ()
     item_type = "superclass_subclass"
     fields = {
         "superclass_name": {"type": str, "value": "The superclass name."},
@@ -1452,6 +1472,7 @@ def _is_superclass_recursive(
 
 
 class EntityLocationItem(MappedItemBase):
+    __slots__ = ()
     item_type = "entity_location"
     fields = {
         "entity_class_name": {"type": str, "value": "The entity class name."},
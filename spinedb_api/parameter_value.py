@@ -82,14 +82,17 @@ use :func:`.from_database`::
 """
 
 from __future__ import annotations
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Sequence
 from copy import copy
 from datetime import datetime
 from itertools import takewhile
 import json
-from json.decoder import JSONDecodeError
+from json.decoder import JSONDecodeError, scanstring
 import re
-from typing import Any, Literal, Optional, SupportsFloat, Type, TypeAlias, Union
+import struct
+import threading
+from typing import Any, Literal, NamedTuple, Optional, SupportsFloat, Type, TypeAlias, Union
 import dateutil.parser
 from dateutil.relativedelta import relativedelta
 import numpy as np
@@ -108,6 +111,30 @@ _TIME_SERIES_PLAIN_INDEX_UNIT = "m"
 FLOAT_VALUE_TYPE = "float"
 BOOLEAN_VALUE_TYPE = "bool"
 STRING_VALUE_TYPE = "str"
+# Binary value format, see docs/source/parameter_value_format.rst.
+# The leading NUL byte never starts a JSON document.
+_BINARY_VALUE_MAGIC = b"\x00SPV"
+_BINARY_VALUE_VERSION = 1
+# Magic, version, kind, padding and length of JSON header.
+_BINARY_VALUE_PREFIX = struct.Struct("<4sBBxxI")
+_BINARY_ARRAY_ALIGNMENT = 8
+_BINARY_FLOAT_DTYPE = np.dtype("<f8")
+_BINARY_STAMP_DTYPE = np.dtype("<i8")
+_BINARY_FIXED_RESOLUTION_TIME_SERIES = 1
+_BINARY_VARIABLE_RESOLUTION_TIME_SERIES = 2
+_BINARY_FLOAT_ARRAY = 3
+_BINARY_FLOAT_INDEXED_MAP = 4
+_BINARY_DATE_TIME_INDEXED_MAP = 5
+# Blobs shorter than this are parsed faster than they are looked up from the parse cache.
+_PARSE_CACHE_MIN_BYTES = 128
+_PARSE_CACHE_DEFAULT_MAX_ENTRIES = 4096
+_PARSE_CACHE_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Helpers for reading value metadata without parsing the data, see value_metadata().
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_JSON_EMPTY_CONTAINER = re.compile(r"[\[{][ \t\n\r]*[\]}]")
+_JSON_KEEP_STRUCTURE_ONLY = str.maketrans("", "", "".join(chr(i) for i in range(128) if chr(i) not in "[]{},"))
 
 
 ConflictResolution: TypeAlias = Literal["keep", "replace", "merge"]
@@ -120,6 +147,37 @@ def from_database(value: bytes, type_: Optional[str]) -> Optional[Value]:
     """
     Converts a parameter value from the DB into a Python object.
 
+    Large values are memoized in a process-wide LRU cache, see :func:`parse_cache_info`.
+    The returned object is always a private copy the caller is free to modify.
+
+    Args:
+        value: The binary blob containing the value data from database.
+        type_: Value's type.
+
+    Returns:
+        A Python object representing the value.
+    """
+    if not _is_parse_cacheable(value):
+        return _parse_db_value(value, type_)
+    key = (value, type_)
+    parsed_value = _parse_cache.get(key)
+    if parsed_value is _parse_cache.MISSING:
+        parsed_value = _parse_db_value(value, type_)
+        if _is_parsed_value_cacheable(parsed_value):
+            _parse_cache.put(key, deep_copy_value(parsed_value), len(value))
+        return parsed_value
+    return deep_copy_value(parsed_value)
+
+
+def from_database_shared(value: bytes, type_: Optional[str]) -> Optional[Value]:
+    """
+    Converts a parameter value from the DB into a Python object that may be shared with other callers.
+
+    Large values are memoized in a process-wide LRU cache, see :func:`parse_cache_info`.
+    The returned object must not be modified; use :func:`from_database` to get a private copy.
+
+    :meta private:
+
     Args:
         value: The binary blob containing the value data from database.
         type_: Value's type.
@@ -127,6 +185,134 @@ def from_database(value: bytes, type_: Optional[str]) -> Optional[Value]:
     Returns:
         A Python object representing the value.
     """
+    if not _is_parse_cacheable(value):
+        return _parse_db_value(value, type_)
+    key = (value, type_)
+    parsed_value = _parse_cache.get(key)
+    if parsed_value is _parse_cache.MISSING:
+        parsed_value = _parse_db_value(value, type_)
+        if _is_parsed_value_cacheable(parsed_value):
+            _parse_cache.put(key, parsed_value, len(value))
+    return parsed_value
+
+
+class ParseCacheInfo(NamedTuple):
+    """Statistics of the parse cache used by :func:`from_database`."""
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """Returns the statistics of the process-wide parse cache used by :func:`from_database`.
+
+    Returns:
+        cache statistics
+    """
+    return _parse_cache.info()
+
+
+def clear_parse_cache() -> None:
+    """Empties the parse cache used by :func:`from_database` and resets its statistics."""
+    _parse_cache.clear()
+
+
+def set_parse_cache_limits(max_entries: int, max_bytes: int) -> None:
+    """Sets the size limits of the parse cache used by :func:`from_database`.
+
+    Least recently used values are evicted when either limit is exceeded.
+    Setting either limit to 0 disables the cache.
+
+    Args:
+        max_entries: maximum number of cached values
+        max_bytes: maximum total size of the database blobs of cached values
+    """
+    _parse_cache.set_limits(max_entries, max_bytes)
+
+
+class _ParseCache:
+    """A thread-safe LRU cache of parsed values keyed by database blob and type.
+
+    Keying by the blob itself rather than its hash rules out collisions
+    while the hash of a bytes object is computed only once.
+    """
+
+    MISSING = object()
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self._entries: OrderedDict[tuple[bytes, Optional[str]], tuple[Optional[Value], int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple[bytes, Optional[str]]) -> Any:
+        with self._lock:
+            try:
+                parsed_value, _ = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return self.MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return parsed_value
+
+    def put(self, key: tuple[bytes, Optional[str]], parsed_value: Optional[Value], size: int) -> None:
+        with self._lock:
+            if size > self._max_bytes or self._max_entries == 0 or key in self._entries:
+                return
+            self._entries[key] = (parsed_value, size)
+            self._bytes += size
+            self._evict()
+
+    def info(self) -> ParseCacheInfo:
+        with self._lock:
+            return ParseCacheInfo(
+                self._hits, self._misses, len(self._entries), self._bytes, self._max_entries, self._max_bytes
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def set_limits(self, max_entries: int, max_bytes: int) -> None:
+        with self._lock:
+            self._max_entries = max_entries
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self._max_entries or self._bytes > self._max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+
+_parse_cache = _ParseCache(_PARSE_CACHE_DEFAULT_MAX_ENTRIES, _PARSE_CACHE_DEFAULT_MAX_BYTES)
+
+
+def _is_parse_cacheable(value: bytes) -> bool:
+    """Tests if parsed value is worth caching."""
+    return isinstance(value, bytes) and len(value) >= _PARSE_CACHE_MIN_BYTES
+
+
+def _is_parsed_value_cacheable(parsed_value: Optional[Value]) -> bool:
+    """Tests if parsed value can be stored in the parse cache."""
+    return isinstance(parsed_value, (ParameterValue, str, float))
+
+
+def _parse_db_value(value: bytes, type_: Optional[str]) -> Optional[Value]:
+    """Parses a database value without caching."""
+    if is_binary_db_value(value):
+        return _from_binary(value)
     parsed = load_db_value(value, type_)
     if isinstance(parsed, dict):
         return from_dict(parsed)
@@ -137,16 +323,22 @@ def from_database(value: bytes, type_: Optional[str]) -> Optional[Value]:
     return parsed
 
 
-def to_database(parsed_value: Optional[Value]) -> tuple[bytes, Optional[str]]:
+def to_database(parsed_value: Optional[Value], binary: bool = False) -> tuple[bytes, Optional[str]]:
     """
     Converts a Python object representing a parameter value into its DB representation.
 
     Args:
         parsed_value: A Python object representing the value.
+        binary: If True, time series, float arrays and flat maps of floats are encoded in the binary format
+            (see :ref:`binary_value_format`). Other values are encoded as JSON regardless.
 
     Returns:
         The value as a binary blob and its type string.
     """
+    if binary:
+        db_value = _to_binary(parsed_value)
+        if db_value is not None:
+            return db_value, parsed_value.TYPE
     if hasattr(parsed_value, "to_database"):
         return parsed_value.to_database()
     db_value = json.dumps(parsed_value).encode("UTF8")
@@ -247,6 +439,8 @@ def load_db_value(db_value: bytes, type_: Optional[str]) -> Optional[JSONValue]:
     """
     if db_value is None:
         return None
+    if is_binary_db_value(db_value):
+        return {"type": type_, **_from_binary(db_value).to_dict()}
     try:
         parsed = json.loads(db_value)
     except JSONDecodeError as err:
@@ -275,6 +469,19 @@ def dump_db_value(parsed_value: JSONValue) -> tuple[bytes, str]:
     return db_value, value_type
 
 
+def is_binary_db_value(db_value: Optional[bytes]) -> bool:
+    """
+    Tests if a database value is in the binary format.
+
+    Args:
+        db_value: the database value
+
+    Returns:
+        True if the value is in the binary format, False if it is JSON
+    """
+    return isinstance(db_value, bytes) and db_value.startswith(_BINARY_VALUE_MAGIC)
+
+
 def from_database_to_single_value(database_value: bytes, value_type: Optional[str]) -> Union[str, Optional[Value]]:
     """
     Same as :func:`from_database`, but in the case of indexed types returns just the type as a string.
@@ -309,14 +516,153 @@ def from_database_to_dimension_count(database_value: bytes, value_type: Optional
     if value_type in RANK_1_TYPES:
         return 1
     if value_type == Map.TYPE:
-        parsed = load_db_value(database_value, value_type)
-        if "rank" in parsed:
-            return parsed["rank"]
-        map_value = from_dict(parsed)
-        return map_dimensions(map_value)
+        return value_metadata(database_value, value_type).rank
     return 0
 
 
+class ValueMetadata(NamedTuple):
+    """Metadata of a parameter value."""
+
+    type: Optional[str]
+    """Value's type."""
+    rank: int
+    """Number of dimensions; 0 for scalars."""
+    length: Optional[int]
+    """Number of top-level entries in an indexed value; None for scalars."""
+    index_type: Optional[str]
+    """Type of map indexes; None for other values."""
+    index_name: Optional[str]
+    """Name of the top-level index; None for scalars."""
+
+
+def value_metadata(db_value: bytes, value_type: Optional[str]) -> ValueMetadata:
+    """
+    Reads the type, rank, length, index type and index name of a parameter value
+    without parsing the value's data.
+
+    The data of binary values is never touched since it is described by the header.
+    For JSON values, members that precede ``"data"`` are parsed
+    and the top-level entries of ``"data"`` are counted without building Python objects.
+    Values that keep metadata after the data, as written by older versions, or maps without rank
+    fall back to a full parse.
+
+    Args:
+        db_value: The binary blob containing the value data from database.
+        value_type: Value's type.
+
+    Returns:
+        value's metadata
+    """
+    if db_value is None or value_type not in NON_ZERO_RANK_TYPES:
+        return ValueMetadata(value_type, 0, None, None, None)
+    is_map = value_type == Map.TYPE
+    if is_binary_db_value(db_value):
+        kind, header, _ = _unpack_binary(db_value)
+        index_type = {
+            _BINARY_FLOAT_INDEXED_MAP: FLOAT_VALUE_TYPE,
+            _BINARY_DATE_TIME_INDEXED_MAP: DateTime.TYPE,
+        }.get(kind)
+        try:
+            return ValueMetadata(value_type, 1, header["length"], index_type, header["index_name"])
+        except KeyError as error:
+            raise ParameterValueFormatError(f'"{error.args[0]}" is missing in the binary value header') from error
+    probe = _probe_json_value(db_value)
+    if probe is None or (is_map and "rank" not in probe[0]):
+        value_dict = load_db_value(db_value, value_type)
+        if not isinstance(value_dict, dict):
+            raise ParameterValueFormatError(f"Expected a JSON object for {value_type}")
+        data = value_dict.get("data")
+        length = len(data) if isinstance(data, (list, dict)) else None
+        if is_map and "rank" not in value_dict:
+            value_dict["rank"] = map_dimensions(from_dict(value_dict))
+        probe = value_dict, length
+    members, length = probe
+    default_index_name = {
+        Map.TYPE: Map.DEFAULT_INDEX_NAME,
+        TimeSeries.TYPE: TimeSeries.DEFAULT_INDEX_NAME,
+        TimePattern.TYPE: TimePattern.DEFAULT_INDEX_NAME,
+        Array.TYPE: Array.DEFAULT_INDEX_NAME,
+    }[value_type]
+    return ValueMetadata(
+        value_type,
+        members["rank"] if is_map else 1,
+        length,
+        members.get("index_type") if is_map else None,
+        members.get("index_name", default_index_name),
+    )
+
+
+def _probe_json_value(db_value: bytes) -> Optional[tuple[dict, Optional[int]]]:
+    """Parses top-level members of a JSON object up to "data" and counts the entries of "data".
+
+    Args:
+        db_value: JSON object
+
+    Returns:
+        parsed members and the length of "data", or None if "data" is followed by other members
+    """
+    text = db_value.decode("UTF8")
+    members = {}
+    try:
+        position = _JSON_WHITESPACE.match(text).end()
+        if text[position] != "{":
+            raise ParameterValueFormatError("Could not decode the value: expected a JSON object")
+        position = _JSON_WHITESPACE.match(text, position + 1).end()
+        if text[position] == "}":
+            return members, None
+        while True:
+            if text[position] != '"':
+                raise ParameterValueFormatError("Could not decode the value: expected a member name")
+            key, position = scanstring(text, position + 1)
+            position = _JSON_WHITESPACE.match(text, position).end()
+            if text[position] != ":":
+                raise ParameterValueFormatError("Could not decode the value: expected ':'")
+            position = _JSON_WHITESPACE.match(text, position + 1).end()
+            if key == "data":
+                length, is_last = _count_json_container_entries(text, position)
+                return (members, length) if is_last else None
+            members[key], position = _JSON_DECODER.raw_decode(text, position)
+            position = _JSON_WHITESPACE.match(text, position).end()
+            if text[position] == "}":
+                return members, None
+            if text[position] != ",":
+                raise ParameterValueFormatError("Could not decode the value: expected ','")
+            position = _JSON_WHITESPACE.match(text, position + 1).end()
+    except (JSONDecodeError, IndexError) as error:
+        raise ParameterValueFormatError(f"Could not decode the value: {error}") from error
+
+
+def _count_json_container_entries(text: str, position: int) -> tuple[Optional[int], bool]:
+    """Counts the top-level entries of a JSON array or object without parsing it.
+
+    String contents are masked and everything but brackets and commas is removed first.
+    Entries are then separated by the commas that are at the container's own nesting depth.
+
+    Args:
+        text: JSON document
+        position: position of the container
+
+    Returns:
+        number of entries or None if there is no container at ``position``,
+        and a flag that is True if the container is the last member of the enclosing object
+    """
+    masked = _JSON_STRING.sub('""', text[position:])
+    if not masked.startswith(("[", "{")):
+        return None, False
+    if empty_container := _JSON_EMPTY_CONTAINER.match(masked):
+        return 0, masked[empty_container.end() :].lstrip().startswith("}")
+    structure = np.frombuffer(masked.translate(_JSON_KEEP_STRUCTURE_ONLY).encode("ascii"), dtype=np.uint8)
+    opening = (structure == ord("[")) | (structure == ord("{"))
+    closing = (structure == ord("]")) | (structure == ord("}"))
+    depth = np.cumsum(opening.astype(np.int64) - closing)
+    closed = np.flatnonzero(depth == 0)
+    if len(closed) == 0:
+        raise ParameterValueFormatError("Could not decode the value: unbalanced brackets")
+    end = closed[0]
+    separator_count = np.count_nonzero((structure[:end] == ord(",")) & (depth[:end] == 1))
+    return int(separator_count) + 1, bool(end + 1 < len(structure) and structure[end + 1] == ord("}"))
+
+
 def from_dict(value: dict) -> Optional[Value]:
     """
     Converts a dictionary representation of a parameter value into an encoded parameter value.
@@ -364,7 +710,7 @@ def merge(value: tuple[bytes, Optional[str]], other: tuple[bytes, Optional[str]]
     if not hasattr(parsed_value, "merge"):
         return value
     parsed_other = from_database(*other)
-    return to_database(parsed_value.merge(parsed_other))
+    return to_database(parsed_value.merge(parsed_other), binary=is_binary_db_value(value[0]))
 
 
 def merge_parsed(parsed_value: Optional[Value], parsed_other: Optional[Value]) -> Optional[Value]:
@@ -492,16 +838,8 @@ def _time_series_from_dictionary(value_dict: dict) -> TimeSeriesVariableResoluti
         restored time series
     """
     data = value_dict["data"]
-    stamps = []
-    values = np.empty(len(data))
-    for index, (stamp, series_value) in enumerate(data.items()):
-        try:
-            stamp = np.datetime64(stamp, NUMPY_DATETIME64_UNIT)
-        except ValueError as error:
-            raise ParameterValueFormatError(f'Could not decode time stamp "{stamp}"') from error
-        stamps.append(stamp)
-        values[index] = series_value
-    stamps = np.array(stamps)
+    stamps = _time_stamps_from_database(list(data))
+    values = _time_series_values_from_database(list(data.values()))
     ignore_year, repeat = _variable_resolution_time_series_info_from_index(value_dict)
     return TimeSeriesVariableResolution(stamps, values, ignore_year, repeat, value_dict.get("index_name", ""))
 
@@ -573,22 +911,54 @@ def _time_series_from_two_columns(value_dict: dict) -> TimeSeriesVariableResolut
         restored time series
     """
     data = value_dict["data"]
-    stamps = []
-    values = np.empty(len(data))
-    for index, element in enumerate(data):
-        if not isinstance(element, Sequence) or len(element) != 2:
-            raise ParameterValueFormatError("Invalid value in time series array")
-        try:
-            stamp = np.datetime64(element[0], NUMPY_DATETIME64_UNIT)
-        except ValueError as error:
-            raise ParameterValueFormatError(f'Could not decode time stamp "{element[0]}"') from error
-        stamps.append(stamp)
-        values[index] = element[1]
-    stamps = np.array(stamps)
+    try:
+        columns = np.array(data, dtype=np.object_)
+    except ValueError as error:
+        raise ParameterValueFormatError("Invalid value in time series array") from error
+    if columns.ndim != 2 or columns.shape[1] != 2:
+        raise ParameterValueFormatError("Invalid value in time series array")
+    stamps = _time_stamps_from_database(columns[:, 0].tolist())
+    values = _time_series_values_from_database(columns[:, 1].tolist())
     ignore_year, repeat = _variable_resolution_time_series_info_from_index(value_dict)
     return TimeSeriesVariableResolution(stamps, values, ignore_year, repeat, value_dict.get("index_name", ""))
 
 
+def _time_stamps_from_database(stamps: list[str]) -> nptyping.NDArray[np.datetime64]:
+    """Converts time stamps to a NumPy array in one go.
+
+    Args:
+        stamps: time stamps, usually ISO 8601 strings
+
+    Returns:
+        time stamps
+    """
+    try:
+        return np.array(stamps, dtype=NUMPY_DATETIME_DTYPE)
+    except ValueError:
+        # Find the offending stamp for the error message.
+        for stamp in stamps:
+            try:
+                np.datetime64(stamp, NUMPY_DATETIME64_UNIT)
+            except ValueError as error:
+                raise ParameterValueFormatError(f'Could not decode time stamp "{stamp}"') from error
+        raise
+
+
+def _time_series_values_from_database(values: list[float]) -> nptyping.NDArray[np.float64]:
+    """Converts time series values to a NumPy array in one go.
+
+    Args:
+        values: values
+
+    Returns:
+        values
+    """
+    try:
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError) as error:
+        raise ParameterValueFormatError(f"Could not decode time series values: {error}") from error
+
+
 def _time_pattern_from_database(value_dict: dict) -> TimePattern:
     """Converts a time pattern database value into a TimePattern object.
 
@@ -622,13 +992,9 @@ def _map_from_database(value_dict: dict) -> Map:
             indexes = []
             values = []
         else:
-            indexes_in_db = []
-            values_in_db = []
-            for row in data:
-                if not isinstance(row, Sequence) or len(row) != 2:
-                    raise ParameterValueFormatError('"data" is not a nested two column array.')
-                indexes_in_db.append(row[0])
-                values_in_db.append(row[1])
+            if not all(isinstance(row, Sequence) and len(row) == 2 for row in data):
+                raise ParameterValueFormatError('"data" is not a nested two column array.')
+            indexes_in_db, values_in_db = zip(*data)
             indexes = _map_indexes_from_database(indexes_in_db, index_type)
             values = _map_values_from_database(values_in_db)
     else:
@@ -660,6 +1026,8 @@ def _map_index_type_to_database(index_type: MapIndexType) -> str:
 def _map_indexes_from_database(indexes_in_db: Iterable[Union[float, str]], index_type: MapIndexType) -> list[MapIndex]:
     """Converts map's indexes from their database format."""
     try:
+        if index_type is float:
+            return np.array(list(indexes_in_db), dtype=float).tolist()
         indexes = [index_type(index) for index in indexes_in_db]
     except ValueError as error:
         raise ParameterValueFormatError(
@@ -694,6 +1062,8 @@ def _map_values_from_database(values_in_db: Iterable[Optional[Union[bool, float,
     """Converts map's values from their database format."""
     if not values_in_db:
         return []
+    if all(type(value_in_db) is float for value_in_db in values_in_db):
+        return list(values_in_db)
     values = []
     for value_in_db in values_in_db:
         value = from_dict(value_in_db) if isinstance(value_in_db, dict) else value_in_db
@@ -732,6 +1102,167 @@ def _array_from_database(value_dict: dict) -> Array:
     return Array(data, value_type, index_name)
 
 
+def _to_binary(parsed_value: Optional[Value]) -> Optional[bytes]:
+    """Encodes a value in the binary format.
+
+    Args:
+        parsed_value: value to encode
+
+    Returns:
+        encoded value or None if the value has no binary representation
+    """
+    if isinstance(parsed_value, TimeSeriesFixedResolution):
+        header = {
+            "start": str(parsed_value.start),
+            "resolution": [relativedelta_to_duration(step) for step in parsed_value.resolution],
+            "ignore_year": parsed_value.ignore_year,
+            "repeat": parsed_value.repeat,
+            "index_name": parsed_value.index_name,
+        }
+        return _pack_binary(_BINARY_FIXED_RESOLUTION_TIME_SERIES, header, _binary_floats(parsed_value.values))
+    if isinstance(parsed_value, TimeSeriesVariableResolution):
+        header = {
+            "ignore_year": parsed_value.ignore_year,
+            "repeat": parsed_value.repeat,
+            "index_name": parsed_value.index_name,
+        }
+        return _pack_binary(
+            _BINARY_VARIABLE_RESOLUTION_TIME_SERIES,
+            header,
+            _binary_stamps(parsed_value.indexes),
+            _binary_floats(parsed_value.values),
+        )
+    if isinstance(parsed_value, Array):
+        if parsed_value.value_type is not float:
+            return None
+        header = {"index_name": parsed_value.index_name}
+        return _pack_binary(_BINARY_FLOAT_ARRAY, header, _binary_floats(parsed_value.values))
+    if isinstance(parsed_value, Map):
+        if not all(isinstance(value, float) for value in parsed_value.values):
+            return None
+        header = {"index_name": parsed_value.index_name}
+        if parsed_value.index_type is float:
+            return _pack_binary(
+                _BINARY_FLOAT_INDEXED_MAP,
+                header,
+                _binary_floats(parsed_value.indexes),
+                _binary_floats(parsed_value.values),
+            )
+        if parsed_value.index_type is DateTime:
+            stamps = [index.value for index in parsed_value.indexes]
+            if any(stamp.tzinfo is not None or stamp.microsecond != 0 for stamp in stamps):
+                # Not representable by second precision NumPy time stamps.
+                return None
+            return _pack_binary(
+                _BINARY_DATE_TIME_INDEXED_MAP,
+                header,
+                _binary_stamps(np.array(stamps, dtype=NUMPY_DATETIME_DTYPE)),
+                _binary_floats(parsed_value.values),
+            )
+    return None
+
+
+def _binary_floats(values: Sequence[float]) -> nptyping.NDArray:
+    return np.ascontiguousarray(values, dtype=_BINARY_FLOAT_DTYPE)
+
+
+def _binary_stamps(stamps: nptyping.NDArray[np.datetime64]) -> nptyping.NDArray:
+    seconds = np.asarray(stamps, dtype=NUMPY_DATETIME_DTYPE).view(np.int64)
+    return np.ascontiguousarray(seconds, dtype=_BINARY_STAMP_DTYPE)
+
+
+def _pack_binary(kind: int, header: dict, *arrays: nptyping.NDArray) -> bytes:
+    """Packs a JSON header and equally long arrays into a binary value."""
+    header["length"] = len(arrays[0])
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("UTF8")
+    prefix = _BINARY_VALUE_PREFIX.pack(_BINARY_VALUE_MAGIC, _BINARY_VALUE_VERSION, kind, len(header_bytes))
+    padding = bytes(-(len(prefix) + len(header_bytes)) % _BINARY_ARRAY_ALIGNMENT)
+    return b"".join((prefix, header_bytes, padding, *(array.tobytes() for array in arrays)))
+
+
+def _unpack_binary(db_value: bytes) -> tuple[int, dict, int]:
+    """Unpacks the kind, JSON header and offset of the first array of a binary value."""
+    try:
+        _, version, kind, header_length = _BINARY_VALUE_PREFIX.unpack_from(db_value)
+    except struct.error as error:
+        raise ParameterValueFormatError(f"Could not decode the value: {error}") from error
+    if version != _BINARY_VALUE_VERSION:
+        raise ParameterValueFormatError(f"Unsupported binary value version {version}")
+    header_end = _BINARY_VALUE_PREFIX.size + header_length
+    try:
+        header = json.loads(db_value[_BINARY_VALUE_PREFIX.size : header_end])
+    except JSONDecodeError as error:
+        raise ParameterValueFormatError(f"Could not decode the value: {error}") from error
+    return kind, header, header_end + -header_end % _BINARY_ARRAY_ALIGNMENT
+
+
+def _binary_array(db_value: bytes, dtype: np.dtype, count: int, offset: int) -> nptyping.NDArray:
+    """Reads an array from a binary value into a native, writable NumPy array."""
+    try:
+        array = np.frombuffer(db_value, dtype=dtype, count=count, offset=offset)
+    except ValueError as error:
+        raise ParameterValueFormatError(f"Could not decode the value: {error}") from error
+    return array.astype(dtype.newbyteorder("="))
+
+
+def binary_value_arrays(
+    db_value: bytes,
+) -> tuple[int, dict, Optional[nptyping.NDArray], nptyping.NDArray]:
+    """Reads the header and the index and value arrays of a binary value without building a value object.
+
+    :meta private:
+
+    Args:
+        db_value: binary value
+
+    Returns:
+        binary value kind, header, indexes and values;
+        indexes are None for arrays and fixed resolution time series
+    """
+    kind, header, offset = _unpack_binary(db_value)
+    try:
+        length = header["length"]
+    except KeyError as error:
+        raise ParameterValueFormatError(f'"{error.args[0]}" is missing in the binary value header') from error
+    if kind in (_BINARY_FIXED_RESOLUTION_TIME_SERIES, _BINARY_FLOAT_ARRAY):
+        return kind, header, None, _binary_array(db_value, _BINARY_FLOAT_DTYPE, length, offset)
+    if kind in (_BINARY_VARIABLE_RESOLUTION_TIME_SERIES, _BINARY_DATE_TIME_INDEXED_MAP):
+        indexes = _binary_array(db_value, _BINARY_STAMP_DTYPE, length, offset).view(NUMPY_DATETIME_DTYPE)
+    elif kind == _BINARY_FLOAT_INDEXED_MAP:
+        indexes = _binary_array(db_value, _BINARY_FLOAT_DTYPE, length, offset)
+    else:
+        raise ParameterValueFormatError(f"Unknown binary value kind {kind}")
+    second_offset = offset + length * _BINARY_FLOAT_DTYPE.itemsize
+    return kind, header, indexes, _binary_array(db_value, _BINARY_FLOAT_DTYPE, length, second_offset)
+
+
+def _from_binary(db_value: bytes) -> IndexedValue:
+    """Decodes a value in the binary format.
+
+    Args:
+        db_value: binary value
+
+    Returns:
+        decoded value
+    """
+    kind, header, indexes, values = binary_value_arrays(db_value)
+    try:
+        index_name = header["index_name"]
+        if kind == _BINARY_FIXED_RESOLUTION_TIME_SERIES:
+            return TimeSeriesFixedResolution(
+                header["start"], header["resolution"], values, header["ignore_year"], header["repeat"], index_name
+            )
+        if kind == _BINARY_FLOAT_ARRAY:
+            return Array(values.tolist(), float, index_name)
+        if kind == _BINARY_VARIABLE_RESOLUTION_TIME_SERIES:
+            return TimeSeriesVariableResolution(indexes, values, header["ignore_year"], header["repeat"], index_name)
+        if kind == _BINARY_FLOAT_INDEXED_MAP:
+            return Map(indexes.tolist(), values.tolist(), float, index_name)
+        return Map([DateTime(stamp) for stamp in indexes.tolist()], values.tolist(), DateTime, index_name)
+    except KeyError as error:
+        raise ParameterValueFormatError(f'"{error.args[0]}" is missing in the binary value header') from error
+
+
 class ParameterValue:
     """Base for all classes representing parameter values."""
 
@@ -886,14 +1417,21 @@ class _Indexes(np.ndarray):
 
     def __new__(cls, other, dtype=None):
         obj = np.asarray(other, dtype=dtype).view(cls)
-        obj.position_lookup = {index: k for k, index in enumerate(other)}
+        obj._position_lookup = None
         return obj
 
     def __array_finalize__(self, obj):
         if obj is None:
             return
         # pylint: disable=attribute-defined-outside-init
-        self.position_lookup = getattr(obj, "position_lookup", {})
+        self._position_lookup = getattr(obj, "_position_lookup", None)
+
+    @property
+    def position_lookup(self) -> dict:
+        """Lookup from index to position; built on first access."""
+        if self._position_lookup is None:
+            self._position_lookup = {index: k for k, index in enumerate(self)}
+        return self._position_lookup
 
     def __setitem__(self, position, index):
         old_index = self.__getitem__(position)
@@ -1081,9 +1619,10 @@ class Array(IndexedValue):
             data = self._values
         else:
             data = [x.value_to_database_data() for x in self._values]
-        value_dict = {"value_type": value_type_id, "data": data}
+        value_dict = {"value_type": value_type_id}
         if self.index_name != self.DEFAULT_INDEX_NAME:
             value_dict["index_name"] = self.index_name
+        value_dict["data"] = data
         return value_dict
 
 
@@ -1195,9 +1734,10 @@ class TimePattern(IndexedValue):
         self._indexes = _TimePatternIndexes(indexes, dtype=np.object_)
 
     def to_dict(self):
-        value_dict = {"data": dict(zip(self._indexes, self._values))}
+        value_dict = {}
         if self.index_name != self.DEFAULT_INDEX_NAME:
             value_dict["index_name"] = self.index_name
+        value_dict["data"] = dict(zip(self._indexes, self._values))
         return value_dict
 
 
@@ -1394,10 +1934,10 @@ class TimeSeriesFixedResolution(TimeSeries):
                 "ignore_year": self._ignore_year,
                 "repeat": self._repeat,
             },
-            "data": self._values.tolist(),
         }
         if self.index_name != self.DEFAULT_INDEX_NAME:
             value_dict["index_name"] = self.index_name
+        value_dict["data"] = self._values.tolist()
         return value_dict
 
     def get_value(self, index: np.datetime64) -> Optional[np.float64]:
@@ -1439,20 +1979,31 @@ class TimeSeriesVariableResolution(TimeSeries):
         if len(indexes) != len(values):
             raise ParameterValueFormatError("Length of values does not match length of indexes")
         if not isinstance(indexes, np.ndarray):
-            date_times = np.empty(len(indexes), dtype=NUMPY_DATETIME_DTYPE)
-            for i, index in enumerate(indexes):
-                if isinstance(index, DateTime):
-                    date_times[i] = np.datetime64(index.value, NUMPY_DATETIME64_UNIT)
-                else:
-                    try:
-                        date_times[i] = np.datetime64(index, NUMPY_DATETIME64_UNIT)
-                    except ValueError as error:
-                        raise ParameterValueFormatError(
-                            f'Cannot convert "{index}" of type {type(index).__name__} to time stamp.'
-                        ) from error
-            indexes = date_times
+            try:
+                indexes = np.array(
+                    [index.value if isinstance(index, DateTime) else index for index in indexes],
+                    dtype=NUMPY_DATETIME_DTYPE,
+                )
+            except (TypeError, ValueError):
+                indexes = self._indexes_one_by_one(indexes)
         self.indexes = indexes
 
+    @staticmethod
+    def _indexes_one_by_one(indexes):
+        """Converts indexes to time stamps one at a time to report the offending index."""
+        date_times = np.empty(len(indexes), dtype=NUMPY_DATETIME_DTYPE)
+        for i, index in enumerate(indexes):
+            if isinstance(index, DateTime):
+                date_times[i] = np.datetime64(index.value, NUMPY_DATETIME64_UNIT)
+            else:
+                try:
+                    date_times[i] = np.datetime64(index, NUMPY_DATETIME64_UNIT)
+                except ValueError as error:
+                    raise ParameterValueFormatError(
+                        f'Cannot convert "{index}" of type {type(index).__name__} to time stamp.'
+                    ) from error
+        return date_times
+
     def __eq__(self, other):
         if not isinstance(other, TimeSeriesVariableResolution):
             return NotImplemented
@@ -1466,7 +2017,6 @@ class TimeSeriesVariableResolution(TimeSeries):
 
     def to_dict(self):
         value_dict = {}
-        value_dict["data"] = {str(index): float(value) for index, value in zip(self._indexes, self._values)}
         # Add "index" entry only if its contents are not set to their default values.
         if self._ignore_year:
             value_dict.setdefault("index", {})["ignore_year"] = self._ignore_year
@@ -1474,6 +2024,7 @@ class TimeSeriesVariableResolution(TimeSeries):
             value_dict.setdefault("index", {})["repeat"] = self._repeat
         if self.index_name != self.DEFAULT_INDEX_NAME:
             value_dict["index_name"] = self.index_name
+        value_dict["data"] = dict(zip(self._indexes.astype(str).tolist(), self._values.tolist()))
         return value_dict
 
 
@@ -1528,7 +2079,8 @@ class Map(IndexedValue):
         """Returns map's database representation's 'data' dictionary."""
         data = []
         nested_ranks = [0]
-        for index, value in zip(self._indexes, self._values):
+        indexes = self._indexes.tolist() if self._index_type in (float, str) else self._indexes
+        for index, value in zip(indexes, self._values):
             index_in_db = _map_index_to_database(index)
             value_in_db, nested_rank = _map_value_to_database(value)
             nested_ranks.append(nested_rank)
@@ -1540,10 +2092,10 @@ class Map(IndexedValue):
         value_dict = {
             "index_type": _map_index_type_to_database(self._index_type),
             "rank": nested_rank + 1,
-            "data": data,
         }
         if self.index_name != self.DEFAULT_INDEX_NAME:
             value_dict["index_name"] = self.index_name
+        value_dict["data"] = data
         return value_dict
 
 
@@ -1798,10 +2350,10 @@ def deep_copy_value(value: Optional[Value]) -> Optional[Value]:
     Returns:
         deep-copied value
     """
-    if isinstance(value, (SupportsFloat, str)) or value is None:
+    if value is None or isinstance(value, (float, str)) or isinstance(value, SupportsFloat):
         return value
     if isinstance(value, Array):
-        return Array(value.values, value.value_type, value.index_name)
+        return Array(copy(value.values), value.value_type, value.index_name)
     if isinstance(value, DateTime):
         return DateTime(value)
     if isinstance(value, Duration):
@@ -1833,7 +2385,7 @@ def deep_copy_map(value: Map) -> Map:
         deep-copied Map
     """
     xs = value.indexes.copy()
-    ys = [deep_copy_value(y) for y in value.values]
+    ys = [deep_copy_value(y) if isinstance(y, ParameterValue) else y for y in value.values]
     return Map(xs, ys, index_type=value.index_type, index_name=value.index_name)
 
 
@@ -0,0 +1,203 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Database API contributors
+# This file is part of Spine Database API.
+# Spine Database API is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser
+# General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+"""This module contains a resolver for entity activity and parameter values in scenarios of a database mapping."""
+
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+from operator import itemgetter
+from typing import TYPE_CHECKING, Optional
+from .db_mapping_base import MappedItemBase, MappedTable
+from .temp_id import TempId
+
+if TYPE_CHECKING:
+    from .db_mapping import DatabaseMapping
+
+
+class ScenarioResolver:
+    """Answers which alternatives, entity alternatives and parameter values are in effect in a scenario.
+
+    The lookup tables of each scenario are built on first use and kept
+    until the mapped tables they were built from change,
+    so repeated lookups cost a couple of dictionary accesses.
+    Changing parameter values rebuilds only the value tables of a scenario and vice versa,
+    so edits to values do not invalidate the entity activity of a scenario.
+    """
+
+    def __init__(self, db_map: DatabaseMapping):
+        """
+        Args:
+            db_map: database mapping to resolve scenarios of
+        """
+        self._db_map = db_map
+        self._sorted_scenario_alternatives: dict[TempId, tuple[tuple[int, ...], list[MappedItemBase]]] = {}
+        self._entity_activities: dict[TempId, tuple[tuple[int, ...], dict[TempId, bool]]] = {}
+        self._parameter_values: dict[TempId, tuple[tuple[int, ...], dict[tuple[TempId, TempId], MappedItemBase]]] = {}
+
+    def clear(self) -> None:
+        """Drops all lookup tables."""
+        self._sorted_scenario_alternatives.clear()
+        self._entity_activities.clear()
+        self._parameter_values.clear()
+
+    def sorted_scenario_alternatives(self, scenario_id: TempId | int) -> list[MappedItemBase]:
+        """Returns scenario alternatives of a scenario sorted by rank.
+
+        The returned list must not be modified.
+
+        Args:
+            scenario_id: scenario id
+
+        Returns:
+            scenario alternative items from lowest to highest rank
+        """
+        scenario_alternative_table = self._fetched_table("scenario_alternative")
+        scenario_id = self._db_map.mapped_table("scenario").temp_id(scenario_id)
+        change_counts = (scenario_alternative_table.change_count,)
+        cached = self._sorted_scenario_alternatives.get(scenario_id)
+        if cached is not None and cached[0] == change_counts:
+            return cached[1]
+        scenario_alternatives = sorted(
+            (x for x in scenario_alternative_table.candidate_items({"scenario_id": scenario_id}) if x.is_valid()),
+            key=itemgetter("rank"),
+        )
+        self._sorted_scenario_alternatives[scenario_id] = (change_counts, scenario_alternatives)
+        return scenario_alternatives
+
+    def alternative_ids(self, scenario_id: TempId | int) -> list[TempId]:
+        """Returns alternative ids of a scenario sorted by rank.
+
+        Args:
+            scenario_id: scenario id
+
+        Returns:
+            alternative ids from lowest to highest rank
+        """
+        return [x["alternative_id"] for x in self.sorted_scenario_alternatives(scenario_id)]
+
+    def entity_alternative_activity(self, scenario_id: TempId | int, entity_id: TempId | int) -> Optional[bool]:
+        """Returns the activity that the highest ranked entity alternative of an entity sets in a scenario.
+
+        Args:
+            scenario_id: scenario id
+            entity_id: entity id
+
+        Returns:
+            True or False if the entity has entity alternatives in the scenario, None otherwise
+        """
+        activities = self._lookup(
+            scenario_id, "entity_alternative", self._entity_activities, self._build_entity_activities
+        )
+        return activities.get(self._db_map.mapped_table("entity").temp_id(entity_id))
+
+    def is_entity_active(self, scenario_id: TempId | int, entity_id: TempId | int) -> bool:
+        """Checks if an entity is active in a scenario.
+
+        Entities without entity alternatives in the scenario fall back to their class's ``active_by_default``.
+
+        Args:
+            scenario_id: scenario id
+            entity_id: entity id
+
+        Returns:
+            True if entity is active, False otherwise
+        """
+        active = self.entity_alternative_activity(scenario_id, entity_id)
+        if active is not None:
+            return active
+        entity = self._db_map.mapped_table("entity").find_item_by_id(entity_id)
+        return self._db_map.mapped_table("entity_class").find_item_by_id(entity["class_id"])["active_by_default"]
+
+    def parameter_value(
+        self, scenario_id: TempId | int, entity_id: TempId | int, definition_id: TempId | int
+    ) -> Optional[MappedItemBase]:
+        """Returns the parameter value item that is in effect in a scenario.
+
+        Args:
+            scenario_id: scenario id
+            entity_id: entity id
+            definition_id: parameter definition id
+
+        Returns:
+            parameter value item of the highest ranked alternative or None if scenario has no value
+        """
+        values = self._lookup(scenario_id, "parameter_value", self._parameter_values, self._build_parameter_values)
+        entity_id = self._db_map.mapped_table("entity").temp_id(entity_id)
+        definition_id = self._db_map.mapped_table("parameter_definition").temp_id(definition_id)
+        return values.get((entity_id, definition_id))
+
+    def _fetched_table(self, item_type: str) -> MappedTable:
+        """Returns a mapped table making sure it has been fetched from the DB."""
+        mapped_table = self._db_map.mapped_table(item_type)
+        self._db_map.do_fetch_all(mapped_table)
+        return mapped_table
+
+    def _lookup(
+        self,
+        scenario_id: TempId | int,
+        item_type: str,
+        cache: dict[TempId, tuple[tuple[int, ...], dict]],
+        build: Callable[[list[MappedItemBase], MappedTable], dict],
+    ) -> dict:
+        """Returns a lookup table of a scenario building it if it is missing or out of date.
+
+        Args:
+            scenario_id: scenario id
+            item_type: type of items the lookup table is built from
+            cache: lookup tables by scenario id
+            build: function that builds the lookup table from sorted scenario alternatives and mapped table
+
+        Returns:
+            lookup table
+        """
+        scenario_alternatives = self.sorted_scenario_alternatives(scenario_id)
+        scenario_id = self._db_map.mapped_table("scenario").temp_id(scenario_id)
+        mapped_table = self._fetched_table(item_type)
+        change_counts = (self._db_map.mapped_table("scenario_alternative").change_count, mapped_table.change_count)
+        cached = cache.get(scenario_id)
+        if cached is not None and cached[0] == change_counts:
+            return cached[1]
+        lookup = build(scenario_alternatives, mapped_table)
+        cache[scenario_id] = (change_counts, lookup)
+        return lookup
+
+    def _build_entity_activities(
+        self, scenario_alternatives: list[MappedItemBase], entity_alternative_table: MappedTable
+    ) -> dict[TempId, bool]:
+        entity_table = self._db_map.mapped_table("entity")
+        activities = {}
+        for item in self._items_by_rank(scenario_alternatives, entity_alternative_table):
+            activities[entity_table.temp_id(item["entity_id"])] = item["active"]
+        return activities
+
+    def _build_parameter_values(
+        self, scenario_alternatives: list[MappedItemBase], parameter_value_table: MappedTable
+    ) -> dict[tuple[TempId, TempId], MappedItemBase]:
+        entity_table = self._db_map.mapped_table("entity")
+        definition_table = self._db_map.mapped_table("parameter_definition")
+        values = {}
+        for item in self._items_by_rank(scenario_alternatives, parameter_value_table):
+            entity_id = entity_table.temp_id(item["entity_id"])
+            values[entity_id, definition_table.temp_id(item["parameter_definition_id"])] = item
+        return values
+
+    @staticmethod
+    def _items_by_rank(
+        scenario_alternatives: list[MappedItemBase], mapped_table: MappedTable
+    ) -> Iterator[MappedItemBase]:
+        """Yields valid items of the alternatives of a scenario from lowest to highest rank.
+
+        Alternative id is a reference field, so the candidate items are exact matches.
+        """
+        for scenario_alternative in scenario_alternatives:
+            for item in mapped_table.candidate_items({"alternative_id": scenario_alternative["alternative_id"]}):
+                if item.is_valid():
+                    yield item
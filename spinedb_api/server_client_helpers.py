@@ -10,7 +10,10 @@
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ######################################################################################################################
 
+import asyncio
 import json
+import struct
+import pyarrow
 from .db_mapping_base import PublicItem
 from .exception import SpineDBAPIError
 from .temp_id import TempId
@@ -20,6 +23,9 @@ _START_OF_TAIL = "\u001f"  # Unit separator
 _START_OF_ADDRESS = "\u0091"  # Private Use 1
 _ADDRESS_SEP = ":"
 
+_FRAME_HEADER = struct.Struct("!I?Q")
+"""Header of a message sent over a persistent connection: request id, 'more messages follow' flag and message length."""
+
 
 class ReceiveAllMixing:
     _ENCODING = "utf-8"
@@ -35,13 +41,137 @@ class ReceiveAllMixing:
         Returns:
             str
         """
-        fragments = []
-        while True:
-            chunk = self.request.recv(self._BUFF_SIZE)
-            fragments.append(chunk)
-            if chunk.endswith(self._BEOT):
-                break
-        return b"".join(fragments)[:-1]
+        return receive_until_eot(self.request)
+
+
+def receive_until_eot(sock):
+    """
+    Receives a message terminated by the end of transmission character from a socket.
+
+    Args:
+        sock (socket.socket): socket to receive from
+
+    Returns:
+        bytes: message without the terminating character
+    """
+    fragments = []
+    while True:
+        chunk = sock.recv(ReceiveAllMixing._BUFF_SIZE)
+        fragments.append(chunk)
+        if not chunk:
+            raise ConnectionError("connection closed before end of message")
+        if chunk.endswith(ReceiveAllMixing._BEOT):
+            break
+    return b"".join(fragments)[:-1]
+
+
+def send_frame(sock, request_id, message, more=False):
+    """
+    Sends a length-prefixed message over a persistent connection.
+
+    Args:
+        sock (socket.socket): socket to send to
+        request_id (int): id that pairs the message with its response
+        message (bytes): encoded message
+        more (bool): True if more messages with the same request id follow
+    """
+    sock.sendall(pack_frame(request_id, message, more))
+
+
+def pack_frame(request_id, message, more=False):
+    """
+    Prefixes a message with a frame header.
+
+    Args:
+        request_id (int): id that pairs the message with its response
+        message (bytes): encoded message
+        more (bool): True if more messages with the same request id follow
+
+    Returns:
+        bytes: framed message
+    """
+    return _FRAME_HEADER.pack(request_id, more, len(message)) + message
+
+
+def receive_frame(sock):
+    """
+    Receives a length-prefixed message from a persistent connection.
+
+    Args:
+        sock (socket.socket): socket to receive from
+
+    Returns:
+        tuple(int,bytes,bool): request id, encoded message and 'more messages follow' flag,
+            or None if the connection was closed between messages
+    """
+    header = _receive_exactly(sock, _FRAME_HEADER.size)
+    if header is None:
+        return None
+    request_id, more, length = _FRAME_HEADER.unpack(header)
+    message = _receive_exactly(sock, length) if length else b""
+    if message is None:
+        raise ConnectionError("connection closed in the middle of a message")
+    return request_id, message, more
+
+
+def _receive_exactly(sock, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            if received == 0:
+                return None
+            raise ConnectionError("connection closed in the middle of a message")
+        received += count
+    return bytes(buffer)
+
+
+async def read_until_eot(reader):
+    """
+    Reads a message terminated by the end of transmission character from an asyncio stream.
+
+    Args:
+        reader (asyncio.StreamReader): stream to read from
+
+    Returns:
+        bytes: message without the terminating character
+    """
+    fragments = []
+    while True:
+        chunk = await reader.read(ReceiveAllMixing._BUFF_SIZE)
+        fragments.append(chunk)
+        if not chunk:
+            raise ConnectionError("connection closed before end of message")
+        if chunk.endswith(ReceiveAllMixing._BEOT):
+            break
+    return b"".join(fragments)[:-1]
+
+
+async def read_frame(reader):
+    """
+    Reads a length-prefixed message from a persistent connection's asyncio stream.
+
+    Args:
+        reader (asyncio.StreamReader): stream to read from
+
+    Returns:
+        tuple(int,bytes,bool): request id, encoded message and 'more messages follow' flag,
+            or None if the connection was closed between messages
+    """
+    try:
+        header = await reader.readexactly(_FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as error:
+        if not error.partial:
+            return None
+        raise ConnectionError("connection closed in the middle of a message") from None
+    request_id, more, length = _FRAME_HEADER.unpack(header)
+    try:
+        message = await reader.readexactly(length) if length else b""
+    except asyncio.IncompleteReadError:
+        raise ConnectionError("connection closed in the middle of a message") from None
+    return request_id, message, more
 
 
 class _TailJSONEncoder(json.JSONEncoder):
@@ -115,7 +245,7 @@ def decode(b):
     Returns:
         any: Decoded object.
     """
-    body, tail = b.split(_START_OF_TAIL.encode())
+    body, tail = b.split(_START_OF_TAIL.encode(), 1)
     o = json.loads(body)
     return _expand_addresses_in_place(o, tail)
 
@@ -136,3 +266,80 @@ def _expand_addresses_in_place(o, tail):
         fr, to = (int(x) for x in address.split(_ADDRESS_SEP))
         return tail[fr : to + 1]
     return o
+
+
+def encode_columnar_table(rows, column_names=None):
+    """
+    Encodes rows into an Arrow IPC stream.
+
+    Columns are typed by Arrow's type inference.
+    Columns that mix strings and sequences, such as entity names and element name lists,
+    become dense unions; sequences with elements of different types become structs with positional field names.
+
+    Args:
+        rows (Sequence of Sequence): rows to encode; shorter rows are padded with nulls
+        column_names (Sequence of str, optional): column names; defaults to column positions
+
+    Returns:
+        bytes: Arrow IPC stream
+    """
+    column_count = len(column_names) if column_names is not None else max((len(row) for row in rows), default=0)
+    if column_names is None:
+        column_names = [str(i) for i in range(column_count)]
+    columns = [[row[i] if i < len(row) else None for row in rows] for i in range(column_count)]
+    table = pyarrow.Table.from_arrays([_column_to_arrow(column) for column in columns], names=list(column_names))
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def decode_columnar_table(b):
+    """
+    Decodes an Arrow IPC stream created by :func:`encode_columnar_table`.
+
+    Args:
+        b (bytes): Arrow IPC stream
+
+    Returns:
+        pyarrow.Table: decoded table
+    """
+    return pyarrow.ipc.open_stream(b).read_all()
+
+
+def _column_to_arrow(values):
+    try:
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        pass
+    groups = {}
+    kinds = []
+    for value in values:
+        kind = list if isinstance(value, (tuple, list)) else type(value)
+        kinds.append(kind)
+        groups.setdefault(kind, []).append(value)
+    if set(groups) <= {list, type(None)}:
+        return _sequences_to_struct(values)
+    kind_order = list(groups)
+    type_codes = {kind: code for code, kind in enumerate(kind_order)}
+    counts = dict.fromkeys(kind_order, 0)
+    offsets = []
+    for kind in kinds:
+        offsets.append(counts[kind])
+        counts[kind] += 1
+    return pyarrow.UnionArray.from_dense(
+        pyarrow.array([type_codes[kind] for kind in kinds], type=pyarrow.int8()),
+        pyarrow.array(offsets, type=pyarrow.int32()),
+        [_column_to_arrow(groups[kind]) for kind in kind_order],
+        [kind.__name__ for kind in kind_order],
+    )
+
+
+def _sequences_to_struct(values):
+    width = max((len(value) for value in values if value is not None), default=0)
+    fields = [
+        _column_to_arrow([value[i] if value is not None and i < len(value) else None for value in values])
+        for i in range(width)
+    ]
+    mask = pyarrow.array([value is None for value in values], type=pyarrow.bool_())
+    return pyarrow.StructArray.from_arrays(fields, names=[str(i) for i in range(width)], mask=mask)
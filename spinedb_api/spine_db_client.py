@@ -10,16 +10,35 @@
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ######################################################################################################################
 
-"""This module defines the :class:`SpineDBClient` class."""
+"""This module defines the :class:`SpineDBClient` and :class:`AsyncSpineDBClient` classes."""
 
 from __future__ import annotations
-from collections.abc import Iterator
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
+import itertools
+import os
+from queue import Empty, Full, Queue
 import socket
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlparse
 from sqlalchemy.engine.url import URL
-from .server_client_helpers import ReceiveAllMixing, decode, encode
+from .exception import SpineDBAPIError
+from .server_client_helpers import (
+    ReceiveAllMixing,
+    decode,
+    decode_columnar_table,
+    encode,
+    pack_frame,
+    read_frame,
+    read_until_eot,
+    receive_frame,
+    receive_until_eot,
+    send_frame,
+)
 
 if TYPE_CHECKING:
     from .db_mapping import DatabaseMapping
@@ -28,26 +47,25 @@ client_version = 8
 
 
 class SpineDBClient(ReceiveAllMixing):
-    def __init__(self, server_address):
+    def __init__(self, server_address, timeout=None):
         """Enables sending requests to a Spine DB server.
 
         Args:
             server_address (tuple(str,int)): the hostname and port where the server is listening.
+            timeout (float, optional): seconds to wait for a response; if None, waits indefinitely
         """
         self._server_address = server_address
-        self.request = None
+        self._timeout = timeout
 
     @classmethod
-    def from_server_url(cls, url):
+    def from_server_url(cls, url, timeout=None):
         """Creates a client from a server's URL.
 
         Args:
             url (str, URL): the URL where the server is listening.
+            timeout (float, optional): seconds to wait for a response; if None, waits indefinitely
         """
-        parsed = urlparse(url)
-        if parsed.scheme != "http":
-            raise ValueError(f"unable to create client, invalid server url {url}")
-        return cls((parsed.hostname, parsed.port))
+        return cls(_server_address_from_url(url), timeout)
 
     def get_db_url(self):
         """Returns the URL of the target Spine DB - the one the server is set to communicate with.
@@ -91,13 +109,36 @@ class SpineDBClient(ReceiveAllMixing):
         """
         return self._send("import_data", args=(data, comment))
 
-    def export_data(self, **kwargs):
+    def export_data(self, columnar=False, **kwargs):
         """Exports data from the DB using :func:`~spinedb_api.export_functions.export_data`.
 
         Args:
+            columnar (bool): If True, each item type is transferred as an Arrow IPC stream
+                and returned as :class:`pyarrow.Table` with a column per position in the exported tuples.
+                Values are structs of ``value`` and ``type``.
             **kwargs: keyword arguments passed to :func:`~spinedb_api.import_functions.export_data`
         """
-        return self._send("export_data", kwargs=kwargs)
+        if not columnar:
+            return self._send("export_data", kwargs=kwargs)
+        return _decode_columnar_result(self._send("export_data", kwargs=dict(kwargs, columnar=True)))
+
+    def iter_export_data(self, chunk_size=10000, columnar=False, **kwargs) -> Iterator[tuple[str, Any]]:
+        """Exports data from the DB like :meth:`export_data` but yields the result in chunks.
+
+        The server sends the chunks one by one, so neither end holds the entire encoded result in memory.
+
+        Args:
+            chunk_size (int): maximum number of exported items in a chunk
+            columnar (bool): If True, chunks are returned as :class:`pyarrow.Table`, see :meth:`export_data`.
+            **kwargs: keyword arguments passed to :func:`~spinedb_api.import_functions.export_data`
+
+        Yields:
+            tuple: item type key and a chunk of exported items
+        """
+        if columnar:
+            kwargs["columnar"] = True
+        for key, chunk in self._iter("iter_export_data", args=(chunk_size,), kwargs=kwargs):
+            yield key, decode_columnar_table(chunk) if columnar else chunk
 
     def call_method(self, method_name, *args, **kwargs):
         """Calls a method from :class:`~spinedb_api.db_mapping.DatabaseMapping`.
@@ -109,8 +150,31 @@ class SpineDBClient(ReceiveAllMixing):
         """
         return self._send("call_method", args=(method_name, *args), kwargs=kwargs)
 
-    def query(self, query_name: str, *args, **kwargs) -> dict:
-        return self._send("query", args=(query_name, *args), kwargs=kwargs)
+    def query(self, query_name: str, *args, columnar: bool = False) -> dict:
+        """Runs queries on the DB.
+
+        Args:
+            query_name: name of a subquery property of :class:`~spinedb_api.db_mapping.DatabaseMapping`
+            *args: names of further subqueries
+            columnar: If True, results are transferred as Arrow IPC streams and returned as :class:`pyarrow.Table`.
+        """
+        if not columnar:
+            return self._send("query", args=(query_name, *args))
+        return _decode_columnar_result(self._send("query", args=(query_name, *args), kwargs={"columnar": True}))
+
+    def iter_query(self, query_name: str, chunk_size: int = 10000, columnar: bool = False) -> Iterator[Any]:
+        """Runs a query on the DB and yields the result in chunks as the server reads it from the DB.
+
+        Args:
+            query_name: name of a subquery property of :class:`~spinedb_api.db_mapping.DatabaseMapping`
+            chunk_size: maximum number of rows in a chunk
+            columnar: If True, chunks are returned as :class:`pyarrow.Table`.
+
+        Yields:
+            list of dict or :class:`pyarrow.Table`: chunks of rows
+        """
+        for chunk in self._iter("iter_query", args=(query_name, chunk_size), kwargs=_columnar_kwargs(columnar)):
+            yield decode_columnar_table(chunk) if columnar else chunk
 
     def acquire_lock(self) -> None:
         return self._send("acquire_lock")
@@ -133,15 +197,649 @@ class SpineDBClient(ReceiveAllMixing):
         args = () if args is None else args
         kwargs = {} if kwargs is None else kwargs
         msg = encode((request, args, kwargs, client_version))
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as self.request:
-            self.request.connect(self._server_address)
-            self.request.sendall(msg + self._BEOT)
+        for attempt in range(2):
+            connection = _connection_pool.connection(self._server_address)
+            if connection is None:
+                return self._send_over_single_request_connection(msg, receive)
+            try:
+                response = connection.send(msg)
+                break
+            except OSError:
+                # The message was not sent so it is safe to retry once over a fresh connection.
+                if attempt > 0:
+                    raise
+        if receive:
+            try:
+                return decode(response.result(timeout=self._timeout))
+            except FutureTimeoutError as error:
+                connection.forget(response)
+                raise SpineDBAPIError(
+                    f"DB server did not respond to '{request}' within {self._timeout} seconds"
+                ) from error
+        return None
+
+    def _iter(self, request, args, kwargs):
+        """
+        Sends a streaming request to the server and yields the result chunks.
+
+        Streams use a dedicated connection so a slow consumer does not hold up other requests.
+
+        Args:
+            request (str): One of the supported streaming requests
+            args: Request arguments
+            kwargs: Request keyword arguments
+
+        Yields:
+            Any: result chunks
+        """
+        msg = encode((request, args, kwargs, client_version))
+        connection = _open_connection(self._server_address)
+        if connection is None:
+            raise SpineDBAPIError("DB server does not support streaming responses; please update the server")
+        try:
+            for message in connection.stream(msg):
+                response = decode(message)
+                if "error" in response:
+                    raise SpineDBAPIError(str(response["error"]))
+                if "chunk" in response:
+                    yield response["chunk"]
+        finally:
+            connection.close()
+
+    def _send_over_single_request_connection(self, msg, receive):
+        """Sends a message to a server that does not support persistent connections.
+
+        Args:
+            msg (bytes): encoded message
+            receive (bool): If True, also receives the response and returns it.
+
+        Returns:
+            Any: response, or None if receive is False
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self._timeout)
+            sock.connect(self._server_address)
+            sock.sendall(msg + self._BEOT)
             if receive:
-                response = self._recvall()
+                response = receive_until_eot(sock)
                 return decode(response)
         return None
 
 
+def _server_address_from_url(url):
+    parsed = urlparse(url)
+    if parsed.scheme != "http":
+        raise ValueError(f"unable to create client, invalid server url {url}")
+    return parsed.hostname, parsed.port
+
+
+def _columnar_kwargs(columnar):
+    return {"columnar": True} if columnar else {}
+
+
+def _decode_columnar_result(response):
+    if "result" not in response:
+        return response
+    return {"result": {key: decode_columnar_table(table) for key, table in response["result"].items()}}
+
+
+class _Connection:
+    """A persistent connection to a DB server.
+
+    Any number of threads may send requests over the connection simultaneously.
+    Responses are paired with requests by request id
+    so the server can answer the requests in any order."""
+
+    def __init__(self, sock):
+        """
+        Args:
+            sock (socket.socket): connected socket that has negotiated a persistent connection with the server
+        """
+        self._socket = sock
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending = {}
+        self._request_ids = itertools.count(1)
+        self.closed = False
+        self._receiver = threading.Thread(target=self._receive_responses, daemon=True)
+        self._receiver.start()
+
+    @property
+    def outstanding_request_count(self):
+        """Number of requests that have not been responded to yet."""
+        return len(self._pending)
+
+    def send(self, msg):
+        """Sends a message to the server.
+
+        Args:
+            msg (bytes): encoded message
+
+        Returns:
+            Future: future that resolves to the encoded response
+        """
+        future = Future()
+        self._send_request(msg, future)
+        return future
+
+    def forget(self, future):
+        """Stops waiting for the response of a request; a late response is discarded.
+
+        Args:
+            future (Future): future returned by :meth:`send`
+        """
+        with self._pending_lock:
+            for request_id, pending in self._pending.items():
+                if pending is future:
+                    del self._pending[request_id]
+                    break
+
+    def stream(self, msg, max_queued_responses=4):
+        """Sends a message to the server and yields responses until the last one.
+
+        The connection stops reading from the socket while the consumer is behind,
+        so only streams should be sent over connections used for streaming.
+
+        Args:
+            msg (bytes): encoded message
+            max_queued_responses (int): maximum number of received responses waiting for the consumer
+
+        Yields:
+            bytes: encoded responses
+        """
+        responses = Queue(maxsize=max_queued_responses)
+        self._send_request(msg, responses)
+        while True:
+            try:
+                response = responses.get(timeout=0.5)
+            except Empty:
+                if self.closed and responses.empty():
+                    raise ConnectionError("connection to DB server was closed")
+                continue
+            if isinstance(response, Exception):
+                raise response
+            message, more = response
+            yield message
+            if not more:
+                return
+
+    def _send_request(self, msg, pending):
+        with self._pending_lock:
+            if self.closed:
+                raise ConnectionError("connection to DB server has been closed")
+            request_id = next(self._request_ids) % 2**32
+            self._pending[request_id] = pending
+        try:
+            with self._send_lock:
+                send_frame(self._socket, request_id, msg)
+        except OSError:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            self.close()
+            raise
+
+    def close(self):
+        """Closes the connection failing all outstanding requests."""
+        with self._pending_lock:
+            if self.closed:
+                return
+            self.closed = True
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+    def _receive_responses(self):
+        error = ConnectionError("connection to DB server was closed")
+        try:
+            while True:
+                frame = receive_frame(self._socket)
+                if frame is None:
+                    break
+                request_id, response, more = frame
+                with self._pending_lock:
+                    pending = self._pending.get(request_id)
+                    if not more:
+                        self._pending.pop(request_id, None)
+                if isinstance(pending, Future):
+                    if not more:
+                        pending.set_result(response)
+                elif pending is not None:
+                    while not self.closed:
+                        try:
+                            pending.put((response, more), timeout=0.5)
+                            break
+                        except Full:
+                            continue
+        except OSError as receive_error:
+            error = receive_error
+        with self._pending_lock:
+            self.closed = True
+            pending_requests = list(self._pending.values())
+            self._pending.clear()
+        for pending in pending_requests:
+            if isinstance(pending, Future):
+                pending.set_exception(error)
+            else:
+                try:
+                    pending.put_nowait(error)
+                except Full:
+                    pass
+        self._socket.close()
+
+
+def _open_connection(server_address) -> Optional[_Connection]:
+    """Opens a persistent connection to a DB server.
+
+    Args:
+        server_address (tuple(str,int)): the hostname and port where the server is listening.
+
+    Returns:
+        persistent connection or None if the server supports only single request connections
+    """
+    sock = socket.create_connection(server_address)
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.sendall(encode(("open_connection", (), {}, client_version)) + ReceiveAllMixing._BEOT)
+        response = decode(receive_until_eot(sock))
+    except Exception:
+        sock.close()
+        raise
+    if not _accepts_persistent_connection(response):
+        sock.close()
+        return None
+    return _Connection(sock)
+
+
+def _accepts_persistent_connection(response) -> bool:
+    # Servers without persistent connections reject open_connection as an invalid request.
+    return isinstance(response, dict) and "error" not in response and isinstance(response.get("result"), int)
+
+
+class _ConnectionPool:
+    """Keeps persistent connections to DB servers for reuse.
+
+    A new connection is opened only if all existing connections to a server are busy
+    and the number of connections is below the limit."""
+
+    def __init__(self, max_connections_per_server=4):
+        """
+        Args:
+            max_connections_per_server (int): maximum number of connections to a single server
+        """
+        self._max_connections = max_connections_per_server
+        self.reset()
+
+    def reset(self):
+        """Forgets all connections without closing them."""
+        self._lock = threading.Lock()
+        self._server_locks = {}
+        self._connections = {}
+        self._single_request_servers = set()
+
+    def connection(self, server_address) -> Optional[_Connection]:
+        """Returns a connection to given server.
+
+        Args:
+            server_address (tuple(str,int)): the hostname and port where the server is listening.
+
+        Returns:
+            persistent connection or None if the server supports only single request connections
+        """
+        server_address = tuple(server_address)
+        with self._lock:
+            server_lock = self._server_locks.setdefault(server_address, threading.Lock())
+        with server_lock:
+            if server_address in self._single_request_servers:
+                return None
+            connections = [c for c in self._connections.get(server_address, []) if not c.closed]
+            self._connections[server_address] = connections
+            least_busy = min(connections, key=lambda c: c.outstanding_request_count, default=None)
+            if least_busy is not None and (
+                least_busy.outstanding_request_count == 0 or len(connections) >= self._max_connections
+            ):
+                return least_busy
+            connection = _open_connection(server_address)
+            if connection is None:
+                self._single_request_servers.add(server_address)
+            else:
+                connections.append(connection)
+            return connection
+
+    def close(self):
+        """Closes all connections."""
+        with self._lock:
+            connections = [c for server_connections in self._connections.values() for c in server_connections]
+            self._connections = {}
+        for connection in connections:
+            connection.close()
+
+
+_connection_pool = _ConnectionPool()
+if hasattr(os, "register_at_fork"):
+    # Sockets and receiver threads belong to the parent process.
+    os.register_at_fork(after_in_child=_connection_pool.reset)
+
+
+class AsyncSpineDBClient:
+    """Sends requests to a Spine DB server from asyncio code.
+
+    Requests from any number of tasks share a single persistent connection to the server,
+    so waiting for a response does not occupy a thread.
+    The client must be used from one event loop only.
+    It is an asynchronous context manager that closes the connection on exit."""
+
+    def __init__(self, server_address):
+        """
+        Args:
+            server_address (tuple(str,int)): the hostname and port where the server is listening.
+        """
+        self._server_address = tuple(server_address)
+        self._connection = None
+        self._connection_lock = asyncio.Lock()
+        self._single_request_server = False
+
+    @classmethod
+    def from_server_url(cls, url):
+        """Creates a client from a server's URL.
+
+        Args:
+            url (str, URL): the URL where the server is listening.
+        """
+        return cls(_server_address_from_url(url))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the connection to the server."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def get_db_url(self):
+        """See :meth:`SpineDBClient.get_db_url`."""
+        return await self._send("get_db_url")
+
+    async def db_checkin(self):
+        """See :meth:`SpineDBClient.db_checkin`."""
+        return await self._send("db_checkin")
+
+    async def db_checkout(self):
+        """See :meth:`SpineDBClient.db_checkout`."""
+        return await self._send("db_checkout")
+
+    async def cancel_db_checkout(self):
+        """See :meth:`SpineDBClient.cancel_db_checkout`."""
+        return await self._send("cancel_db_checkout")
+
+    async def apply_filters(self, filters: dict) -> dict:
+        """See :meth:`SpineDBClient.apply_filters`."""
+        return await self._send("apply_filters", args=(filters,))
+
+    async def clear_filters(self) -> dict:
+        """See :meth:`SpineDBClient.clear_filters`."""
+        return await self._send("clear_filters")
+
+    async def import_data(self, data, comment):
+        """See :meth:`SpineDBClient.import_data`."""
+        return await self._send("import_data", args=(data, comment))
+
+    async def export_data(self, columnar=False, **kwargs):
+        """See :meth:`SpineDBClient.export_data`."""
+        if not columnar:
+            return await self._send("export_data", kwargs=kwargs)
+        return _decode_columnar_result(await self._send("export_data", kwargs=dict(kwargs, columnar=True)))
+
+    async def iter_export_data(self, chunk_size=10000, columnar=False, **kwargs) -> AsyncIterator[tuple[str, Any]]:
+        """See :meth:`SpineDBClient.iter_export_data`."""
+        if columnar:
+            kwargs["columnar"] = True
+        async for key, chunk in self._iter("iter_export_data", args=(chunk_size,), kwargs=kwargs):
+            yield key, decode_columnar_table(chunk) if columnar else chunk
+
+    async def call_method(self, method_name, *args, **kwargs):
+        """See :meth:`SpineDBClient.call_method`."""
+        return await self._send("call_method", args=(method_name, *args), kwargs=kwargs)
+
+    async def query(self, query_name: str, *args, columnar: bool = False) -> dict:
+        """See :meth:`SpineDBClient.query`."""
+        if not columnar:
+            return await self._send("query", args=(query_name, *args))
+        response = await self._send("query", args=(query_name, *args), kwargs={"columnar": True})
+        return _decode_columnar_result(response)
+
+    async def iter_query(self, query_name: str, chunk_size: int = 10000, columnar: bool = False) -> AsyncIterator[Any]:
+        """See :meth:`SpineDBClient.iter_query`."""
+        async for chunk in self._iter("iter_query", args=(query_name, chunk_size), kwargs=_columnar_kwargs(columnar)):
+            yield decode_columnar_table(chunk) if columnar else chunk
+
+    async def acquire_lock(self) -> None:
+        return await self._send("acquire_lock")
+
+    async def release_lock(self) -> None:
+        return await self._send("release_lock")
+
+    async def _send(self, request, args=None, kwargs=None):
+        """
+        Sends a request to the server with the given arguments and returns the response.
+
+        Args:
+            request (str): One of the supported engine server requests
+            args: Request arguments
+            kwargs: Request keyword arguments
+
+        Returns:
+            Any: response
+        """
+        args = () if args is None else args
+        kwargs = {} if kwargs is None else kwargs
+        msg = encode((request, args, kwargs, client_version))
+        for attempt in range(2):
+            connection = await self._get_connection()
+            if connection is None:
+                return await self._send_over_single_request_connection(msg)
+            try:
+                response = await connection.send(msg)
+                break
+            except OSError:
+                # The message was not sent so it is safe to retry once over a fresh connection.
+                if attempt > 0:
+                    raise
+        return decode(await response)
+
+    async def _iter(self, request, args, kwargs):
+        """
+        Sends a streaming request to the server and yields the result chunks.
+
+        Streams use a dedicated connection so a slow consumer does not hold up other requests.
+
+        Args:
+            request (str): One of the supported streaming requests
+            args: Request arguments
+            kwargs: Request keyword arguments
+
+        Yields:
+            Any: result chunks
+        """
+        msg = encode((request, args, kwargs, client_version))
+        connection = await _open_async_connection(self._server_address)
+        if connection is None:
+            raise SpineDBAPIError("DB server does not support streaming responses; please update the server")
+        try:
+            async for message in connection.stream(msg):
+                response = decode(message)
+                if "error" in response:
+                    raise SpineDBAPIError(str(response["error"]))
+                if "chunk" in response:
+                    yield response["chunk"]
+        finally:
+            connection.close()
+
+    async def _get_connection(self):
+        async with self._connection_lock:
+            if self._single_request_server:
+                return None
+            if self._connection is None or self._connection.closed:
+                self._connection = await _open_async_connection(self._server_address)
+                if self._connection is None:
+                    self._single_request_server = True
+            return self._connection
+
+    async def _send_over_single_request_connection(self, msg):
+        """Sends a message to a server that does not support persistent connections.
+
+        Args:
+            msg (bytes): encoded message
+
+        Returns:
+            Any: response
+        """
+        reader, writer = await asyncio.open_connection(*self._server_address)
+        try:
+            writer.write(msg + ReceiveAllMixing._BEOT)
+            await writer.drain()
+            return decode(await read_until_eot(reader))
+        finally:
+            writer.close()
+
+
+class _AsyncConnection:
+    """A persistent connection to a DB server for asyncio code.
+
+    Any number of tasks may send requests over the connection simultaneously.
+    Responses are paired with requests by request id like in :class:`_Connection`."""
+
+    def __init__(self, reader, writer):
+        """
+        Args:
+            reader (asyncio.StreamReader): reader of a connection
+                that has negotiated a persistent connection with the server
+            writer (asyncio.StreamWriter): writer of the same connection
+        """
+        self._reader = reader
+        self._writer = writer
+        self._pending = {}
+        self._request_ids = itertools.count(1)
+        self.closed = False
+        self._receiver = asyncio.create_task(self._receive_responses())
+
+    async def send(self, msg):
+        """Sends a message to the server.
+
+        Args:
+            msg (bytes): encoded message
+
+        Returns:
+            asyncio.Future: future that resolves to the encoded response
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._send_request(msg, future)
+        return future
+
+    async def stream(self, msg, max_queued_responses=4):
+        """Sends a message to the server and yields responses until the last one.
+
+        The connection stops reading from the socket while the consumer is behind,
+        so only streams should be sent over connections used for streaming.
+
+        Args:
+            msg (bytes): encoded message
+            max_queued_responses (int): maximum number of received responses waiting for the consumer
+
+        Yields:
+            bytes: encoded responses
+        """
+        responses = asyncio.Queue(maxsize=max_queued_responses)
+        await self._send_request(msg, responses)
+        while True:
+            response = await responses.get()
+            if isinstance(response, Exception):
+                raise response
+            message, more = response
+            yield message
+            if not more:
+                return
+
+    async def _send_request(self, msg, pending):
+        if self.closed:
+            raise ConnectionError("connection to DB server has been closed")
+        request_id = next(self._request_ids) % 2**32
+        self._pending[request_id] = pending
+        try:
+            self._writer.write(pack_frame(request_id, msg))
+            await self._writer.drain()
+        except OSError:
+            self._pending.pop(request_id, None)
+            self.close()
+            raise
+
+    def close(self):
+        """Closes the connection failing all outstanding requests."""
+        if self.closed:
+            return
+        self.closed = True
+        self._writer.close()
+        self._receiver.cancel()
+
+    async def _receive_responses(self):
+        error = ConnectionError("connection to DB server was closed")
+        try:
+            while (frame := await read_frame(self._reader)) is not None:
+                request_id, response, more = frame
+                pending = self._pending.get(request_id) if more else self._pending.pop(request_id, None)
+                if isinstance(pending, asyncio.Future):
+                    if not more and not pending.done():
+                        pending.set_result(response)
+                elif pending is not None:
+                    await pending.put((response, more))
+        except OSError as receive_error:
+            error = receive_error
+        finally:
+            self.closed = True
+            pending_requests = list(self._pending.values())
+            self._pending.clear()
+            for pending in pending_requests:
+                if isinstance(pending, asyncio.Future):
+                    if not pending.done():
+                        pending.set_exception(error)
+                else:
+                    while not pending.empty():
+                        pending.get_nowait()
+                    pending.put_nowait(error)
+            self._writer.close()
+
+
+async def _open_async_connection(server_address) -> Optional[_AsyncConnection]:
+    """Opens a persistent connection to a DB server in the running event loop.
+
+    Args:
+        server_address (tuple(str,int)): the hostname and port where the server is listening.
+
+    Returns:
+        persistent connection or None if the server supports only single request connections
+    """
+    reader, writer = await asyncio.open_connection(*server_address)
+    try:
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        writer.write(encode(("open_connection", (), {}, client_version)) + ReceiveAllMixing._BEOT)
+        await writer.drain()
+        response = decode(await read_until_eot(reader))
+    except Exception:
+        writer.close()
+        raise
+    if not _accepts_persistent_connection(response):
+        writer.close()
+        return None
+    return _AsyncConnection(reader, writer)
+
+
 def get_db_url_from_server(url):
     if isinstance(url, URL):
         return url
@@ -32,6 +32,26 @@ Each request must be a JSON array with the following elements:
 #. A JSON object with keyword arguments to the request.
 #. A JSON integer indicating the version of the server you want to talk to.
 
+Each encoded request must be terminated by an end of transmission character (``\u0004``).
+The server answers the request in the same format and closes the connection.
+
+To send many requests over a single connection, send the ``open_connection`` request first.
+If the server supports persistent connections, it answers with its version number
+and switches the connection to length-prefixed messages.
+Each message is then preceded by a 13 byte header consisting of a big-endian unsigned 32 bit request id,
+a boolean byte that is set if more messages with the same request id follow,
+and a big-endian unsigned 64 bit message length.
+The server sends the response to a request with the request's id
+but does not necessarily answer requests in the order they were sent.
+
+The ``iter_query`` and ``iter_export_data`` requests are available on persistent connections only.
+Their results are sent in chunks as JSON objects with a ``chunk`` key,
+followed by a last message with a ``result`` or an ``error`` key.
+:class:`~spinedb_api.spine_db_client.SpineDBClient` uses persistent connections automatically.
+
+The ``query``, ``filtered_query`` and ``export_data`` requests accept a ``columnar`` keyword argument.
+If it is true, each result table is encoded as an Arrow IPC stream instead of a list of JSON objects.
+
 The positional and keyword arguments to the different requests are documented
 in the :class:`~spinedb_api.spine_db_client.SpineDBClient` class
 (just look for a member function named after the request).
@@ -43,6 +63,12 @@ If you then upgrade your ``spinedb_api`` installation but not your client, the s
 with an error message saying that you need to update your client.
 The current server version can be queried by calling :func:`get_current_server_version`.
 
+Servers can also run in an asyncio event loop. :class:`AsyncDBServerManager` starts them in the running loop,
+as does the :func:`closing_async_spine_db_server` context manager.
+Such servers speak the same protocol but share a single thread pool for DB work
+and control the order of writing with asyncio primitives instead of a manager process.
+:class:`~spinedb_api.spine_db_client.AsyncSpineDBClient` is the asyncio counterpart of the client.
+
 The order in which multiple servers should write to the same DB can also be controlled using DB servers.
 This is particularly useful in high-concurrency scenarios.
 
@@ -94,28 +120,45 @@ Only after the second writes, the first one also writes and the program finishes
         assert [x["name"] for x in db_map.get_items("entity_class")] == ["donkey", "monkey"]
 """
 
+import asyncio
 import atexit
-from collections.abc import Hashable, Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Hashable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from itertools import islice
 import multiprocessing as mp
 from multiprocessing.queues import Queue as MPQueue
-from queue import Queue
+from queue import Full, Queue
+import socket
 import socketserver
 import threading
 import time
 import traceback
 from typing import ClassVar, Literal, Optional, TypedDict
 from urllib.parse import urlunsplit
+from sqlalchemy.engine.url import URL, make_url
 from sqlalchemy.exc import DBAPIError
 from spinedb_api import __version__ as spinedb_api_version
 from .db_mapping import DatabaseMapping
-from .export_functions import export_data
+from .exception import SpineDBAPIError
+from .export_functions import export_data, iter_export_data
 from .filters.alternative_filter import alternative_filter_config
 from .filters.scenario_filter import scenario_filter_config
 from .filters.tools import apply_filter_stack, clear_filter_configs
 from .import_functions import import_data
 from .parameter_value import dump_db_value
-from .server_client_helpers import ReceiveAllMixing, decode, encode
+from .server_client_helpers import (
+    ReceiveAllMixing,
+    decode,
+    encode,
+    encode_columnar_table,
+    pack_frame,
+    read_frame,
+    read_until_eot,
+    receive_frame,
+    send_frame,
+)
 
 _current_server_version = 8
 
@@ -205,7 +248,11 @@ class _DBServerManager:
             output_queue, request, args, kwargs = msg
             handler = self._handlers[request]
             result = handler(*args, **kwargs)
-            output_queue.put(result)
+            try:
+                output_queue.put(result)
+            except (EOFError, BrokenPipeError):
+                # The requester shuts its queue's manager down as soon as it has got the result.
+                pass
         for server_address in list(self._servers):
             self._shutdown_server(server_address)
 
@@ -243,8 +290,7 @@ class _DBServerManager:
         if not server:
             return
         ordering = server.ordering
-        checkouts = self._checkouts.get(ordering["id"], {})
-        full_checkouts = set(x for x, count in checkouts.items() if count == self._CHECKOUT_COMPLETE)
+        full_checkouts = _full_checkouts(self._checkouts.get(ordering["id"], {}))
         precursors = ordering["precursors"]
         if precursors <= full_checkouts:
             return
@@ -260,15 +306,9 @@ class _DBServerManager:
         self._quick_db_checkout(ordering)
 
     def _quick_db_checkout(self, ordering):
-        current = ordering["current"]
         checkouts = self._checkouts.setdefault(ordering["id"], {})
-        if current not in checkouts:
-            checkouts[current] = 1
-        elif checkouts[current] != self._CHECKOUT_COMPLETE:
-            checkouts[current] += 1
-        if checkouts[current] == ordering["part_count"]:
-            checkouts[current] = self._CHECKOUT_COMPLETE
-        full_checkouts = set(x for x, count in checkouts.items() if count == self._CHECKOUT_COMPLETE)
+        _add_checkout(checkouts, ordering)
+        full_checkouts = _full_checkouts(checkouts)
         waiters = self._waiters.get(ordering["id"], {})
         done = [event for event, precursors in waiters.items() if precursors <= full_checkouts]
         for event in done:
@@ -284,6 +324,20 @@ class _DBServerManager:
         checkouts.pop(ordering["current"], None)
 
 
+def _add_checkout(checkouts, ordering):
+    current = ordering["current"]
+    if current not in checkouts:
+        checkouts[current] = 1
+    elif checkouts[current] != _DBServerManager._CHECKOUT_COMPLETE:
+        checkouts[current] += 1
+    if checkouts[current] == ordering["part_count"]:
+        checkouts[current] = _DBServerManager._CHECKOUT_COMPLETE
+
+
+def _full_checkouts(checkouts):
+    return set(x for x, count in checkouts.items() if count == _DBServerManager._CHECKOUT_COMPLETE)
+
+
 def _run_request_on_manager(request, server_manager_queue, *args, **kwargs):
     with mp.Manager() as manager:
         output_queue = manager.Queue()
@@ -321,6 +375,16 @@ def _parse_value(v, type_):
     return (v, type_)
 
 
+def _parse_columnar_value(v, type_):
+    return {"value": v, "type": type_}
+
+
+def _query_result(qry, columnar):
+    if not columnar:
+        return [x._asdict() for x in qry]
+    return encode_columnar_table(qry.all(), qry.statement.selected_columns.keys())
+
+
 def _unparse_value(value_and_type):
     if isinstance(value_and_type, (tuple, list)) and len(value_and_type) == 2:
         value, type_ = value_and_type
@@ -331,14 +395,91 @@ def _unparse_value(value_and_type):
     return dump_db_value(value_and_type)
 
 
+class _ResultStream:
+    """Passes result chunks from the thread that holds a DB mapping to the thread that sends them to the client.
+
+    The producer blocks while the consumer is behind so only a few chunks are held in memory at a time."""
+
+    _CHUNK: ClassVar[Literal["chunk"]] = "chunk"
+    _END: ClassVar[Literal["end"]] = "end"
+    _ERROR: ClassVar[Literal["error"]] = "error"
+    _POLL_INTERVAL: ClassVar[float] = 0.1
+
+    def __init__(self, max_queued_chunks=2):
+        self._chunks = Queue(maxsize=max_queued_chunks)
+        self._cancelled = threading.Event()
+
+    def produce(self, chunks):
+        """Feeds chunks to the consumer until they run out or the consumer gives up.
+
+        Args:
+            chunks (Iterator): result chunks
+        """
+        try:
+            for chunk in chunks:
+                if not self._put((self._CHUNK, chunk)):
+                    return
+        finally:
+            chunks.close()
+        self._put((self._END, None))
+
+    def set_exception(self, error):
+        """Passes an error to the consumer.
+
+        Args:
+            error (Exception): error that stopped producing chunks
+        """
+        self._put((self._ERROR, error))
+
+    def cancel(self):
+        """Tells the producer to stop."""
+        self._cancelled.set()
+
+    def _put(self, item):
+        while not self._cancelled.is_set():
+            try:
+                self._chunks.put(item, timeout=self._POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    def __iter__(self):
+        try:
+            while True:
+                kind, payload = self._chunks.get()
+                if kind == self._END:
+                    return
+                if kind == self._ERROR:
+                    raise payload
+                yield payload
+        finally:
+            self.cancel()
+
+
+def _is_in_memory_url(db_url) -> bool:
+    url = make_url(db_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
 class SpineDBServerBase:
     """Implements the interface between the server and the DB.
 
     Since server requests might come from different threads, and SQLite objects can only be used
     from the thread they were created, here we need to use a dedicated thread to hold and manipulate
-    our DatabaseMapping."""
+    our DatabaseMapping.
+
+    Read requests are served in parallel by reader threads that hold read-only DatabaseMappings of their own.
+    Readers see only committed data, so exports fall back to the main thread
+    if its mapping may have uncommitted changes."""
 
     _CLOSE: ClassVar[Literal["close"]] = "close"
+    _READ_REQUESTS: ClassVar[frozenset[str]] = frozenset(
+        ("query", "filtered_query", "export_data", "iter_query", "iter_export_data")
+    )
+    _READ_ONLY_METHOD_PREFIXES: ClassVar[tuple[str, ...]] = ("get_", "find_", "fetch_", "has_")
+    reader_count: ClassVar[int] = 4
+    """Number of threads serving read requests; zero disables parallel reads."""
 
     def __init__(self, db_url, upgrade, memory, commit_lock, manager_queue, ordering, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -350,6 +491,16 @@ class SpineDBServerBase:
         self._commit_lock = commit_lock
         self._in_queue = Queue()
         self._out_queue = Queue()
+        if isinstance(db_url, URL):
+            db_url = db_url.render_as_string(hide_password=False)
+        self._readers_enabled = self.reader_count > 0 and not memory and not _is_in_memory_url(db_url)
+        self._readers = []
+        self._read_queue = Queue()
+        self._reader_state_lock = threading.Lock()
+        self._reader_url = db_url
+        self._reader_filter_configs = []
+        self._reader_generation = 0
+        self._may_have_uncommitted_changes = False
         self._thread = threading.Thread(target=lambda: self._do_work(db_url, upgrade, memory))
         self._thread.start()
         error = self._out_queue.get()
@@ -370,6 +521,12 @@ class SpineDBServerBase:
             self._db_map.close()
             self._in_queue.put(self._CLOSE)
             self._thread.join()
+            with self._reader_state_lock:
+                readers = list(self._readers)
+            for _ in readers:
+                self._read_queue.put(self._CLOSE)
+            for reader in readers:
+                reader.join()
 
     def _do_work(self, db_url, upgrade, memory):
         try:
@@ -380,96 +537,290 @@ class SpineDBServerBase:
         except Exception as error:  # pylint: disable=broad-except
             self._out_queue.put(error)
             return
+        handlers = {
+            "query": partial(self._do_query, self._db_map),
+            "filtered_query": partial(self._do_filtered_query, self._db_map),
+            "import_data": partial(self._do_import_data, self._db_map),
+            "export_data": partial(self._do_export_data, self._db_map),
+            "iter_query": partial(self._iter_query, self._db_map),
+            "iter_export_data": partial(self._iter_export_data, self._db_map),
+            "call_method": partial(self._do_call_method, self._db_map),
+            "apply_filters": partial(self._do_apply_filters, self._db_map),
+            "clear_filters": partial(self._do_clear_filters, self._db_map),
+        }
         while True:
             input_ = self._in_queue.get()
             if input_ == self._CLOSE:
                 break
-            request, args, kwargs = input_
-            handler = {
-                "query": self._do_query,
-                "filtered_query": self._do_filtered_query,
-                "import_data": self._do_import_data,
-                "export_data": self._do_export_data,
-                "call_method": self._do_call_method,
-                "apply_filters": self._do_apply_filters,
-                "clear_filters": self._do_clear_filters,
-            }[request]
+            request, args, kwargs, stream = input_
+            handler = handlers[request]
             with self._db_map:
-                result = handler(*args, **kwargs)
+                if stream is None:
+                    result = handler(*args, **kwargs)
+                else:
+                    try:
+                        stream.produce(handler(*args, **kwargs))
+                    except Exception as error:  # pylint: disable=broad-except
+                        stream.set_exception(error)
+                    result = None
             self._out_queue.put(result)
 
     def run_request(self, request, args, kwargs):
+        if self._can_read_in_parallel(request, kwargs):
+            return self._run_read_request(request, args, kwargs)
         with self._lock:
-            self._in_queue.put((request, args, kwargs))
-            return self._out_queue.get()
+            self._in_queue.put((request, args, kwargs, None))
+            result = self._out_queue.get()
+            self._update_reader_state(request, args, result)
+            return result
+
+    def iter_request(self, request, args, kwargs):
+        """Runs a request that produces its result in chunks.
+
+        Chunks are produced only as fast as they are consumed.
 
-    def _do_query(self, *args):
+        Yields:
+            Any: result chunks
+        """
+        stream = _ResultStream()
+        if self._can_read_in_parallel(request, kwargs):
+            self._start_readers()
+            self._read_queue.put((request, args, kwargs, stream))
+            yield from stream
+            return
+        with self._lock:
+            self._in_queue.put((request, args, kwargs, stream))
+            try:
+                yield from stream
+            finally:
+                stream.cancel()
+                self._out_queue.get()
+
+    def _can_read_in_parallel(self, request, kwargs):
+        if not self._readers_enabled or request not in self._READ_REQUESTS:
+            return False
+        if request in ("export_data", "iter_export_data"):
+            # Ids in export arguments are ids of the main mapping.
+            return not any(key.endswith("_ids") for key in kwargs) and not self._may_have_uncommitted_changes
+        return True
+
+    def _update_reader_state(self, request, args, result):
+        """Keeps track of the state of the main mapping that readers need to replicate."""
+        if request == "apply_filters":
+            if "result" in result:
+                with self._reader_state_lock:
+                    self._reader_filter_configs = self._reader_filter_configs + list(args[0])
+                    self._reader_generation += 1
+        elif request == "clear_filters":
+            with self._reader_state_lock:
+                self._reader_url = clear_filter_configs(self._reader_url)
+                self._reader_filter_configs = []
+                self._reader_generation += 1
+        elif request == "import_data":
+            count, _ = result["result"]
+            comment = args[1]
+            if count:
+                self._may_have_uncommitted_changes = not comment
+        elif request == "call_method":
+            method_name = args[0]
+            if method_name in ("commit_session", "rollback_session"):
+                if "error" not in result:
+                    self._may_have_uncommitted_changes = False
+            elif not method_name.startswith(self._READ_ONLY_METHOD_PREFIXES):
+                self._may_have_uncommitted_changes = True
+
+    def _start_readers(self):
+        with self._reader_state_lock:
+            if not self._readers:
+                for _ in range(self.reader_count):
+                    reader = threading.Thread(target=self._do_read_work, daemon=True)
+                    reader.start()
+                    self._readers.append(reader)
+
+    def _run_read_request(self, request, args, kwargs):
+        self._start_readers()
+        future = Future()
+        self._read_queue.put((request, args, kwargs, future))
+        return future.result()
+
+    def _do_read_work(self):
+        handlers = {
+            "query": self._do_query,
+            "filtered_query": self._do_filtered_query,
+            "export_data": self._do_export_data,
+            "iter_query": self._iter_query,
+            "iter_export_data": self._iter_export_data,
+        }
+        db_map = None
+        generation = None
+        try:
+            while True:
+                input_ = self._read_queue.get()
+                if input_ == self._CLOSE:
+                    break
+                request, args, kwargs, target = input_
+                try:
+                    with self._reader_state_lock:
+                        url, filter_configs, current_generation = (
+                            self._reader_url,
+                            self._reader_filter_configs,
+                            self._reader_generation,
+                        )
+                    if generation != current_generation:
+                        if db_map is not None:
+                            db_map.close()
+                            db_map = None
+                        db_map = DatabaseMapping(url, read_only=True)
+                        if filter_configs:
+                            apply_filter_stack(db_map, filter_configs)
+                        generation = current_generation
+                    with db_map:
+                        if isinstance(target, _ResultStream):
+                            target.produce(handlers[request](db_map, *args, **kwargs))
+                        else:
+                            target.set_result(handlers[request](db_map, *args, **kwargs))
+                except Exception as error:  # pylint: disable=broad-except
+                    target.set_exception(error)
+        finally:
+            if db_map is not None:
+                db_map.close()
+
+    @staticmethod
+    def _do_query(db_map, *args, columnar=False):
         result = {}
         for sq_name in args:
-            sq = getattr(self._db_map, sq_name, None)
+            sq = getattr(db_map, sq_name, None)
             if sq is None:
                 continue
-            result[sq_name] = [x._asdict() for x in self._db_map.query(sq)]
+            result[sq_name] = _query_result(db_map.query(sq), columnar)
         return {"result": result}
 
-    def _do_filtered_query(self, **kwargs):
+    @staticmethod
+    def _do_filtered_query(db_map, columnar=False, **kwargs):
         result = {}
         for sq_name, filters in kwargs.items():
-            sq = getattr(self._db_map, sq_name, None)
+            sq = getattr(db_map, sq_name, None)
             if sq is None:
                 continue
-            qry = self._db_map.query(sq)
+            qry = db_map.query(sq)
             for field, value in filters.items():
                 qry = qry.filter_by(**{field: value})
-            result[sq_name] = [x._asdict() for x in qry]
+            result[sq_name] = _query_result(qry, columnar)
         return {"result": result}
 
-    def _do_import_data(self, data, comment):
-        count, errors = import_data(self._db_map, unparse_value=_unparse_value, **data)
+    @staticmethod
+    def _do_import_data(db_map, data, comment):
+        count, errors = import_data(db_map, unparse_value=_unparse_value, **data)
         if count and comment:
             try:
-                self._db_map.commit_session(comment)
+                db_map.commit_session(comment)
             except DBAPIError:
-                self._db_map.rollback_session()
+                db_map.rollback_session()
         return {"result": (count, errors)}
 
-    def _do_export_data(self, **kwargs):
-        return {"result": export_data(self._db_map, parse_value=_parse_value, **kwargs)}
-
-    def _do_call_method(self, method_name, *args, **kwargs):
+    @staticmethod
+    def _iter_query(db_map, sq_name, chunk_size, columnar=False):
+        sq = getattr(db_map, sq_name, None)
+        if sq is None:
+            raise SpineDBAPIError(f"no subquery named '{sq_name}'")
+        qry = db_map.query(sq).yield_per(chunk_size)
+        column_names = qry.statement.selected_columns.keys()
+        rows = iter(qry)
+        while chunk := list(islice(rows, chunk_size)):
+            yield encode_columnar_table(chunk, column_names) if columnar else [row._asdict() for row in chunk]
+
+    @staticmethod
+    def _iter_export_data(db_map, chunk_size, columnar=False, **kwargs):
+        parse_value = _parse_columnar_value if columnar else _parse_value
+        for key, rows in iter_export_data(db_map, parse_value=parse_value, **kwargs):
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                yield key, encode_columnar_table(chunk) if columnar else chunk
+
+    @staticmethod
+    def _do_export_data(db_map, columnar=False, **kwargs):
+        if not columnar:
+            return {"result": export_data(db_map, parse_value=_parse_value, **kwargs)}
+        data = export_data(db_map, parse_value=_parse_columnar_value, **kwargs)
+        return {"result": {key: encode_columnar_table(rows) for key, rows in data.items()}}
+
+    @staticmethod
+    def _do_call_method(db_map, method_name, *args, **kwargs):
         try:
-            method = getattr(self._db_map, method_name)
+            method = getattr(db_map, method_name)
             result = method(*args, **kwargs)
             return {"result": result}
         except Exception as err:
             return {"error": str(err)}
 
-    def _do_clear_filters(self):
-        self._db_map.restore_entity_sq_maker()
-        self._db_map.restore_entity_element_sq_maker()
-        self._db_map.restore_entity_location_sq_maker()
-        self._db_map.restore_entity_class_sq_maker()
-        self._db_map.restore_entity_alternative_sq_maker()
-        self._db_map.restore_entity_group_sq_maker()
-        self._db_map.restore_parameter_definition_sq_maker()
-        self._db_map.restore_parameter_value_sq_maker()
-        self._db_map.restore_alternative_sq_maker()
-        self._db_map.restore_scenario_sq_maker()
-        self._db_map.restore_scenario_alternative_sq_maker()
-        self._db_map.filter_configs.clear()
+    @staticmethod
+    def _do_clear_filters(db_map):
+        db_map.restore_entity_sq_maker()
+        db_map.restore_entity_element_sq_maker()
+        db_map.restore_entity_location_sq_maker()
+        db_map.restore_entity_class_sq_maker()
+        db_map.restore_entity_alternative_sq_maker()
+        db_map.restore_entity_group_sq_maker()
+        db_map.restore_parameter_definition_sq_maker()
+        db_map.restore_parameter_value_sq_maker()
+        db_map.restore_alternative_sq_maker()
+        db_map.restore_scenario_sq_maker()
+        db_map.restore_scenario_alternative_sq_maker()
+        db_map.filter_configs.clear()
         return {"result": True}
 
-    def _do_apply_filters(self, configs):
+    @staticmethod
+    def _do_apply_filters(db_map, configs):
         try:
-            apply_filter_stack(self._db_map, configs)
+            apply_filter_stack(db_map, configs)
             return {"result": True}
         except Exception as error:  # pylint: disable=broad-except
             return {"error": str(error)}
 
 
-class SpineDBServer(SpineDBServerBase, socketserver.TCPServer):
+class SpineDBServer(SpineDBServerBase, socketserver.ThreadingTCPServer):
     """A socket server for accessing and manipulating a Spine DB."""
 
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, *args, **kwargs):
+        self._persistent_connections = set()
+        self._persistent_connection_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def add_persistent_connection(self, sock):
+        with self._persistent_connection_lock:
+            self._persistent_connections.add(sock)
+
+    def discard_persistent_connection(self, sock):
+        with self._persistent_connection_lock:
+            self._persistent_connections.discard(sock)
+
+    def server_close(self):
+        super().server_close()
+        with self._persistent_connection_lock:
+            connections = list(self._persistent_connections)
+            self._persistent_connections.clear()
+        for sock in connections:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def _columnar_kwargs(columnar):
+    return {"columnar": True} if columnar else {}
+
+
+def _filter_configs(filters):
+    obsolete = ("tool",)
+    return [
+        {"scenario": scenario_filter_config, "alternatives": alternative_filter_config}[key](value)
+        for key, value in filters.items()
+        if key not in obsolete
+    ]
+
 
 class HandleDBRequestMixin:
     def get_db_url(self):
@@ -484,23 +835,56 @@ class HandleDBRequestMixin:
             kwargs = {}
         return self.server.run_request(request, args, kwargs)
 
-    def query(self, *args):
+    def query(self, *args, columnar=False):
         """
         Runs queries.
 
+        Args:
+            columnar (bool): if True, results are encoded as Arrow IPC streams
+
         Returns:
             dict: where result is a dict from subquery name to a list of items from thay subquery, if successful.
         """
-        return self._run_request_on_server("query", args=args)
+        return self._run_request_on_server("query", args=args, kwargs=_columnar_kwargs(columnar))
 
-    def filtered_query(self, **kwargs):
+    def filtered_query(self, columnar=False, **kwargs):
         """
         Runs queries with filters.
 
+        Args:
+            columnar (bool): if True, results are encoded as Arrow IPC streams
+
         Returns:
             dict: where result is a dict from subquery name to a list of items from thay subquery, if successful.
         """
-        return self._run_request_on_server("filtered_query", kwargs=kwargs)
+        return self._run_request_on_server("filtered_query", kwargs=dict(kwargs, **_columnar_kwargs(columnar)))
+
+    def iter_query(self, sq_name, chunk_size, columnar=False):
+        """
+        Runs a query yielding the result in chunks.
+
+        Args:
+            sq_name (str): subquery name
+            chunk_size (int): maximum number of rows in a chunk
+            columnar (bool): if True, chunks are encoded as Arrow IPC streams
+
+        Returns:
+            Iterator: chunks of rows
+        """
+        return self.server.iter_request("iter_query", (sq_name, chunk_size), _columnar_kwargs(columnar))
+
+    def iter_export_data(self, chunk_size, columnar=False, **kwargs):
+        """
+        Exports data yielding it in chunks.
+
+        Args:
+            chunk_size (int): maximum number of exported items in a chunk
+            columnar (bool): if True, chunks are encoded as Arrow IPC streams
+
+        Returns:
+            Iterator: tuples of item type and chunk of exported items
+        """
+        return self.server.iter_request("iter_export_data", (chunk_size,), dict(kwargs, **_columnar_kwargs(columnar)))
 
     def import_data(self, data, comment):
         """Imports data and commit.
@@ -513,13 +897,16 @@ class HandleDBRequestMixin:
         """
         return self._run_request_on_server("import_data", args=(data, comment))
 
-    def export_data(self, **kwargs):
+    def export_data(self, columnar=False, **kwargs):
         """Exports data.
 
+        Args:
+            columnar (bool): if True, each exported item type is encoded as an Arrow IPC stream
+
         Returns:
             dict: where result is the data exported from the db
         """
-        return self._run_request_on_server("export_data", kwargs=kwargs)
+        return self._run_request_on_server("export_data", kwargs=dict(kwargs, **_columnar_kwargs(columnar)))
 
     def call_method(self, method_name, *args, **kwargs):
         """Calls a method from the DatabaseMapping class.
@@ -535,13 +922,7 @@ class HandleDBRequestMixin:
         return self._run_request_on_server("call_method", args=(method_name, *args), kwargs=kwargs)
 
     def apply_filters(self, filters):
-        obsolete = ("tool",)
-        configs = [
-            {"scenario": scenario_filter_config, "alternatives": alternative_filter_config}[key](value)
-            for key, value in filters.items()
-            if key not in obsolete
-        ]
-        return self._run_request_on_server("apply_filters", args=(configs,))
+        return self._run_request_on_server("apply_filters", args=(_filter_configs(filters),))
 
     def clear_filters(self):
         return self._run_request_on_server("clear_filters")
@@ -558,6 +939,9 @@ class HandleDBRequestMixin:
         cancel_db_checkout(self.server_manager_queue, self.server_address)
         return {"result": True}
 
+    def open_connection(self) -> dict:
+        return {"error": "persistent connections are not supported"}
+
     def acquire_lock(self) -> dict:
         self.server.commit_lock.acquire()
         return {"result": True}
@@ -585,6 +969,8 @@ class HandleDBRequestMixin:
             "filtered_query": self.filtered_query,
             "import_data": self.import_data,
             "export_data": self.export_data,
+            "iter_query": self.iter_query,
+            "iter_export_data": self.iter_export_data,
             "call_method": self.call_method,
             "apply_filters": self.apply_filters,
             "clear_filters": self.clear_filters,
@@ -593,6 +979,7 @@ class HandleDBRequestMixin:
             "cancel_db_checkout": self.cancel_db_checkout,
             "acquire_lock": self.acquire_lock,
             "release_lock": self.release_lock,
+            "open_connection": self.open_connection,
         }.get(request)
         if handler is None:
             return {"error": f"invalid request '{request}'"}
@@ -603,6 +990,9 @@ class HandleDBRequestMixin:
 
     def handle_request(self, request):
         response = self._get_response(request)
+        if isinstance(response, Iterator):
+            response.close()
+            response = {"error": "streaming requests need a persistent connection"}
         return encode(response)
 
 
@@ -624,6 +1014,13 @@ class DBHandler(HandleDBRequestMixin):
 class DBRequestHandler(ReceiveAllMixing, HandleDBRequestMixin, socketserver.BaseRequestHandler):
     """Handles requests to a DB server."""
 
+    _MAX_CONCURRENT_REQUESTS: ClassVar[int] = 8
+    """Maximum number of requests handled simultaneously per persistent connection."""
+
+    def setup(self):
+        super().setup()
+        self._persistent = False
+
     @property
     def server_address(self):
         return self.server.server_address
@@ -632,10 +1029,70 @@ class DBRequestHandler(ReceiveAllMixing, HandleDBRequestMixin, socketserver.Base
     def server_manager_queue(self):
         return self.server.manager_queue
 
+    def open_connection(self) -> dict:
+        self._persistent = True
+        return {"result": _current_server_version}
+
     def handle(self):
         request = self._recvall()
         response = self.handle_request(request)
         self.request.sendall(response + bytes(self._EOT, self._ENCODING))
+        if self._persistent:
+            self._handle_persistent_connection()
+
+    def _handle_persistent_connection(self):
+        """Handles length-prefixed requests until the client closes the connection."""
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.add_persistent_connection(self.request)
+        send_lock = threading.Lock()
+        executor = ThreadPoolExecutor(max_workers=self._MAX_CONCURRENT_REQUESTS)
+        try:
+            while True:
+                try:
+                    frame = receive_frame(self.request)
+                except OSError:
+                    break
+                if frame is None:
+                    break
+                request_id, request, _ = frame
+                executor.submit(self._respond, send_lock, request_id, request)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.server.discard_persistent_connection(self.request)
+
+    def _respond(self, send_lock, request_id, request):
+        response = self._get_response(request)
+        try:
+            if isinstance(response, Iterator):
+                response = self._send_chunks(send_lock, request_id, response)
+            with send_lock:
+                send_frame(self.request, request_id, encode(response))
+        except OSError:
+            pass
+
+    def _send_chunks(self, send_lock, request_id, chunks):
+        """Sends result chunks as they are produced and returns the final response."""
+        try:
+            for chunk in chunks:
+                message = encode({"chunk": chunk})
+                with send_lock:
+                    send_frame(self.request, request_id, message, more=True)
+        except OSError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            return {"error": traceback.format_exc()}
+        finally:
+            chunks.close()
+        return {"result": True}
+
+
+def _default_ordering() -> OrderingDict:
+    return {
+        "id": 0,
+        "current": 0,
+        "precursors": set(),
+        "part_count": 0,
+    }
 
 
 @contextmanager
@@ -682,12 +1139,7 @@ def closing_spine_db_server(
     else:
         mngr = None
     if ordering is None:
-        ordering = {
-            "id": 0,
-            "current": 0,
-            "precursors": set(),
-            "part_count": 0,
-        }
+        ordering = _default_ordering()
     server_address = start_spine_db_server(server_manager_queue, db_url, memory=memory, ordering=ordering)
     host, port = server_address
     try:
@@ -696,3 +1148,431 @@ def closing_spine_db_server(
         shutdown_spine_db_server(server_manager_queue, server_address)
         if mngr is not None:
             mngr.shutdown()
+
+
+class AsyncSpineDBServer:
+    """An asyncio socket server for accessing and manipulating a Spine DB.
+
+    The server speaks the same protocol as :class:`SpineDBServer` but needs no threads of its own.
+    DB work runs in the executor of its :class:`AsyncDBServerManager`, one request at a time per server,
+    so idle servers and connections cost nothing but their sockets.
+    Servers with ``memory=True`` get a single-thread executor of their own
+    since their in-memory database cannot move between threads."""
+
+    _END_OF_CHUNKS: ClassVar[object] = object()
+
+    def __init__(self, db_url, manager, ordering, upgrade=False, memory=False):
+        """
+        Args:
+            db_url (str or URL): the URL of a Spine DB
+            manager (AsyncDBServerManager): manager that controls the order of writing
+            ordering (OrderingDict): write ordering of this server
+            upgrade (bool): whether to upgrade the DB to the last revision
+            memory (bool): whether to use an in-memory database together with a persistent connection
+        """
+        if isinstance(db_url, URL):
+            db_url = db_url.render_as_string(hide_password=False)
+        self._db_url = db_url
+        self._manager = manager
+        self.ordering = ordering
+        self._upgrade = upgrade
+        self._memory = memory
+        self._executor = ThreadPoolExecutor(max_workers=1) if memory else manager.executor
+        self._db_map = None
+        self._db_lock = asyncio.Lock()
+        self._server = None
+        self._writers = set()
+        self._handlers = {
+            "query": self._query,
+            "filtered_query": self._filtered_query,
+            "import_data": self._import_data,
+            "export_data": self._export_data,
+            "iter_query": self._iter_query,
+            "iter_export_data": self._iter_export_data,
+            "call_method": self._call_method,
+            "apply_filters": self._apply_filters,
+            "clear_filters": self._clear_filters,
+            "db_checkin": self._db_checkin,
+            "db_checkout": self._db_checkout,
+            "cancel_db_checkout": self._cancel_db_checkout,
+            "acquire_lock": self._acquire_lock,
+            "release_lock": self._release_lock,
+            "open_connection": self._open_connection,
+        }
+
+    @property
+    def db_url(self):
+        return str(self._db_map.db_url)
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Opens the DB and starts listening.
+
+        Args:
+            host (str): host to listen on
+            port (int): port to listen on; 0 picks a free port
+
+        Returns:
+            tuple(str,int): server address
+        """
+        self._db_map = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(DatabaseMapping, self._db_url, upgrade=self._upgrade, memory=self._memory, create=True),
+        )
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        """Stops listening, drops open connections and closes the DB."""
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+        async with self._db_lock:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._db_map.close)
+        if self._memory:
+            self._executor.shutdown(wait=False)
+
+    async def _handle_connection(self, reader, writer):
+        self._writers.add(writer)
+        try:
+            request = decode(await read_until_eot(reader))
+            response = await self._get_response(request)
+            if isinstance(response, AsyncIterator):
+                await response.aclose()
+                response = {"error": "streaming requests need a persistent connection"}
+            writer.write(encode(response) + ReceiveAllMixing._BEOT)
+            await writer.drain()
+            if request[0] == "open_connection" and "result" in response:
+                await self._handle_persistent_connection(reader, writer)
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _handle_persistent_connection(self, reader, writer):
+        """Handles length-prefixed requests until the client closes the connection."""
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        write_lock = asyncio.Lock()
+        tasks = set()
+        while (frame := await read_frame(reader)) is not None:
+            request_id, request, _ = frame
+            task = asyncio.create_task(self._respond(writer, write_lock, request_id, request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    async def _respond(self, writer, write_lock, request_id, request):
+        response = await self._get_response(decode(request))
+        try:
+            if isinstance(response, AsyncIterator):
+                response = await self._send_chunks(writer, write_lock, request_id, response)
+            async with write_lock:
+                writer.write(pack_frame(request_id, encode(response)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+
+    @staticmethod
+    async def _send_chunks(writer, write_lock, request_id, chunks):
+        """Sends result chunks as they are produced and returns the final response."""
+        try:
+            async for chunk in chunks:
+                message = encode({"chunk": chunk})
+                async with write_lock:
+                    writer.write(pack_frame(request_id, message, more=True))
+                    await writer.drain()
+        except ConnectionError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            return {"error": traceback.format_exc()}
+        finally:
+            await chunks.aclose()
+        return {"result": True}
+
+    async def _get_response(self, request):
+        request, *extras = request
+        # NOTE: See HandleDBRequestMixin._get_response() on why these two come first.
+        if request == "get_api_version":
+            return spinedb_api_version
+        if request == "get_db_url":
+            return self.db_url
+        try:
+            args, kwargs, client_version = extras
+        except ValueError:
+            client_version = 0
+        if client_version < _current_server_version:
+            return {"error": 1, "result": _current_server_version}
+        handler = self._handlers.get(request)
+        if handler is None:
+            return {"error": f"invalid request '{request}'"}
+        try:
+            if request.startswith("iter_"):
+                return handler(*args, **kwargs)
+            return await handler(*args, **kwargs)
+        except Exception:  # pylint: disable=broad-except
+            return {"error": traceback.format_exc()}
+
+    async def _run_on_db(self, function, *args, **kwargs):
+        """Runs function with the DB mapping in the executor, one call at a time."""
+        async with self._db_lock:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(self._call_with_db_map, function, *args, **kwargs)
+            )
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Keep the DB locked until the call actually finishes.
+                await asyncio.wait((future,))
+                raise
+
+    def _call_with_db_map(self, function, *args, **kwargs):
+        with self._db_map:
+            return function(self._db_map, *args, **kwargs)
+
+    async def _iter_on_db(self, function, *args, **kwargs):
+        """Runs a chunk generator with the DB mapping in the executor, one chunk at a time.
+
+        The DB stays locked until the generator is exhausted or closed."""
+        loop = asyncio.get_running_loop()
+        async with self._db_lock:
+            self._db_map.__enter__()
+            chunks = function(self._db_map, *args, **kwargs)
+            future = None
+            try:
+                while True:
+                    future = loop.run_in_executor(self._executor, next, chunks, self._END_OF_CHUNKS)
+                    chunk = await asyncio.shield(future)
+                    if chunk is self._END_OF_CHUNKS:
+                        break
+                    yield chunk
+            finally:
+                if future is not None and not future.done():
+                    await asyncio.wait((future,))
+                await loop.run_in_executor(self._executor, self._close_chunks, chunks)
+
+    def _close_chunks(self, chunks):
+        try:
+            chunks.close()
+        finally:
+            self._db_map.__exit__(None, None, None)
+
+    async def _query(self, *args, columnar=False):
+        return await self._run_on_db(SpineDBServerBase._do_query, *args, columnar=columnar)
+
+    async def _filtered_query(self, columnar=False, **kwargs):
+        return await self._run_on_db(SpineDBServerBase._do_filtered_query, columnar=columnar, **kwargs)
+
+    async def _export_data(self, columnar=False, **kwargs):
+        return await self._run_on_db(SpineDBServerBase._do_export_data, columnar=columnar, **kwargs)
+
+    def _iter_query(self, sq_name, chunk_size, columnar=False):
+        return self._iter_on_db(SpineDBServerBase._iter_query, sq_name, chunk_size, columnar=columnar)
+
+    def _iter_export_data(self, chunk_size, columnar=False, **kwargs):
+        return self._iter_on_db(SpineDBServerBase._iter_export_data, chunk_size, columnar=columnar, **kwargs)
+
+    async def _import_data(self, data, comment):
+        if not comment:
+            return await self._run_on_db(SpineDBServerBase._do_import_data, data, comment)
+        async with self._manager.commit_lock(self._db_url):
+            return await self._run_on_db(SpineDBServerBase._do_import_data, data, comment)
+
+    async def _call_method(self, method_name, *args, **kwargs):
+        if method_name != "commit_session":
+            return await self._run_on_db(SpineDBServerBase._do_call_method, method_name, *args, **kwargs)
+        async with self._manager.commit_lock(self._db_url):
+            return await self._run_on_db(SpineDBServerBase._do_call_method, method_name, *args, **kwargs)
+
+    async def _apply_filters(self, filters):
+        return await self._run_on_db(SpineDBServerBase._do_apply_filters, _filter_configs(filters))
+
+    async def _clear_filters(self):
+        return await self._run_on_db(SpineDBServerBase._do_clear_filters)
+
+    async def _db_checkin(self):
+        await self._manager.db_checkin(self.ordering)
+        return {"result": True}
+
+    async def _db_checkout(self):
+        await self._manager.db_checkout(self.ordering)
+        return {"result": True}
+
+    async def _cancel_db_checkout(self):
+        self._manager.cancel_db_checkout(self.ordering)
+        return {"result": True}
+
+    async def _acquire_lock(self):
+        await self._manager.commit_lock(self._db_url).acquire()
+        return {"result": True}
+
+    async def _release_lock(self):
+        self._manager.commit_lock(self._db_url).release()
+        return {"result": True}
+
+    @staticmethod
+    async def _open_connection():
+        return {"result": _current_server_version}
+
+
+class AsyncDBServerManager:
+    """Hosts :class:`AsyncSpineDBServer` instances in the running event loop
+    and controls the order in which they write to DBs.
+
+    All servers share one thread pool for DB work.
+    Checkins, checkouts and DB locks are coordinated with asyncio primitives,
+    so the manager must be used from a single event loop.
+    The manager is an asynchronous context manager that shuts down its servers on exit::
+
+        async with AsyncDBServerManager() as manager:
+            server_url = await manager.start_server("sqlite:///somedb.sqlite")
+            async with AsyncSpineDBClient.from_server_url(server_url) as client:
+                await client.import_data({"entity_classes": [("monkey", ())]}, "Import monkey")
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        Args:
+            max_workers (int, optional): maximum number of threads doing DB work for all servers
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="SpineDBServer")
+        self._servers = {}
+        self._checkouts = {}
+        self._checkouts_changed = asyncio.Condition()
+        self._commit_locks = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.shutdown()
+
+    def commit_lock(self, db_url: str) -> asyncio.Lock:
+        """Returns the lock that serializes commits to given DB.
+
+        Args:
+            db_url: DB URL, possibly with filters
+
+        Returns:
+            commit lock
+        """
+        clean_url = clear_filter_configs(db_url)
+        return self._commit_locks.setdefault(clean_url, asyncio.Lock())
+
+    async def start_server(
+        self,
+        db_url: str,
+        upgrade: bool = False,
+        memory: bool = False,
+        ordering: Optional[OrderingDict] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> str:
+        """Starts a new server.
+
+        Args:
+            db_url: the URL of a Spine DB.
+            upgrade: Whether to upgrade the DB to the last revision.
+            memory: Whether to use an in-memory database together with a persistent connection.
+            ordering: A dictionary specifying an ordering to be followed by multiple concurrent servers
+                writing to the same DB.
+            host: host to listen on
+            port: port to listen on; 0 picks a free port
+
+        Returns:
+            server url
+        """
+        if ordering is None:
+            ordering = _default_ordering()
+        server = AsyncSpineDBServer(db_url, self, ordering, upgrade=upgrade, memory=memory)
+        host, port = await server.start(host, port)
+        server_url = urlunsplit(("http", f"{host}:{port}", "", "", ""))
+        self._servers[server_url] = server
+        return server_url
+
+    async def shutdown_server(self, server_url: str) -> bool:
+        """Shuts down a server.
+
+        Args:
+            server_url: url returned by :meth:`start_server`
+
+        Returns:
+            True if the server was found, False otherwise
+        """
+        server = self._servers.pop(server_url, None)
+        if server is None:
+            return False
+        await server.close()
+        return True
+
+    async def shutdown(self) -> None:
+        """Shuts down all servers."""
+        for server_url in list(self._servers):
+            await self.shutdown_server(server_url)
+        self.executor.shutdown(wait=False)
+
+    async def db_checkin(self, ordering: OrderingDict) -> None:
+        """Waits until the precursors of given ordering have checked out.
+
+        Args:
+            ordering: ordering of the checking in server
+        """
+        async with self._checkouts_changed:
+            await self._checkouts_changed.wait_for(
+                lambda: ordering["precursors"] <= _full_checkouts(self._checkouts.get(ordering["id"], {}))
+            )
+
+    async def db_checkout(self, ordering: OrderingDict) -> None:
+        """Records a checkout and wakes up the servers waiting for it.
+
+        Args:
+            ordering: ordering of the checking out server
+        """
+        async with self._checkouts_changed:
+            _add_checkout(self._checkouts.setdefault(ordering["id"], {}), ordering)
+            self._checkouts_changed.notify_all()
+
+    def cancel_db_checkout(self, ordering: OrderingDict) -> None:
+        """Forgets the checkouts of given ordering.
+
+        Args:
+            ordering: ordering of the server
+        """
+        self._checkouts.get(ordering["id"], {}).pop(ordering["current"], None)
+
+
+@asynccontextmanager
+async def closing_async_spine_db_server(
+    db_url: str,
+    upgrade: bool = False,
+    memory: bool = False,
+    ordering: Optional[OrderingDict] = None,
+    manager: Optional[AsyncDBServerManager] = None,
+) -> AsyncIterator[str]:
+    """Creates a Spine DB server that runs in the current event loop.
+
+    Args:
+        db_url: the URL of a Spine DB.
+        upgrade: Whether to upgrade the DB to the last revision.
+        memory: Whether to use an in-memory database together with a persistent connection.
+        ordering: A dictionary specifying an ordering to be followed by multiple concurrent servers
+            writing to the same DB.
+        manager: A manager that can be used to control order of writing.
+            Only needed if you also specify `ordering` above.
+
+    Yields:
+        server url
+    """
+    own_manager = manager is None
+    if own_manager:
+        manager = AsyncDBServerManager()
+    try:
+        server_url = await manager.start_server(db_url, upgrade=upgrade, memory=memory, ordering=ordering)
+        try:
+            yield server_url
+        finally:
+            await manager.shutdown_server(server_url)
+    finally:
+        if own_manager:
+            await manager.shutdown()
@@ -18,7 +18,7 @@ from itertools import islice
 from typing import Any, ClassVar, Type
 from spinedb_api import DateTime, Duration, ParameterValueFormatError
 from spinedb_api.exception import InvalidMappingComponent, ReaderError
-from spinedb_api.import_mapping.generator import get_mapped_data, identity
+from spinedb_api.import_mapping.generator import DEFAULT_CHUNK_SIZE, get_mapped_data, identity, iter_mapped_data
 from spinedb_api.import_mapping.import_mapping import ImportMapping
 from spinedb_api.import_mapping.import_mapping_compat import parse_named_mapping_spec
 from spinedb_api.mapping import Position, parse_fixed_position_value
@@ -213,3 +213,70 @@ class Reader:
                 mapped_data.setdefault(key, []).extend(value)
             errors.extend([(table, err) for err in t_errors])
         return mapped_data, errors
+
+    def iter_mapped_data(
+        self,
+        tables_mappings: dict[str, list[tuple[str, ImportMapping]]],
+        table_options: dict,
+        table_column_convert_specs: dict[str, dict],
+        table_default_column_convert_fns: dict[str, Callable[[Any], Any]],
+        table_row_convert_specs: dict[str, dict],
+        unparse_value: Callable[[Any], tuple[bytes, str]] = identity,
+        max_rows: int = -1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[tuple[dict[str, list], list[str | tuple[str, str]]]]:
+        """
+        Streaming version of :meth:`get_mapped_data`.
+
+        Source tables are read in chunks of ``chunk_size`` rows
+        and mapped data is yielded after each chunk
+        so it can be passed to ``import_data()`` without holding entire tables in memory.
+
+        Args:
+            tables_mappings: mapping from table name to list of import mappings
+            table_options: mapping from table name to table-specific import options
+            table_column_convert_specs: mapping from table name to column data type conversion settings
+            table_default_column_convert_fns: mapping from table name to
+                default column data type converter
+            table_row_convert_specs: mapping from table name to row data type conversion settings
+            unparse_value: callable that converts imported values to database representation
+            max_rows: maximum number of source rows to map
+            chunk_size: maximum number of source rows to map at a time
+
+        Yields:
+            mapped data and a list of errors, if any
+        """
+        for table, named_mapping_specs in tables_mappings.items():
+            column_convert_fns = table_column_convert_specs.get(table, {})
+            default_column_convert_fn = table_default_column_convert_fns.get(table)
+            row_convert_fns = table_row_convert_specs.get(table, {})
+            options = table_options.get(table, {})
+            table_max_rows = self._resolve_max_rows(options, max_rows)
+            try:
+                data_source, header = self.get_data_iterator(table, options, table_max_rows)
+            except ReaderError as error:
+                yield {}, [str(error)]
+                continue
+            mappings = []
+            mapping_names = []
+            for named_mapping_spec in named_mapping_specs:
+                name, mapping = parse_named_mapping_spec(named_mapping_spec)
+                mappings.append(mapping)
+                mapping_names.append(name)
+            chunks = iter_mapped_data(
+                data_source,
+                mappings,
+                header,
+                table,
+                column_convert_fns,
+                default_column_convert_fn,
+                row_convert_fns,
+                unparse_value,
+                mapping_names,
+                chunk_size,
+            )
+            try:
+                for data, t_errors in chunks:
+                    yield data, [(table, err) for err in t_errors]
+            except (ReaderError, ParameterValueFormatError, InvalidMappingComponent) as error:
+                yield {}, [str(error)]
@@ -14,13 +14,16 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import unittest
+from sqlalchemy.event import listen
 from spinedb_api import (
     DatabaseMapping,
+    Map,
     SpineDBAPIError,
     append_filter_config,
     apply_filter_stack,
     apply_scenario_filter_to_subqueries,
     from_database,
+    resolve_scenarios,
     to_database,
 )
 from spinedb_api.filters.scenario_filter import (
@@ -1327,6 +1330,236 @@ class TestScenarioFilter(DataBuilderTestCase):
             self.assertEqual(len(entity_locations), 0)
 
 
+class TestMaterializedScenarioFilter(DataBuilderTestCase):
+    def test_materialized_filter_selects_highest_ranked_alternative(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._build_data_with_single_scenario(db_map, commit=False)
+            self._assert_success(
+                db_map.add_scenario_alternative_item(scenario_name="scenario", alternative_name="Base", rank=0)
+            )
+            db_map.commit_session("Add test data.")
+            apply_scenario_filter_to_subqueries(db_map, "scenario", materialize=True)
+            values = db_map.query(db_map.parameter_value_sq).all()
+            self.assertEqual(len(values), 1)
+            self.assertEqual(from_database(values[0].value, values[0].type), 23.0)
+            entities = db_map.query(db_map.entity_sq).all()
+            self.assertEqual([entity.name for entity in entities], ["object"])
+
+    def test_materialized_filter_drops_entities_with_inactive_elements(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._assert_success(db_map.add_scenario_item(name="base"))
+            self._assert_success(
+                db_map.add_scenario_alternative_item(scenario_name="base", alternative_name="Base", rank=1)
+            )
+            self._assert_success(db_map.add_entity_class_item(name="Object"))
+            for name, active in (("visible", True), ("invisible", False)):
+                self._assert_success(db_map.add_entity_item(name=name, entity_class_name="Object"))
+                self._assert_success(
+                    db_map.add_entity_alternative_item(
+                        entity_class_name="Object", entity_byname=(name,), alternative_name="Base", active=active
+                    )
+                )
+            self._assert_success(db_map.add_entity_class_item(name="Relationship", dimension_name_list=("Object",)))
+            self._assert_success(db_map.add_parameter_definition_item(name="y", entity_class_name="Relationship"))
+            for name, x in (("visible", 2.3), ("invisible", -2.3)):
+                self._assert_success(
+                    db_map.add_entity_item(element_name_list=(name,), entity_class_name="Relationship")
+                )
+                value, value_type = to_database(x)
+                self._assert_success(
+                    db_map.add_parameter_value_item(
+                        entity_class_name="Relationship",
+                        entity_byname=(name,),
+                        parameter_definition_name="y",
+                        alternative_name="Base",
+                        value=value,
+                        type=value_type,
+                    )
+                )
+            db_map.commit_session("Add test data")
+            scenario_filter_from_dict(db_map, scenario_filter_config("base", materialize=True))
+            entities = db_map.query(db_map.entity_sq).all()
+            self.assertEqual(len(entities), 2)
+            self.assertEqual(len(db_map.query(db_map.entity_element_sq).all()), 1)
+            values = db_map.query(db_map.parameter_value_sq).all()
+            self.assertEqual(len(values), 1)
+            self.assertEqual(from_database(values[0].value, values[0].type), 2.3)
+
+    def test_materialized_filter_is_resolved_again_after_commit(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + str(Path(temp_dir, "db.sqlite"))
+            with DatabaseMapping(url, create=True) as db_map:
+                self._build_data_with_single_scenario(db_map)
+            db_map.engine.dispose()
+            with DatabaseMapping(url) as filtered_db_map:
+                apply_scenario_filter_to_subqueries(filtered_db_map, "scenario", materialize=True)
+                self.assertEqual(len(filtered_db_map.query(filtered_db_map.parameter_value_sq).all()), 1)
+                with DatabaseMapping(url) as db_map:
+                    self._assert_success(db_map.add_entity_item(entity_class_name="object_class", name="object2"))
+                    value, value_type = to_database(5.0)
+                    self._assert_success(
+                        db_map.add_parameter_value_item(
+                            entity_class_name="object_class",
+                            entity_byname=("object2",),
+                            parameter_definition_name="parameter",
+                            value=value,
+                            type=value_type,
+                            alternative_name="alternative",
+                        )
+                    )
+                    db_map.commit_session("Add more data.")
+                db_map.engine.dispose()
+                values = filtered_db_map.query(filtered_db_map.parameter_value_sq).all()
+                self.assertEqual(sorted(from_database(value.value, value.type) for value in values), [5.0, 23.0])
+            filtered_db_map.engine.dispose()
+
+    def test_materialized_filter_fills_temporary_table_once_per_commit(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + str(Path(temp_dir, "db.sqlite"))
+            with DatabaseMapping(url, create=True) as db_map:
+                self._build_data_with_single_scenario(db_map)
+            db_map.engine.dispose()
+            with DatabaseMapping(url) as filtered_db_map:
+                apply_scenario_filter_to_subqueries(filtered_db_map, "scenario", materialize=True)
+                statements = []
+                listen(filtered_db_map.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+                for _ in range(3):
+                    self.assertEqual(len(filtered_db_map.query(filtered_db_map.parameter_value_sq).all()), 1)
+                    self.assertEqual(len(filtered_db_map.query(filtered_db_map.entity_sq).all()), 1)
+                inserts = [statement for statement in statements if statement.startswith("INSERT INTO materialized")]
+                self.assertEqual(len(inserts), 1)
+                with DatabaseMapping(url) as db_map:
+                    self._assert_success(db_map.add_entity_item(entity_class_name="object_class", name="object2"))
+                    db_map.commit_session("Add entity.")
+                db_map.engine.dispose()
+                self.assertEqual(len(filtered_db_map.query(filtered_db_map.entity_sq).all()), 2)
+                inserts = [statement for statement in statements if statement.startswith("INSERT INTO materialized")]
+                self.assertEqual(len(inserts), 2)
+            filtered_db_map.engine.dispose()
+
+
+class TestResolveScenarios(DataBuilderTestCase):
+    def test_resolves_values_and_entities_of_many_scenarios(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._build_data_with_single_scenario(db_map, commit=False)
+            self._assert_success(db_map.add_entity_item(entity_class_name="object_class", name="ghost"))
+            self._assert_success(
+                db_map.add_entity_alternative_item(
+                    entity_class_name="object_class",
+                    entity_byname=("ghost",),
+                    alternative_name="alternative",
+                    active=False,
+                )
+            )
+            self._assert_success(db_map.add_scenario_item(name="base_scenario"))
+            self._assert_success(
+                db_map.add_scenario_alternative_item(scenario_name="base_scenario", alternative_name="Base", rank=1)
+            )
+            self._assert_success(db_map.add_scenario_item(name="stacked_scenario"))
+            self._assert_success(
+                db_map.add_scenario_alternative_item(scenario_name="stacked_scenario", alternative_name="Base", rank=1)
+            )
+            self._assert_success(
+                db_map.add_scenario_alternative_item(
+                    scenario_name="stacked_scenario", alternative_name="alternative", rank=2
+                )
+            )
+            db_map.commit_session("Add test data.")
+            object_id = db_map.entity(entity_class_name="object_class", name="object")["id"].db_id
+            ghost_id = db_map.entity(entity_class_name="object_class", name="ghost")["id"].db_id
+            definition_id = db_map.parameter_definition(entity_class_name="object_class", name="parameter")["id"].db_id
+            views = resolve_scenarios(db_map, ["scenario", "base_scenario", "stacked_scenario"])
+        self.assertEqual(list(views), ["scenario", "base_scenario", "stacked_scenario"])
+        self.assertEqual(views["scenario"].parameter_value(object_id, definition_id), 23.0)
+        self.assertEqual(views["base_scenario"].parameter_value(object_id, definition_id), -1.0)
+        self.assertEqual(views["stacked_scenario"].parameter_value(object_id, definition_id), 23.0)
+        self.assertEqual(views["scenario"].parameter_value_ids(), views["stacked_scenario"].parameter_value_ids())
+        self.assertEqual(views["base_scenario"].entity_ids(), {object_id, ghost_id})
+        self.assertFalse(views["stacked_scenario"].is_entity_active(ghost_id))
+        self.assertEqual(list(views["stacked_scenario"].parameter_values()), [(object_id, definition_id, 23.0)])
+
+    def test_multidimensional_entities_follow_activity_of_their_elements_per_scenario(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._assert_success(db_map.add_entity_class_item(name="Unit", active_by_default=True))
+            self._assert_success(db_map.add_entity_class_item(name="Node", active_by_default=True))
+            self._assert_success(
+                db_map.add_entity_class_item(dimension_name_list=("Unit", "Node"), active_by_default=True)
+            )
+            self._assert_success(db_map.add_entity_item(entity_class_name="Node", name="n"))
+            for unit_name in ("u1", "u2"):
+                self._assert_success(db_map.add_entity_item(entity_class_name="Unit", name=unit_name))
+                self._assert_success(
+                    db_map.add_entity_item(entity_class_name="Unit__Node", entity_byname=(unit_name, "n"))
+                )
+            self._assert_success(db_map.add_alternative_item(name="no_u1"))
+            self._assert_success(
+                db_map.add_entity_alternative_item(
+                    entity_class_name="Unit", entity_byname=("u1",), alternative_name="no_u1", active=False
+                )
+            )
+            self._assert_success(db_map.add_scenario_item(name="base"))
+            self._assert_success(
+                db_map.add_scenario_alternative_item(scenario_name="base", alternative_name="Base", rank=1)
+            )
+            self._assert_success(db_map.add_scenario_item(name="without_u1"))
+            self._assert_success(
+                db_map.add_scenario_alternative_item(scenario_name="without_u1", alternative_name="Base", rank=1)
+            )
+            self._assert_success(
+                db_map.add_scenario_alternative_item(scenario_name="without_u1", alternative_name="no_u1", rank=2)
+            )
+            db_map.commit_session("Add test data.")
+            ids = {
+                name: db_map.entity(entity_class_name=class_name, entity_byname=byname)["id"].db_id
+                for name, class_name, byname in (
+                    ("u1", "Unit", ("u1",)),
+                    ("u2", "Unit", ("u2",)),
+                    ("n", "Node", ("n",)),
+                    ("u1__n", "Unit__Node", ("u1", "n")),
+                    ("u2__n", "Unit__Node", ("u2", "n")),
+                )
+            }
+            views = resolve_scenarios(db_map, ["base", "without_u1"])
+        self.assertEqual(views["base"].entity_ids(), set(ids.values()))
+        self.assertEqual(views["without_u1"].entity_ids(), {ids["u2"], ids["n"], ids["u2__n"]})
+        self.assertTrue(views["base"].is_entity_active(ids["u1__n"]))
+        self.assertFalse(views["without_u1"].is_entity_active(ids["u1__n"]))
+        self.assertTrue(views["without_u1"].is_entity_active(ids["u2__n"]))
+
+    def test_values_common_to_scenarios_are_parsed_once(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._assert_success(db_map.add_entity_class_item(name="Object", active_by_default=True))
+            self._assert_success(db_map.add_entity_item(entity_class_name="Object", name="widget"))
+            self._assert_success(db_map.add_parameter_definition_item(entity_class_name="Object", name="y"))
+            value, value_type = to_database(Map(["a", "b"], [1.0, 2.0]))
+            self._assert_success(
+                db_map.add_parameter_value_item(
+                    entity_class_name="Object",
+                    entity_byname=("widget",),
+                    parameter_definition_name="y",
+                    alternative_name="Base",
+                    value=value,
+                    type=value_type,
+                )
+            )
+            for scenario_name in ("first", "second"):
+                self._assert_success(db_map.add_scenario_item(name=scenario_name))
+                self._assert_success(
+                    db_map.add_scenario_alternative_item(scenario_name=scenario_name, alternative_name="Base", rank=1)
+                )
+            db_map.commit_session("Add test data.")
+            views = resolve_scenarios(db_map, ["first", "second"])
+        _, _, first_value = next(views["first"].parameter_values())
+        _, _, second_value = next(views["second"].parameter_values())
+        self.assertEqual(first_value, Map(["a", "b"], [1.0, 2.0]))
+        self.assertIs(first_value, second_value)
+
+    def test_raises_when_scenario_is_not_found(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            with self.assertRaisesRegex(SpineDBAPIError, "Scenario 'scenario' not found."):
+                resolve_scenarios(db_map, ["scenario"])
+
+
 class TestScenarioFilterUtils(DataBuilderTestCase):
     def test_scenario_filter_config(self):
         config = scenario_filter_config("scenario name")
@@ -1354,6 +1587,13 @@ class TestScenarioFilterUtils(DataBuilderTestCase):
         config = scenario_filter_shorthand_to_config("scenario:scenario name")
         self.assertEqual(config, {"type": "scenario_filter", "scenario": "scenario name"})
 
+    def test_materialized_scenario_filter_shorthand_round_trip(self):
+        config = scenario_filter_config("scenario name", materialize=True)
+        self.assertEqual(config, {"type": "scenario_filter", "scenario": "scenario name", "materialize": True})
+        shorthand = scenario_filter_config_to_shorthand(config)
+        self.assertEqual(shorthand, "materialized_scenario:scenario name")
+        self.assertEqual(scenario_filter_shorthand_to_config(shorthand), config)
+
 
 if __name__ == "__main__":
     unittest.main()
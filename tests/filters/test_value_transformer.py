@@ -21,6 +21,7 @@ from spinedb_api import (
     Map,
     TimeSeriesFixedResolution,
     append_filter_config,
+    apply_filter_stack,
     create_new_spine_database,
     from_database,
     import_object_classes,
@@ -154,6 +155,33 @@ class TestValueTransformerUsingDatabase(AssertSuccessTestCase):
                 self.assertEqual(values, [-23.0])
             db_map.engine.dispose()
 
+    def test_multiply_manipulator_on_time_series_and_map_with_mixed_values(self):
+        with TemporaryDirectory() as temp_dir:
+            db_url = URL.create("sqlite", database=Path(temp_dir, "test_value_transformer.sqlite").as_posix())
+            with DatabaseMapping(db_url, create=True) as out_db_map:
+                self._assert_imports(import_object_classes(out_db_map, ("class",)))
+                self._assert_imports(import_object_parameters(out_db_map, (("class", "parameter"),)))
+                self._assert_imports(import_objects(out_db_map, (("class", "object1"), ("class", "object2"))))
+                time_series = TimeSeriesFixedResolution("2021-06-07T08:00", "1h", [-5.0, 2.3], False, False)
+                mixed_map = Map(["a", "b", "c"], [2.0, "text", Map(["x"], [-1.5])])
+                self._assert_imports(
+                    import_object_parameter_values(
+                        out_db_map,
+                        (("class", "object1", "parameter", time_series), ("class", "object2", "parameter", mixed_map)),
+                    )
+                )
+                out_db_map.commit_session("Add test data.")
+            out_db_map.engine.dispose()
+            instructions = {"class": {"parameter": [{"operation": "multiply", "rhs": 10.0}]}}
+            config = value_transformer_config(instructions)
+            url = append_filter_config(str(db_url), config)
+            with DatabaseMapping(url) as db_map:
+                values = [from_database(row.value, row.type) for row in db_map.query(db_map.parameter_value_sq)]
+                expected_time_series = TimeSeriesFixedResolution("2021-06-07T08:00", "1h", [-50.0, 23.0], False, False)
+                expected_map = Map(["a", "b", "c"], [20.0, "text", Map(["x"], [-15.0])])
+                self.assertEqual(values, [expected_time_series, expected_map])
+            db_map.engine.dispose()
+
     def test_invert_manipulator(self):
         with TemporaryDirectory() as temp_dir:
             db_url = URL.create("sqlite", database=Path(temp_dir, "test_value_transformer.sqlite").as_posix())
@@ -174,6 +202,27 @@ class TestValueTransformerUsingDatabase(AssertSuccessTestCase):
                 self.assertEqual(values, [-1.0 / 2.3])
             db_map.engine.dispose()
 
+    def test_invert_manipulator_raises_on_zero_in_time_series(self):
+        with TemporaryDirectory() as temp_dir:
+            db_url = URL.create("sqlite", database=Path(temp_dir, "test_value_transformer.sqlite").as_posix())
+            with DatabaseMapping(db_url, create=True) as out_db_map:
+                self._assert_imports(import_object_classes(out_db_map, ("class",)))
+                self._assert_imports(import_object_parameters(out_db_map, (("class", "parameter"),)))
+                self._assert_imports(import_objects(out_db_map, (("class", "object"),)))
+                value = TimeSeriesFixedResolution("2021-06-07T08:00", "1h", [2.0, 0.0], False, False)
+                self._assert_imports(
+                    import_object_parameter_values(out_db_map, (("class", "object", "parameter", value),))
+                )
+                out_db_map.commit_session("Add test data.")
+            out_db_map.engine.dispose()
+            instructions = {"class": {"parameter": [{"operation": "invert"}]}}
+            config = value_transformer_config(instructions)
+            url = append_filter_config(str(db_url), config)
+            with DatabaseMapping(url) as db_map:
+                with self.assertRaises(ZeroDivisionError):
+                    db_map.query(db_map.parameter_value_sq).all()
+            db_map.engine.dispose()
+
     def test_multiple_instructions(self):
         with TemporaryDirectory() as temp_dir:
             db_url = URL.create("sqlite", database=Path(temp_dir, "test_value_transformer.sqlite").as_posix())
@@ -215,3 +264,98 @@ class TestValueTransformerUsingDatabase(AssertSuccessTestCase):
                 expected = Map([1.0, 2.0], [-5.0, -2.3])
                 self.assertEqual(values, [expected])
             db_map.engine.dispose()
+
+    def test_transforms_more_values_than_fit_into_single_compound_select(self):
+        value_count = 600
+        with TemporaryDirectory() as temp_dir:
+            db_url = URL.create("sqlite", database=Path(temp_dir, "test_value_transformer.sqlite").as_posix())
+            with DatabaseMapping(db_url, create=True) as out_db_map:
+                self._assert_imports(import_object_classes(out_db_map, ("class",)))
+                self._assert_imports(import_object_parameters(out_db_map, (("class", "parameter"),)))
+                object_names = [f"object_{i}" for i in range(value_count)]
+                self._assert_imports(import_objects(out_db_map, (("class", name) for name in object_names)))
+                self._assert_imports(
+                    import_object_parameter_values(
+                        out_db_map,
+                        (("class", name, "parameter", float(i)) for i, name in enumerate(object_names)),
+                    )
+                )
+                out_db_map.commit_session("Add test data.")
+            out_db_map.engine.dispose()
+            instructions = {"class": {"parameter": [{"operation": "negate"}]}}
+            config = value_transformer_config(instructions)
+            url = append_filter_config(str(db_url), config)
+            with DatabaseMapping(url) as db_map:
+                values = sorted(from_database(row.value, row.type) for row in db_map.query(db_map.parameter_value_sq))
+                self.assertEqual(values, sorted(-float(i) for i in range(value_count)))
+            db_map.engine.dispose()
+
+    def test_apply_filter_inside_open_session(self):
+        with TemporaryDirectory() as temp_dir:
+            db_url = URL.create("sqlite", database=Path(temp_dir, "test_value_transformer.sqlite").as_posix())
+            with DatabaseMapping(db_url, create=True) as out_db_map:
+                self._assert_imports(import_object_classes(out_db_map, ("class",)))
+                self._assert_imports(import_object_parameters(out_db_map, (("class", "parameter"),)))
+                self._assert_imports(import_objects(out_db_map, (("class", "object"),)))
+                self._assert_imports(
+                    import_object_parameter_values(out_db_map, (("class", "object", "parameter", -1.0),))
+                )
+                out_db_map.commit_session("Add test data.")
+            out_db_map.engine.dispose()
+            instructions = {"class": {"parameter": [{"operation": "negate"}]}}
+            with DatabaseMapping(db_url) as db_map:
+                db_map.query(db_map.entity_sq).all()
+                apply_filter_stack(db_map, [value_transformer_config(instructions)])
+                values = [from_database(row.value, row.type) for row in db_map.query(db_map.parameter_value_sq)]
+                self.assertEqual(values, [1.0])
+            with db_map:
+                values = [from_database(row.value, row.type) for row in db_map.query(db_map.parameter_value_sq)]
+                self.assertEqual(values, [1.0])
+            db_map.engine.dispose()
+
+    def test_restoring_parameter_value_sq_maker_removes_engine_listeners(self):
+        with TemporaryDirectory() as temp_dir:
+            db_url = URL.create("sqlite", database=Path(temp_dir, "test_value_transformer.sqlite").as_posix())
+            with DatabaseMapping(db_url, create=True) as out_db_map:
+                self._assert_imports(import_object_classes(out_db_map, ("class",)))
+                self._assert_imports(import_object_parameters(out_db_map, (("class", "parameter"),)))
+                self._assert_imports(import_objects(out_db_map, (("class", "object"),)))
+                self._assert_imports(
+                    import_object_parameter_values(out_db_map, (("class", "object", "parameter", -1.0),))
+                )
+                out_db_map.commit_session("Add test data.")
+            out_db_map.engine.dispose()
+            instructions = {"class": {"parameter": [{"operation": "negate"}]}}
+            with DatabaseMapping(db_url) as db_map:
+                listener_count = len(db_map.engine.dispatch.begin)
+                apply_filter_stack(db_map, [value_transformer_config(instructions)])
+                db_map.query(db_map.parameter_value_sq).all()
+                self.assertEqual(len(db_map.engine.dispatch.begin), listener_count + 1)
+                db_map.restore_parameter_value_sq_maker()
+                self.assertEqual(len(db_map.engine.dispatch.begin), listener_count)
+                self.assertEqual(len(db_map.engine.dispatch.rollback), 0)
+                values = [from_database(row.value, row.type) for row in db_map.query(db_map.parameter_value_sq)]
+                self.assertEqual(values, [-1.0])
+            db_map.engine.dispose()
+
+    def test_no_temporary_table_when_no_values_are_transformed(self):
+        with TemporaryDirectory() as temp_dir:
+            db_url = URL.create("sqlite", database=Path(temp_dir, "test_value_transformer.sqlite").as_posix())
+            with DatabaseMapping(db_url, create=True) as out_db_map:
+                self._assert_imports(import_object_classes(out_db_map, ("class",)))
+                self._assert_imports(import_object_parameters(out_db_map, (("class", "parameter"),)))
+                self._assert_imports(import_objects(out_db_map, (("class", "object"),)))
+                self._assert_imports(
+                    import_object_parameter_values(out_db_map, (("class", "object", "parameter", -1.0),))
+                )
+                out_db_map.commit_session("Add test data.")
+            out_db_map.engine.dispose()
+            instructions = {"class": {"other_parameter": [{"operation": "negate"}]}}
+            with DatabaseMapping(db_url) as db_map:
+                listener_count = len(db_map.engine.dispatch.begin)
+                apply_filter_stack(db_map, [value_transformer_config(instructions)])
+                values = [from_database(row.value, row.type) for row in db_map.query(db_map.parameter_value_sq)]
+                self.assertEqual(values, [-1.0])
+                self.assertEqual(len(db_map.engine.dispatch.begin), listener_count)
+                self.assertNotIn("transformed_parameter_value_", str(db_map.query(db_map.parameter_value_sq)))
+            db_map.engine.dispose()
@@ -12,9 +12,11 @@
 
 """Contains unit tests for the generator module."""
 
+from copy import deepcopy
 import unittest
 from spinedb_api import Array, DateTime, Duration, Map
-from spinedb_api.import_mapping.generator import get_mapped_data
+from spinedb_api.exception import InvalidMappingComponent
+from spinedb_api.import_mapping.generator import get_mapped_data, iter_mapped_data
 from spinedb_api.import_mapping.import_mapping import EntityClassMapping, default_import_mapping
 from spinedb_api.import_mapping.type_conversion import value_to_convert_spec
 from spinedb_api.mapping import to_dict, unflatten
@@ -1430,3 +1432,192 @@ class TestGetMappedData(unittest.TestCase):
                 ],
             },
         )
+
+
+class TestIterMappedData(unittest.TestCase):
+    def test_yields_mapped_data_for_each_chunk(self):
+        data_source = iter([["Object", "a", "1.0"], ["Object", "b", "2.0"], ["Object", "c", "3.0"]])
+        mappings = [
+            [
+                {"map_type": "ObjectClass", "position": 0},
+                {"map_type": "Object", "position": 1},
+                {"map_type": "ObjectMetadata", "position": "hidden"},
+                {"map_type": "ParameterDefinition", "position": "hidden", "value": "p"},
+                {"map_type": "Alternative", "position": "hidden", "value": "Base"},
+                {"map_type": "ParameterValueMetadata", "position": "hidden"},
+                {"map_type": "ParameterValue", "position": 2},
+            ]
+        ]
+        convert_functions = {2: value_to_convert_spec("float")}
+        chunks = list(iter_mapped_data(data_source, mappings, column_convert_fns=convert_functions, chunk_size=2))
+        self.assertEqual(
+            chunks,
+            [
+                (
+                    {
+                        "alternatives": {"Base"},
+                        "entity_classes": [["Object", []]],
+                        "entities": [["Object", "a"], ["Object", "b"]],
+                        "parameter_definitions": [["Object", "p"]],
+                        "parameter_values": [
+                            ["Object", ("a",), "p", 1.0, "Base"],
+                            ["Object", ("b",), "p", 2.0, "Base"],
+                        ],
+                    },
+                    [],
+                ),
+                (
+                    {
+                        "alternatives": {"Base"},
+                        "entity_classes": [["Object", []]],
+                        "entities": [["Object", "c"]],
+                        "parameter_definitions": [["Object", "p"]],
+                        "parameter_values": [["Object", ("c",), "p", 3.0, "Base"]],
+                    },
+                    [],
+                ),
+            ],
+        )
+
+    def test_indexed_value_spanning_chunks_is_yielded_with_last_chunk(self):
+        data_source = iter([["p", "a", "1.0"], ["p", "b", "2.0"], ["p", "c", "3.0"]])
+        mappings = [
+            [
+                {"map_type": "ObjectClass", "position": "hidden", "value": "Object"},
+                {"map_type": "Object", "position": "hidden", "value": "data"},
+                {"map_type": "ObjectMetadata", "position": "hidden"},
+                {"map_type": "ParameterDefinition", "position": 0},
+                {"map_type": "Alternative", "position": "hidden", "value": "Base"},
+                {"map_type": "ParameterValueMetadata", "position": "hidden"},
+                {"map_type": "ParameterValueType", "position": "hidden", "value": "map"},
+                {"map_type": "IndexName", "position": "hidden"},
+                {"map_type": "ParameterValueIndex", "position": 1},
+                {"map_type": "ExpandedValue", "position": 2},
+            ]
+        ]
+        convert_functions = {2: value_to_convert_spec("float")}
+        chunks = list(iter_mapped_data(data_source, mappings, column_convert_fns=convert_functions, chunk_size=1))
+        self.assertEqual(len(chunks), 3)
+        for mapped_data, errors in chunks[:-1]:
+            self.assertEqual(errors, [])
+            self.assertNotIn("parameter_values", mapped_data)
+            self.assertEqual(mapped_data["parameter_definitions"], [["Object", "p"]])
+        mapped_data, errors = chunks[-1]
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            mapped_data["parameter_values"],
+            [["Object", ("data",), "p", Map(["a", "b", "c"], [1.0, 2.0, 3.0]), "Base"]],
+        )
+
+    def test_pivoted_header_row_is_used_for_all_chunks(self):
+        data_source = iter([["", "T1", "T2"], ["Parameter_1", "5.0", "99.0"], ["Parameter_2", "2.3", "23.0"]])
+        mappings = [
+            [
+                {"map_type": "ObjectClass", "position": "hidden", "value": "Object"},
+                {"map_type": "Object", "position": "hidden", "value": "data"},
+                {"map_type": "ObjectMetadata", "position": "hidden"},
+                {"map_type": "ParameterDefinition", "position": 0},
+                {"map_type": "Alternative", "position": "hidden", "value": "Base"},
+                {"map_type": "ParameterValueMetadata", "position": "hidden"},
+                {"map_type": "ParameterValueType", "position": "hidden", "value": "map"},
+                {"map_type": "IndexName", "position": "hidden"},
+                {"map_type": "ParameterValueIndex", "position": -1},
+                {"map_type": "ExpandedValue", "position": "hidden"},
+            ]
+        ]
+        convert_function_specs = {0: "string", 1: "float", 2: "float"}
+        convert_functions = {column: value_to_convert_spec(spec) for column, spec in convert_function_specs.items()}
+        chunks = list(iter_mapped_data(data_source, mappings, column_convert_fns=convert_functions, chunk_size=1))
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(all(not errors for _, errors in chunks))
+        definitions = [
+            definition for mapped_data, _ in chunks for definition in mapped_data.get("parameter_definitions", [])
+        ]
+        self.assertEqual(definitions, [["Object", "Parameter_1"], ["Object", "Parameter_2"]])
+        mapped_data, _ = chunks[-1]
+        self.assertEqual(
+            mapped_data["parameter_values"],
+            [
+                ["Object", ("data",), "Parameter_1", Map(["T1", "T2"], [5.0, 99.0]), "Base"],
+                ["Object", ("data",), "Parameter_2", Map(["T1", "T2"], [2.3, 23.0]), "Base"],
+            ],
+        )
+
+    def test_indexed_value_is_yielded_once_rows_move_on_to_next_value(self):
+        data_source = iter([["p1", "a", "1.0"], ["p1", "b", "2.0"], ["p2", "a", "3.0"], ["p2", "b", "4.0"]])
+        mappings = [
+            [
+                {"map_type": "ObjectClass", "position": "hidden", "value": "Object"},
+                {"map_type": "Object", "position": "hidden", "value": "data"},
+                {"map_type": "ObjectMetadata", "position": "hidden"},
+                {"map_type": "ParameterDefinition", "position": 0},
+                {"map_type": "Alternative", "position": "hidden", "value": "Base"},
+                {"map_type": "ParameterValueMetadata", "position": "hidden"},
+                {"map_type": "ParameterValueType", "position": "hidden", "value": "map"},
+                {"map_type": "IndexName", "position": "hidden"},
+                {"map_type": "ParameterValueIndex", "position": 1},
+                {"map_type": "ExpandedValue", "position": 2},
+            ]
+        ]
+        convert_functions = {2: value_to_convert_spec("float")}
+        chunks = list(iter_mapped_data(data_source, mappings, column_convert_fns=convert_functions, chunk_size=3))
+        self.assertEqual(len(chunks), 2)
+        self.assertTrue(all(not errors for _, errors in chunks))
+        self.assertEqual(
+            chunks[0][0]["parameter_values"], [["Object", ("data",), "p1", Map(["a", "b"], [1.0, 2.0]), "Base"]]
+        )
+        self.assertEqual(
+            chunks[1][0]["parameter_values"], [["Object", ("data",), "p2", Map(["a", "b"], [3.0, 4.0]), "Base"]]
+        )
+
+    def test_indexed_value_in_non_adjacent_rows_is_reported(self):
+        data_source = iter([["p1", "a", "1.0"], ["p2", "a", "2.0"], ["p1", "b", "3.0"]])
+        mappings = [
+            [
+                {"map_type": "ObjectClass", "position": "hidden", "value": "Object"},
+                {"map_type": "Object", "position": "hidden", "value": "data"},
+                {"map_type": "ObjectMetadata", "position": "hidden"},
+                {"map_type": "ParameterDefinition", "position": 0},
+                {"map_type": "Alternative", "position": "hidden", "value": "Base"},
+                {"map_type": "ParameterValueMetadata", "position": "hidden"},
+                {"map_type": "ParameterValueType", "position": "hidden", "value": "map"},
+                {"map_type": "IndexName", "position": "hidden"},
+                {"map_type": "ParameterValueIndex", "position": 1},
+                {"map_type": "ExpandedValue", "position": 2},
+            ]
+        ]
+        convert_functions = {2: value_to_convert_spec("float")}
+        chunks = list(iter_mapped_data(data_source, mappings, column_convert_fns=convert_functions, chunk_size=1))
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(all(not errors for _, errors in chunks[:-1]))
+        self.assertEqual(
+            chunks[-1][1],
+            ["Rows of indexed value ('Object', ('data',), 'p1', 'Base') are not adjacent; the value is incomplete"],
+        )
+
+    def test_columns_of_later_chunks_are_accepted(self):
+        data_source = iter([["title"], ["Object", "a"]])
+        mappings = [
+            [{"map_type": "ObjectClass", "position": 0, "read_start_row": 1}, {"map_type": "Object", "position": 1}]
+        ]
+        chunks = list(iter_mapped_data(data_source, mappings, chunk_size=1))
+        self.assertEqual(chunks[-1], ({"entity_classes": [["Object", []]], "entities": [["Object", "a"]]}, []))
+
+    def test_column_ref_out_of_range_raises_before_chunk_is_yielded(self):
+        rows = [["Object", "a", 1.0], ["Object", "b", 2.0], ["Object", "c", 3.0]]
+        mappings = [[{"map_type": "EntityClass", "position": 0}, {"map_type": "Entity", "position": 5}]]
+        for chunk_size in (2, 10):
+            with self.subTest(chunk_size=chunk_size):
+                chunks = iter_mapped_data(iter(rows), deepcopy(mappings), chunk_size=chunk_size)
+                with self.assertRaisesRegex(InvalidMappingComponent, "Column ref 6 is out of range"):
+                    next(chunks)
+
+    def test_column_ref_out_of_range_raises_before_first_chunk_the_mapping_reads_is_yielded(self):
+        rows = [["title"], ["subtitle"], ["Object", "a"], ["Object", "b"]]
+        mappings = [
+            [{"map_type": "EntityClass", "position": 0, "read_start_row": 2}, {"map_type": "Entity", "position": 2}]
+        ]
+        chunks = iter_mapped_data(iter(rows), mappings, chunk_size=2)
+        self.assertEqual(next(chunks), ({}, []))
+        with self.assertRaisesRegex(InvalidMappingComponent, "Column ref 3 is out of range"):
+            next(chunks)
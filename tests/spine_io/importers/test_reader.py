@@ -60,6 +60,32 @@ class TestReader(unittest.TestCase):
         self.assertEqual(errors, [])
         self.assertEqual(mapped_data, {"entity_classes": [["A", []]], "entities": [["A", "b"]]})
 
+    def test_iter_mapped_data_yields_chunks(self):
+        reader = Reader(None)
+        reader.get_data_iterator = lambda *args: (iter([["A", "b"], ["A", "c"]]), [])
+        table_mappings = {
+            "table 1": [{"entity mapping": {"mapping": [EntityClassMapping(0).to_dict(), EntityMapping(1).to_dict()]}}]
+        }
+        chunks = list(reader.iter_mapped_data(table_mappings, {}, {}, {}, {}, chunk_size=1))
+        self.assertEqual(
+            chunks,
+            [
+                ({"entity_classes": [["A", []]], "entities": [["A", "b"]]}, []),
+                ({"entity_classes": [["A", []]], "entities": [["A", "c"]]}, []),
+            ],
+        )
+
+    def test_iter_mapped_data_can_handle_reader_error_in_data_iterator(self):
+        def failing_iterator():
+            if True:
+                raise ReaderError("error in iterator")
+            yield from []
+
+        reader = Reader(None)
+        reader.get_data_iterator = lambda *args: (failing_iterator(), [])
+        chunks = list(reader.iter_mapped_data({"table 1": []}, {}, {}, {}, {}))
+        self.assertEqual(chunks, [({}, ["error in iterator"])])
+
     def test_resolve_values_for_fixed_position_mappings(self):
         reader = Reader(None)
         root_mapping = AlternativeMapping(Position.fixed, value="5, 23")
@@ -33,6 +33,7 @@ from spinedb_api import (
     to_database,
 )
 from spinedb_api.db_mapping_base import PublicItem, Status
+from spinedb_api.db_mapping_commit_mixin import GapFillingIdAllocator
 from spinedb_api.exception import NothingToCommit
 from spinedb_api.filters.execution_filter import execution_filter_config
 from spinedb_api.filters.scenario_filter import scenario_filter_config
@@ -514,6 +515,148 @@ class TestDatabaseMapping(AssertSuccessTestCase):
             db_map.close()
             gc.collect()
 
+    def test_external_commits_go_unnoticed_within_commit_check_interval(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True, commit_check_interval=3600.0) as db_map:
+                self._assert_success(db_map.add_item("entity_class", name="omega"))
+                db_map.commit_session("Added a class")
+                with DatabaseMapping(url) as other_db_map:
+                    self._assert_success(other_db_map.add_item("entity_class", name="cc"))
+                    other_db_map.commit_session("Added a class")
+                other_db_map.close()
+                self.assertFalse(db_map.has_external_commits())
+                db_map.refresh_session()
+                db_map.fetch_all("entity_class")
+                self.assertEqual({x["name"] for x in db_map.find_entity_classes()}, {"omega", "cc"})
+            db_map.close()
+            gc.collect()
+
+    def test_fetch_all_applies_external_changes_incrementally(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_entity_class(name="Object")
+                db_map.add_entity(entity_class_name="Object", name="spoon", description="For soup.")
+                db_map.add_entity(entity_class_name="Object", name="fork")
+                db_map.commit_session("Add test data.")
+            db_map.close()
+            with DatabaseMapping(url) as db_map:
+                db_map.fetch_all("entity_class", "entity")
+                spoon = db_map.entity(entity_class_name="Object", name="spoon")
+                fork = db_map.entity(entity_class_name="Object", name="fork")
+                with DatabaseMapping(url) as other_db_map:
+                    other_db_map.entity(entity_class_name="Object", name="spoon").update(description="For cereal.")
+                    other_db_map.entity(entity_class_name="Object", name="fork").remove()
+                    other_db_map.add_entity(entity_class_name="Object", name="knife")
+                    other_db_map.commit_session("Modify entities.")
+                other_db_map.close()
+                with mock.patch.object(db_map, "_query_ids", wraps=db_map._query_ids) as query_ids:
+                    changed_items = db_map.fetch_all("entity")
+                    query_ids.assert_any_call("entity")
+                self.assertEqual(sorted(item["name"] for item in changed_items), ["knife", "spoon"])
+                self.assertEqual(spoon["description"], "For cereal.")
+                self.assertTrue(spoon.is_committed())
+                self.assertFalse(fork.is_valid())
+                self.assertEqual(sorted(entity["name"] for entity in db_map.find_entities()), ["knife", "spoon"])
+                with self.assertRaises(NothingToCommit):
+                    db_map.commit_session("Nothing should have changed.")
+            db_map.close()
+            gc.collect()
+
+    def test_fetch_all_refetches_everything_when_commits_may_become_visible_out_of_order(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_entity_class(name="Object")
+                db_map.add_entity(entity_class_name="Object", name="spoon")
+                db_map.commit_session("Add test data.")
+            db_map.close()
+            with DatabaseMapping(url) as db_map:
+                db_map.fetch_all("entity")
+                with DatabaseMapping(url) as other_db_map:
+                    other_db_map.add_entity(entity_class_name="Object", name="fork")
+                    other_db_map.commit_session("Add entity.")
+                other_db_map.close()
+                with (
+                    mock.patch.object(db_map, "_commits_in_id_order", return_value=False),
+                    mock.patch.object(db_map, "_query_ids", wraps=db_map._query_ids) as query_ids,
+                ):
+                    items = db_map.fetch_all("entity")
+                    query_ids.assert_not_called()
+                self.assertEqual(sorted(item["name"] for item in items), ["fork", "spoon"])
+            db_map.close()
+            gc.collect()
+
+    def test_uncommitted_value_survives_external_rename_of_its_entity(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_entity_class(name="Object")
+                db_map.add_parameter_definition(entity_class_name="Object", name="weight")
+                db_map.add_entity(entity_class_name="Object", name="spoon")
+                db_map.commit_session("Add test data.")
+            db_map.close()
+            with DatabaseMapping(url) as db_map:
+                db_map.fetch_all("entity", "parameter_value")
+                db_map.add_parameter_value(
+                    entity_class_name="Object",
+                    entity_byname=("spoon",),
+                    parameter_definition_name="weight",
+                    alternative_name="Base",
+                    parsed_value=2.3,
+                )
+                with DatabaseMapping(url) as other_db_map:
+                    other_db_map.entity(entity_class_name="Object", name="spoon").update(name="ladle")
+                    other_db_map.commit_session("Rename entity.")
+                other_db_map.close()
+                db_map.fetch_all("entity", "parameter_value")
+                values = db_map.find_parameter_values()
+                self.assertEqual(len(values), 1)
+                self.assertEqual(values[0]["entity_byname"], ("ladle",))
+                db_map.commit_session("Add value.")
+            db_map.close()
+            with DatabaseMapping(url) as db_map:
+                values = db_map.find_parameter_values()
+                self.assertEqual(len(values), 1)
+                self.assertEqual(values[0]["entity_byname"], ("ladle",))
+                self.assertEqual(values[0]["parsed_value"], 2.3)
+            db_map.close()
+            gc.collect()
+
+    def test_fetch_all_refetches_referrers_of_externally_renamed_item(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_entity_class(name="Object")
+                db_map.add_parameter_definition(entity_class_name="Object", name="weight")
+                db_map.add_entity(entity_class_name="Object", name="spoon")
+                db_map.add_parameter_value(
+                    entity_class_name="Object",
+                    entity_byname=("spoon",),
+                    parameter_definition_name="weight",
+                    alternative_name="Base",
+                    parsed_value=2.3,
+                )
+                db_map.commit_session("Add test data.")
+            db_map.close()
+            with DatabaseMapping(url) as db_map:
+                db_map.fetch_all("entity", "parameter_value")
+                with DatabaseMapping(url) as other_db_map:
+                    other_db_map.entity(entity_class_name="Object", name="spoon").update(name="ladle")
+                    other_db_map.commit_session("Rename entity.")
+                other_db_map.close()
+                db_map.fetch_all("entity", "parameter_value")
+                self.assertEqual([entity["name"] for entity in db_map.find_entities()], ["ladle"])
+                values = db_map.find_parameter_values()
+                self.assertEqual(len(values), 1)
+                self.assertEqual(values[0]["entity_byname"], ("ladle",))
+                self.assertEqual(values[0]["parsed_value"], 2.3)
+                with self.assertRaises(NothingToCommit):
+                    db_map.commit_session("Nothing should have changed.")
+            db_map.close()
+            gc.collect()
+
     def test_get_items_gives_commits(self):
         with DatabaseMapping("sqlite://", create=True) as db_map:
             items = db_map.get_items("commit")
@@ -3171,6 +3314,129 @@ class TestDatabaseMapping(AssertSuccessTestCase):
             db_map.close()
             gc.collect()
 
+    def test_find_entities_by_class_name_follows_updates_and_removals(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            db_map.add_entity_class(name="Object")
+            db_map.add_entity_class(name="Subject")
+            db_map.add_entity(entity_class_name="Object", name="spoon")
+            fork = db_map.add_entity(entity_class_name="Object", name="fork")
+            db_map.add_entity(entity_class_name="Subject", name="knife")
+            self.assertEqual([x["name"] for x in db_map.find_entities(entity_class_name="Object")], ["spoon", "fork"])
+            self.assertEqual([x["name"] for x in db_map.find_entities(entity_class_name="Subject")], ["knife"])
+            fork.update(name="plate")
+            self.assertEqual(db_map.find_entities(name="fork"), [])
+            self.assertEqual([x["name"] for x in db_map.find_entities(name="plate")], ["plate"])
+            fork.remove()
+            self.assertEqual([x["name"] for x in db_map.find_entities(entity_class_name="Object")], ["spoon"])
+            self.assertEqual(len(db_map.get_items("entity", entity_class_name="Object", skip_removed=False)), 2)
+            fork.restore()
+            self.assertEqual([x["name"] for x in db_map.find_entities(entity_class_name="Object")], ["spoon", "plate"])
+
+    def test_find_parameter_values_by_entity_id_after_fetch(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_entity_class(name="Object")
+                db_map.add_parameter_definition(entity_class_name="Object", name="Y")
+                for name in ("spoon", "fork"):
+                    db_map.add_entity(entity_class_name="Object", name=name)
+                    db_map.add_parameter_value(
+                        entity_class_name="Object",
+                        entity_byname=(name,),
+                        parameter_definition_name="Y",
+                        alternative_name="Base",
+                        parsed_value=2.3,
+                    )
+                db_map.commit_session("Add test data.")
+            db_map.close()
+            with DatabaseMapping(url) as db_map:
+                fork = db_map.entity(entity_class_name="Object", name="fork")
+                values = db_map.find_parameter_values(entity_id=fork["id"])
+                self.assertEqual(len(values), 1)
+                self.assertEqual(values[0]["entity_name"], "fork")
+                values = db_map.find_parameter_values(entity_id=fork["id"].db_id)
+                self.assertEqual(len(values), 1)
+                self.assertEqual(values[0]["entity_name"], "fork")
+            db_map.close()
+            gc.collect()
+
+    def test_find_by_db_ids_without_fetching_referenced_items_first(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_entity_class(name="Object")
+                db_map.add_parameter_definition(entity_class_name="Object", name="Y")
+                for name in ("spoon", "fork"):
+                    db_map.add_entity(entity_class_name="Object", name=name)
+                    db_map.add_parameter_value(
+                        entity_class_name="Object",
+                        entity_byname=(name,),
+                        parameter_definition_name="Y",
+                        alternative_name="Base",
+                        parsed_value=2.3,
+                    )
+                db_map.commit_session("Add test data.")
+                fork_db_id = db_map.entity(entity_class_name="Object", name="fork")["id"].db_id
+            db_map.close()
+            with DatabaseMapping(url) as db_map:
+                values = db_map.find_parameter_values(entity_id=fork_db_id)
+                self.assertEqual([value["entity_name"] for value in values], ["fork"])
+                entities = db_map.find_entities(id=fork_db_id)
+                self.assertEqual([entity["name"] for entity in entities], ["fork"])
+            db_map.close()
+            gc.collect()
+
+    def test_read_only_mapping_fetches_items(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_entity_class(name="Object")
+                db_map.add_entity_class(dimension_name_list=["Object", "Object"])
+                db_map.add_entity(entity_class_name="Object", name="spoon")
+                db_map.add_entity(entity_class_name="Object__Object", element_name_list=["spoon", "spoon"])
+                db_map.add_parameter_definition(entity_class_name="Object", name="Y")
+                db_map.add_parameter_value(
+                    entity_class_name="Object",
+                    entity_byname=("spoon",),
+                    parameter_definition_name="Y",
+                    alternative_name="Base",
+                    parsed_value=2.3,
+                )
+                db_map.commit_session("Add test data.")
+            db_map.close()
+            with DatabaseMapping(url, read_only=True) as db_map:
+                self.assertTrue(db_map.read_only)
+                items = db_map.fetch_all()
+                self.assertEqual(len([item for item in items if item.item_type == "entity"]), 2)
+                relationship = db_map.entity(entity_class_name="Object__Object", entity_byname=("spoon", "spoon"))
+                self.assertEqual(relationship["dimension_name_list"], ("Object", "Object"))
+                value = db_map.parameter_value(
+                    entity_class_name="Object",
+                    entity_byname=("spoon",),
+                    parameter_definition_name="Y",
+                    alternative_name="Base",
+                )
+                self.assertEqual(value["parsed_value"], 2.3)
+                self.assertTrue(value.is_valid())
+                self.assertEqual(len(db_map.get_entity_items()), 2)
+            db_map.close()
+            gc.collect()
+
+    def test_read_only_mapping_rejects_modifications(self):
+        with DatabaseMapping("sqlite://", create=True, read_only=True) as db_map:
+            with self.assertRaisesRegex(SpineDBAPIError, "database mapping is read-only"):
+                db_map.add_entity_class(name="Object")
+            item, error = db_map.add_item("entity_class", name="Object")
+            self.assertIsNone(item)
+            self.assertEqual(error, "database mapping is read-only")
+            alternative = db_map.alternative(name="Base")
+            with self.assertRaisesRegex(SpineDBAPIError, "database mapping is read-only"):
+                alternative.update(description="Modified.")
+            with self.assertRaisesRegex(SpineDBAPIError, "database mapping is read-only"):
+                alternative.remove()
+            with self.assertRaisesRegex(SpineDBAPIError, "database mapping is read-only"):
+                db_map.commit_session("Try to commit.")
+
     def test_fetch_all_returns_public_items(self):
         with TemporaryDirectory() as temp_dir:
             url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
@@ -6051,6 +6317,31 @@ class TestDatabaseMappingCommitMixin(AssertSuccessTestCase):
             ents = db_map.query(db_map.entity_sq).all()
             self.assertEqual(ents, [])
 
+    def test_new_ids_are_allocated_after_largest_id_by_default(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            for name in ("A", "B", "C"):
+                self._assert_success(db_map.add_entity_class_item(name=name))
+            db_map.commit_session("Add classes.")
+            db_map.remove_entity_class(name="A")
+            db_map.commit_session("Remove class.")
+            self._assert_success(db_map.add_entity_class_item(name="D"))
+            db_map.commit_session("Add another class.")
+            ids = {x.name: x.id for x in db_map.query(db_map.entity_class_sq)}
+            self.assertEqual(ids, {"B": 2, "C": 3, "D": 4})
+
+    def test_gap_filling_id_allocator_reuses_freed_ids(self):
+        with DatabaseMapping("sqlite://", create=True, id_allocator=GapFillingIdAllocator()) as db_map:
+            for name in ("A", "B", "C"):
+                self._assert_success(db_map.add_entity_class_item(name=name))
+            db_map.commit_session("Add classes.")
+            db_map.remove_entity_class(name="A")
+            db_map.commit_session("Remove class.")
+            self._assert_success(db_map.add_entity_class_item(name="D"))
+            self._assert_success(db_map.add_entity_class_item(name="E"))
+            db_map.commit_session("Add more classes.")
+            ids = {x.name: x.id for x in db_map.query(db_map.entity_class_sq)}
+            self.assertEqual(ids, {"B": 2, "C": 3, "D": 1, "E": 4})
+
 
 def _commit_on_thread(db_map, msg, lock):
     with db_map:
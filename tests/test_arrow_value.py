@@ -267,6 +267,167 @@ class TestFromDatabaseForTimeSeries(unittest.TestCase):
         self.assertEqual(fixed_resolution.schema.field("t").metadata, {b"ignore_year": b"false", b"repeat": b"false"})
         self.assertEqual(fixed_resolution.column("value").to_pylist(), [1.1, 1.2, 1.3])
 
+    def test_variable_resolution_series_metadata_is_read_from_index(self):
+        value, value_type = parameter_value.to_database(
+            parameter_value.TimeSeriesVariableResolution(
+                ["2025-02-05T09:59", "2025-02-05T10:14"], [1.1, 1.2], ignore_year=True, repeat=True
+            )
+        )
+        variable_resolution = arrow_value.from_database(value, value_type)
+        self.assertEqual(variable_resolution.schema.field("t").metadata, {b"ignore_year": b"true", b"repeat": b"true"})
+
+
+class TestFromDatabaseForEvenlyNestedMaps(unittest.TestCase):
+    def test_two_level_map(self):
+        value, value_type = parameter_value.to_database(
+            parameter_value.Map(
+                ["a", "b"],
+                [
+                    parameter_value.Map([1.0, 2.0], [-1.0, -2.0], index_name="nested index"),
+                    parameter_value.Map([3.0], [-3.0], index_name="nested index"),
+                ],
+                index_name="main index",
+            )
+        )
+        map_ = arrow_value.from_database(value, value_type)
+        self.assertEqual(map_.column_names, ["main index", "nested index", "value"])
+        self.assertEqual(map_.column("main index").type, pyarrow.string())
+        self.assertEqual(map_.column("main index").to_pylist(), ["a", "a", "b"])
+        self.assertEqual(map_.column("nested index").type, pyarrow.float64())
+        self.assertEqual(map_.column("nested index").to_pylist(), [1.0, 2.0, 3.0])
+        self.assertEqual(map_.column("value").type, pyarrow.float64())
+        self.assertEqual(map_.column("value").to_pylist(), [-1.0, -2.0, -3.0])
+
+    def test_date_time_indexes(self):
+        value, value_type = parameter_value.to_database(
+            parameter_value.Map(
+                [parameter_value.DateTime("2024-02-09T10:00"), parameter_value.DateTime("2024-02-09T11:00")],
+                ["a", "b"],
+            )
+        )
+        map_ = arrow_value.from_database(value, value_type)
+        self.assertEqual(map_.column_names, ["col_1", "value"])
+        self.assertEqual(map_.column("col_1").type, pyarrow.timestamp("s"))
+        self.assertEqual(
+            map_.column("col_1").to_pylist(), [datetime.datetime(2024, 2, 9, 10), datetime.datetime(2024, 2, 9, 11)]
+        )
+        self.assertEqual(map_.column("value").to_pylist(), ["a", "b"])
+
+
+class TestFromDatabaseForBinaryValues(unittest.TestCase):
+    def test_values_decode_like_their_json_counterparts(self):
+        for value in (
+            parameter_value.TimeSeriesFixedResolution("2025-02-05T09:59", "15m", [1.1, 1.2], False, True),
+            parameter_value.TimeSeriesVariableResolution(
+                ["2025-02-05T09:59", "2025-02-05T10:14"], [1.1, 1.2], ignore_year=False, repeat=False
+            ),
+            parameter_value.Array([2.3, 3.2], index_name="my index"),
+            parameter_value.Map([1.0, 2.0], [-1.0, -2.0], index_name="my index"),
+            parameter_value.Map([1.0, 2.0], [-1.0, -2.0]),
+        ):
+            with self.subTest(value=value):
+                from_binary = arrow_value.from_database(*parameter_value.to_database(value, binary=True))
+                from_json = arrow_value.from_database(*parameter_value.to_database(value))
+                self.assertTrue(from_binary.equals(from_json, check_metadata=True))
+
+
+class TestToDatabase(unittest.TestCase):
+    def _assert_round_trip(self, value):
+        record_batch = arrow_value.from_database(*parameter_value.to_database(value))
+        self.assertEqual(parameter_value.from_database(*arrow_value.to_database(record_batch)), value)
+
+    def test_scalars(self):
+        for value in (2.3, "text", True, None):
+            with self.subTest(value=value):
+                self.assertEqual(arrow_value.to_database(value), parameter_value.to_database(value))
+
+    def test_arrays(self):
+        self._assert_round_trip(parameter_value.Array([2.3, 3.2], index_name="my index"))
+        self._assert_round_trip(parameter_value.Array(["a", "b"]))
+        self._assert_round_trip(parameter_value.Array([parameter_value.DateTime("2024-09-02T05:51:00")]))
+
+    def test_time_series(self):
+        self._assert_round_trip(
+            parameter_value.TimeSeriesFixedResolution("2025-02-05T09:59", "15m", [1.1, 1.2, 1.3], True, False)
+        )
+        self._assert_round_trip(
+            parameter_value.TimeSeriesVariableResolution(
+                ["2025-02-05T09:59", "2025-02-05T10:14", "2025-02-05T11:31"], [1.1, 1.2, 1.3], False, True, "stamps"
+            )
+        )
+
+    def test_maps(self):
+        self._assert_round_trip(parameter_value.Map([], [], str))
+        self._assert_round_trip(parameter_value.Map(["key"], ["value"], index_name="Keys"))
+        self._assert_round_trip(
+            parameter_value.Map(
+                [parameter_value.DateTime("2024-02-09T10:00"), parameter_value.DateTime("2024-02-09T11:00")],
+                ["value", 2.3],
+                index_name="timestamps",
+            )
+        )
+
+    def test_unevenly_nested_map_with_time_series(self):
+        string_map = parameter_value.Map([11.0], ["value"], index_name="nested index")
+        float_map = parameter_value.Map(["key"], [22.0], index_name="nested index")
+        time_series = parameter_value.TimeSeriesFixedResolution(
+            "2025-02-26T09:00:00", "1h", [2.3, 23.0], ignore_year=False, repeat=False
+        )
+        time_series_map = parameter_value.Map([parameter_value.DateTime("2024-02-26T16:45:00")], [time_series])
+        nested_time_series_map = parameter_value.Map(
+            ["ts", "no ts"], [time_series_map, "empty"], index_name="nested index"
+        )
+        self._assert_round_trip(
+            parameter_value.Map(
+                ["not nested", "strings", "time series", "floats"],
+                ["none", string_map, nested_time_series_map, float_map],
+                index_name="main index",
+            )
+        )
+
+    def test_binary_output(self):
+        value = parameter_value.TimeSeriesVariableResolution(
+            ["2025-02-05T09:59", "2025-02-05T10:14", "2025-02-05T11:31"], [1.1, 1.2, 1.3], False, False
+        )
+        db_value, value_type = arrow_value.to_database(
+            arrow_value.from_database(*parameter_value.to_database(value)), binary=True
+        )
+        self.assertTrue(parameter_value.is_binary_db_value(db_value))
+        self.assertEqual(parameter_value.from_database(db_value, value_type), value)
+
+
+class TestTableFromDatabase(unittest.TestCase):
+    def test_values_are_stacked_with_keys(self):
+        db_values = [
+            parameter_value.to_database(
+                parameter_value.TimeSeriesVariableResolution(
+                    ["2025-02-05T09:00", "2025-02-05T10:00"], [1.1, 1.2], False, False
+                )
+            ),
+            parameter_value.to_database(
+                parameter_value.TimeSeriesFixedResolution("2025-02-05T09:00", "1h", [2.1], False, False)
+            ),
+        ]
+        table = arrow_value.table_from_database(db_values, keys=["first", "second"], key_name="name")
+        self.assertEqual(table.column_names, ["name", "t", "value"])
+        self.assertEqual(table.column("name").to_pylist(), ["first", "first", "second"])
+        self.assertEqual(
+            table.column("t").to_pylist(),
+            [datetime.datetime(2025, 2, 5, 9), datetime.datetime(2025, 2, 5, 10), datetime.datetime(2025, 2, 5, 9)],
+        )
+        self.assertEqual(table.column("value").to_pylist(), [1.1, 1.2, 2.1])
+
+    def test_scalars_and_missing_columns(self):
+        db_values = [
+            parameter_value.to_database(2.3),
+            parameter_value.to_database(parameter_value.Array([5.0], index_name="i")),
+        ]
+        table = arrow_value.table_from_database(db_values)
+        self.assertEqual(table.column_names, ["key", "value", "i"])
+        self.assertEqual(table.column("key").to_pylist(), [0, 1])
+        self.assertEqual(table.column("value").to_pylist(), [2.3, 5.0])
+        self.assertEqual(table.column("i").to_pylist(), [None, 0])
+
 
 if __name__ == "__main__":
     unittest.main()
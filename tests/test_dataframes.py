@@ -9,10 +9,13 @@
 # Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ######################################################################################################################
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import unittest
+from unittest import mock
 import numpy as np
 import pandas as pd
+import pyarrow
 from spinedb_api import DatabaseMapping, Map, to_database
 import spinedb_api.dataframes as spine_df
 from spinedb_api.parameter_value import FLOAT_VALUE_TYPE, DateTime, TimeSeriesVariableResolution
@@ -423,6 +426,40 @@ class TestFetchAsDataframe(AssertSuccessTestCase):
             )
             self.assertTrue(dataframe.equals(expected))
 
+    def test_decoding_with_executor_gives_same_dataframe(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._assert_success(db_map.add_entity_class_item(name="Object"))
+            self._assert_success(db_map.add_parameter_definition_item(name="y", entity_class_name="Object"))
+            self._assert_success(db_map.add_parameter_definition_item(name="z", entity_class_name="Object"))
+            for i, name in enumerate(("octopus", "squid", "nautilus")):
+                self._assert_success(db_map.add_entity_item(name=name, entity_class_name="Object"))
+                self._assert_success(
+                    db_map.add_parameter_value_item(
+                        entity_class_name="Object",
+                        entity_byname=(name,),
+                        parameter_definition_name="y",
+                        alternative_name="Base",
+                        parsed_value=Map(["A", "B"], [float(i), i + 0.5], index_name="Letter"),
+                    )
+                )
+                self._assert_success(
+                    db_map.add_parameter_value_item(
+                        entity_class_name="Object",
+                        entity_byname=(name,),
+                        parameter_definition_name="z",
+                        alternative_name="Base",
+                        parsed_value=float(i),
+                    )
+                )
+            db_map.commit_session("Add test data")
+            sq = spine_df.parameter_value_sq(db_map)
+            fetched_maps = spine_df.FetchedMaps.fetch(db_map)
+            expected = spine_df.fetch_as_dataframe(db_map, sq, fetched_maps)
+            with mock.patch.object(spine_df, "_DECODE_CHUNK_SIZE", 1), ThreadPoolExecutor(2) as executor:
+                dataframe = spine_df.fetch_as_dataframe(db_map, sq, fetched_maps, executor)
+        self.assertEqual(len(dataframe), 9)
+        self.assertTrue(dataframe.equals(expected))
+
 
 class TestFetchingAndConvertingItemsGiveEquivalentDataFrames(AssertSuccessTestCase):
     def test_simple_value(self):
@@ -589,22 +626,22 @@ class TestExpandValues(unittest.TestCase):
         self.assertTrue(resolved.equals(expected))
 
     def test_expand_simple_map(self):
-        value = pd.DataFrame({"x": ["A"], "value": [2.3]})
+        value = pyarrow.RecordBatch.from_pydict({"x": ["A"], "value": [2.3]})
         dataframe = pd.DataFrame({"Object": ["spoon"], "value": [value], "type": [Map.type_()]})
         resolved = spine_df._expand_values(dataframe)
         expected = pd.DataFrame({"Object": ["spoon"], "x": ["A"], "value": [2.3]})
         self.assertTrue(resolved.equals(expected))
 
     def test_expand_multirow_map(self):
-        value = pd.DataFrame({"x": ["A", "B"], "value": [2.3, 2.4]})
+        value = pyarrow.RecordBatch.from_pydict({"x": ["A", "B"], "value": [2.3, 2.4]})
         dataframe = pd.DataFrame({"Object": ["spoon"], "value": [value], "type": [Map.type_()]})
         resolved = spine_df._expand_values(dataframe)
         expected = pd.DataFrame({"Object": ["spoon", "spoon"], "x": ["A", "B"], "value": [2.3, 2.4]})
         self.assertTrue(resolved.equals(expected))
 
     def test_expand_multiple_multirow_maps_with_same_indexes(self):
-        value1 = pd.DataFrame({"x": ["A", "B"], "value": [2.3, 2.4]})
-        value2 = pd.DataFrame({"x": ["C", "D"], "value": [2.5, 2.6]})
+        value1 = pyarrow.RecordBatch.from_pydict({"x": ["A", "B"], "value": [2.3, 2.4]})
+        value2 = pyarrow.RecordBatch.from_pydict({"x": ["C", "D"], "value": [2.5, 2.6]})
         dataframe = pd.DataFrame(
             {"Object": ["spoon", "fork"], "value": [value1, value2], "type": [Map.type_(), Map.type_()]}
         )
@@ -615,8 +652,8 @@ class TestExpandValues(unittest.TestCase):
         self.assertTrue(resolved.equals(expected))
 
     def test_expand_multiple_multirow_maps_with_overlapping_indexes(self):
-        value1 = pd.DataFrame({"i": ["A", "B"], "j": ["a", "b"], "value": [2.3, 2.4]})
-        value2 = pd.DataFrame({"j": ["C", "D"], "k": ["c", "d"], "value": [2.5, 2.6]})
+        value1 = pyarrow.RecordBatch.from_pydict({"i": ["A", "B"], "j": ["a", "b"], "value": [2.3, 2.4]})
+        value2 = pyarrow.RecordBatch.from_pydict({"j": ["C", "D"], "k": ["c", "d"], "value": [2.5, 2.6]})
         dataframe = pd.DataFrame(
             {"Object": ["spoon", "fork"], "value": [value1, value2], "type": [Map.type_(), Map.type_()]}
         )
@@ -631,3 +668,22 @@ class TestExpandValues(unittest.TestCase):
             }
         )
         self.assertTrue(resolved.equals(expected))
+
+
+class TestStackRecordBatches(unittest.TestCase):
+    def test_batches_with_different_schemas_keep_their_order(self):
+        record_batches = [
+            pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(["A", "B"]), pyarrow.array([2.3, 2.4])], names=["x", "value"]
+            ),
+            pyarrow.RecordBatch.from_arrays([pyarrow.array([1.0]), pyarrow.array([5.0])], names=["y", "value"]),
+            pyarrow.RecordBatch.from_arrays([pyarrow.array(["C"]), pyarrow.array([2.5])], names=["x", "value"]),
+        ]
+        attributes = {}
+        stacked, row_counts = spine_df._stack_record_batches(record_batches, attributes)
+        self.assertEqual(row_counts, [2, 1, 1])
+        self.assertEqual(attributes, {})
+        expected = pd.DataFrame(
+            {"x": ["A", "B", np.nan, "C"], "value": [2.3, 2.4, 5.0, 2.5], "y": [np.nan, np.nan, 1.0, np.nan]}
+        )
+        self.assertTrue(stacked.equals(expected))
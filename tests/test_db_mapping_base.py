@@ -48,6 +48,29 @@ class TestMappedItemBase(unittest.TestCase):
             item["id"] = 23
             self.assertTrue(item.has_valid_id)
 
+    def test_fetched_items_have_no_instance_dict(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            db_map.add_entity_class(name="Object")
+            db_map.add_parameter_definition(entity_class_name="Object", name="Y")
+            db_map.commit_session("Add test data.")
+            db_map.reset()
+            item_types = ("alternative", "entity_class", "parameter_definition")
+            items = db_map.fetch_all(*item_types)
+            self.assertEqual({item.item_type for item in items}, set(item_types))
+            for item in items:
+                self.assertFalse(hasattr(item.mapped_item, "__dict__"))
+
+    def test_callbacks_are_created_on_demand(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            item = db_map.add_entity_class(name="Object")
+            mapped_item = item.mapped_item
+            self.assertIsNone(mapped_item._remove_callbacks)
+            calls = []
+            item.add_remove_callback(lambda x: calls.append(x) is not None)
+            item.remove()
+            self.assertEqual(calls, [mapped_item])
+            self.assertEqual(mapped_item.remove_callbacks, set())
+
 
 class TestPublicItem(AssertSuccessTestCase):
     def test_contains_operator(self):
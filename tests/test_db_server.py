@@ -11,6 +11,7 @@
 ######################################################################################################################
 """Unit tests for spine_db_server module."""
 
+import asyncio
 import os
 from tempfile import TemporaryDirectory
 import threading
@@ -18,8 +19,14 @@ import unittest
 from spinedb_api import Array, DateTime, Duration, Map, TimePattern, TimeSeriesVariableResolution, to_database
 from spinedb_api.db_mapping import DatabaseMapping
 from spinedb_api.filters.alternative_filter import alternative_filter_config
-from spinedb_api.spine_db_client import SpineDBClient
-from spinedb_api.spine_db_server import DBHandler, closing_spine_db_server, db_server_manager
+from spinedb_api.spine_db_client import AsyncSpineDBClient, SpineDBClient
+from spinedb_api.spine_db_server import (
+    AsyncDBServerManager,
+    DBHandler,
+    closing_async_spine_db_server,
+    closing_spine_db_server,
+    db_server_manager,
+)
 
 
 class TestDBServer(unittest.TestCase):
@@ -90,6 +97,76 @@ class TestDBServer(unittest.TestCase):
                 self.assertEqual([x["name"] for x in db_map.get_items("entity_class")], ["donkey", "monkey"])
             db_map.engine.dispose()
 
+    def test_concurrent_requests_share_persistent_connections(self):
+        def _add_alternative(client, name, results):
+            results[name] = client.call_method("add_alternative", name=name)
+
+        with closing_spine_db_server("sqlite://") as server_url:
+            client = SpineDBClient.from_server_url(server_url)
+            results = {}
+            threads = [
+                threading.Thread(target=_add_alternative, args=(client, f"alternative {i}", results)) for i in range(20)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(results), 20)
+            for name, result in results.items():
+                self.assertEqual(result["result"]["name"], name)
+            result = client.call_method("find_alternatives")
+            self.assertEqual(len(result["result"]), 21)
+
+    def test_queries_see_committed_changes_and_exports_see_uncommitted_ones(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with closing_spine_db_server(url) as server_url:
+                client = SpineDBClient.from_server_url(server_url)
+                client.call_method("add_entity_class", name="Object")
+                result = client.query("entity_class_sq")
+                self.assertEqual(result, {"result": {"entity_class_sq": []}})
+                result = client.export_data()
+                self.assertEqual(result["result"]["entity_classes"], [["Object", [], None, None, True]])
+                result = client.call_method("commit_session", "Add test data.")
+                self.assertNotIn("error", result)
+                result = client.query("entity_class_sq")
+                self.assertEqual([row["name"] for row in result["result"]["entity_class_sq"]], ["Object"])
+                result = client.export_data()
+                self.assertEqual(result["result"]["entity_classes"], [["Object", [], None, None, True]])
+
+    def test_concurrent_queries_respect_filters(self):
+        def _query_entities(client, results, index):
+            results[index] = client.query("entity_sq")
+
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_entity_class(name="Object")
+                db_map.add_entity(entity_class_name="Object", name="visible")
+                db_map.add_entity(entity_class_name="Object", name="hidden")
+                db_map.add_entity_alternative(
+                    entity_class_name="Object", entity_byname=("hidden",), alternative_name="Base", active=False
+                )
+                db_map.commit_session("Add test data.")
+            db_map.engine.dispose()
+            with closing_spine_db_server(url) as server_url:
+                client = SpineDBClient.from_server_url(server_url)
+                result = client.query("entity_sq")
+                self.assertCountEqual([row["name"] for row in result["result"]["entity_sq"]], ["visible", "hidden"])
+                self.assertEqual(client.apply_filters({"alternatives": ["Base"]}), {"result": True})
+                results = {}
+                threads = [threading.Thread(target=_query_entities, args=(client, results, i)) for i in range(10)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                self.assertEqual(len(results), 10)
+                for result in results.values():
+                    self.assertEqual([row["name"] for row in result["result"]["entity_sq"]], ["visible"])
+                self.assertEqual(client.clear_filters(), {"result": True})
+                result = client.query("entity_sq")
+                self.assertCountEqual([row["name"] for row in result["result"]["entity_sq"]], ["visible", "hidden"])
+
     def test_in_memory_database(self):
         url = "sqlite://"
         with closing_spine_db_server(url):
@@ -139,6 +216,76 @@ class TestDBServer(unittest.TestCase):
                     },
                 )
 
+    def test_columnar_query_and_export(self):
+        with closing_spine_db_server("sqlite://") as server_url:
+            client = SpineDBClient.from_server_url(server_url)
+            self._assert_import(
+                client.import_data(
+                    {
+                        "entity_classes": [("Object",)],
+                        "entities": [("Object", "widget")],
+                        "parameter_definitions": [("Object", "X")],
+                        "parameter_values": [("Object", "widget", "X", to_database(2.3))],
+                    },
+                    "Import test data.",
+                )
+            )
+            result = client.query("entity_class_sq", "entity_sq", columnar=True)
+            entity_classes = result["result"]["entity_class_sq"]
+            self.assertIn("id", entity_classes.column_names)
+            self.assertEqual(entity_classes.column("name").to_pylist(), ["Object"])
+            self.assertEqual(result["result"]["entity_sq"].column("name").to_pylist(), ["widget"])
+            result = client.export_data(columnar=True)
+            values = result["result"]["parameter_values"]
+            self.assertEqual(
+                values.to_pylist(),
+                [
+                    {
+                        "0": "Object",
+                        "1": "widget",
+                        "2": "X",
+                        "3": {"value": to_database(2.3)[0], "type": to_database(2.3)[1]},
+                        "4": "Base",
+                    }
+                ],
+            )
+
+    def test_iter_query_yields_rows_in_chunks(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + os.path.join(temp_dir, "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                for i in range(25):
+                    db_map.add_alternative(name=f"alternative {i}")
+                db_map.commit_session("Add test data.")
+            db_map.engine.dispose()
+            with closing_spine_db_server(url) as server_url:
+                client = SpineDBClient.from_server_url(server_url)
+                chunks = list(client.iter_query("alternative_sq", chunk_size=10))
+                self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 6])
+                names = {row["name"] for chunk in chunks for row in chunk}
+                self.assertEqual(names, {"Base"} | {f"alternative {i}" for i in range(25)})
+                abandoned = client.iter_query("alternative_sq", chunk_size=1)
+                self.assertEqual(len(next(abandoned)), 1)
+                abandoned.close()
+                result = client.query("alternative_sq")
+                self.assertEqual(len(result["result"]["alternative_sq"]), 26)
+
+    def test_iter_export_data_yields_chunks_of_item_types(self):
+        with closing_spine_db_server("sqlite://") as server_url:
+            client = SpineDBClient.from_server_url(server_url)
+            self._assert_import(
+                client.import_data(
+                    {"entity_classes": [("Object",)], "entities": [("Object", f"widget {i}") for i in range(5)]},
+                    "Import test data.",
+                )
+            )
+            chunks = list(client.iter_export_data(chunk_size=2))
+            self.assertEqual(
+                [key for key, _ in chunks], ["entity_classes", "entities", "entities", "entities", "alternatives"]
+            )
+            entities = [entity for key, chunk in chunks if key == "entities" for entity in chunk]
+            self.assertEqual(entities, [["Object", f"widget {i}", None] for i in range(5)])
+
     def test_export_parameter_values(self):
         with closing_spine_db_server("sqlite://") as server_url:
             client = SpineDBClient.from_server_url(server_url)
@@ -321,3 +468,71 @@ class TestDBServer(unittest.TestCase):
             result = client.call_method("find_entity_groups", entity_class_name="Object", group_name="group")
             self.assertIsInstance(result["result"], list)
             self.assertEqual(len(result["result"]), 1)
+
+
+class TestAsyncDBServer(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_requests_and_streams(self):
+        async with closing_async_spine_db_server("sqlite://") as server_url:
+            async with AsyncSpineDBClient.from_server_url(server_url) as client:
+                results = await asyncio.gather(
+                    *(client.call_method("add_alternative", name=f"alternative {i}") for i in range(20))
+                )
+                for i, result in enumerate(results):
+                    self.assertEqual(result["result"]["name"], f"alternative {i}")
+                result = await client.call_method("commit_session", "Add alternatives.")
+                self.assertNotIn("error", result)
+                chunks = [chunk async for chunk in client.iter_query("alternative_sq", chunk_size=10)]
+                self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 1])
+                abandoned = client.iter_query("alternative_sq", chunk_size=1)
+                self.assertEqual(len(await abandoned.__anext__()), 1)
+                await abandoned.aclose()
+                result = await client.query("alternative_sq")
+                self.assertEqual(len(result["result"]["alternative_sq"]), 21)
+
+    async def test_ordering(self):
+        async def _import_entity_class(server_url, class_name):
+            async with AsyncSpineDBClient.from_server_url(server_url) as client:
+                await client.db_checkin()
+                result = await client.import_data({"entity_classes": [(class_name, ())]}, f"Import {class_name}")
+                self.assertEqual(result["result"], [1, []])
+                await client.db_checkout()
+
+        with TemporaryDirectory() as temp_dir:
+            db_url = "sqlite:///" + os.path.join(temp_dir, "database.sqlite")
+            async with AsyncDBServerManager() as manager:
+                first_ordering = {
+                    "id": "second_before_first",
+                    "current": "first",
+                    "precursors": {"second"},
+                    "part_count": 1,
+                }
+                second_ordering = {
+                    "id": "second_before_first",
+                    "current": "second",
+                    "precursors": set(),
+                    "part_count": 1,
+                }
+                first_server_url = await manager.start_server(db_url, ordering=first_ordering)
+                second_server_url = await manager.start_server(db_url, ordering=second_ordering)
+                first = asyncio.create_task(_import_entity_class(first_server_url, "monkey"))
+                await asyncio.sleep(0.1)
+                with DatabaseMapping(db_url) as db_map:
+                    self.assertEqual(db_map.get_items("entity_class"), [])
+                db_map.engine.dispose()
+                await _import_entity_class(second_server_url, "donkey")
+                await first
+            with DatabaseMapping(db_url) as db_map:
+                self.assertEqual([x["name"] for x in db_map.get_items("entity_class")], ["donkey", "monkey"])
+            db_map.engine.dispose()
+
+    async def test_synchronous_client_works_with_async_server(self):
+        def _add_entity_class(server_url):
+            client = SpineDBClient.from_server_url(server_url)
+            return client.import_data({"entity_classes": [("Object",)]}, "Import test data.")
+
+        async with closing_async_spine_db_server("sqlite://") as server_url:
+            result = await asyncio.to_thread(_add_entity_class, server_url)
+            self.assertEqual(result["result"], [1, []])
+            async with AsyncSpineDBClient.from_server_url(server_url) as client:
+                result = await client.export_data()
+            self.assertEqual(result["result"]["entity_classes"], [["Object", [], None, None, True]])
@@ -13,6 +13,7 @@
 
 import pathlib
 from tempfile import TemporaryDirectory
+import pytest
 from spinedb_api import (
     DatabaseMapping,
     export_alternatives,
@@ -42,6 +43,7 @@ from spinedb_api.export_functions import (
     export_parameter_types,
     export_parameter_value_metadata,
     export_parameter_values,
+    iter_export_data,
 )
 from spinedb_api.helpers import DisplayStatus
 from tests.mock_helpers import AssertSuccessTestCase
@@ -458,3 +460,40 @@ class TestExportFunctions(AssertSuccessTestCase):
                 exported["entity_class_display_modes"],
                 [("display_mode", "object_class", 1, DisplayStatus.hidden.name, None, None)],
             )
+
+
+class TestIterExportData:
+    def test_yields_same_data_as_export_data_one_item_type_at_a_time(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            db_map.add_entity_class(name="Object")
+            db_map.add_entity(entity_class_name="Object", name="spoon")
+            db_map.add_parameter_definition(entity_class_name="Object", name="Y")
+            db_map.add_parameter_value(
+                entity_class_name="Object",
+                entity_byname=("spoon",),
+                parameter_definition_name="Y",
+                alternative_name="Base",
+                parsed_value=2.3,
+            )
+            exported = list(iter_export_data(db_map))
+            assert [key for key, _ in exported] == [
+                "entity_classes",
+                "entities",
+                "parameter_definitions",
+                "parameter_values",
+                "alternatives",
+            ]
+            assert dict(exported) == export_data(db_map)
+
+    def test_ids_limit_exported_items(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            db_map.add_alternative(name="alt")
+            base = db_map.alternative(name="Base")
+            assert list(iter_export_data(db_map, alternative_ids=[base["id"]])) == [
+                ("alternatives", [("Base", "Base alternative")])
+            ]
+
+    def test_unknown_keyword_argument_raises(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            with pytest.raises(TypeError):
+                list(iter_export_data(db_map, gadget_ids=[]))
@@ -36,6 +36,19 @@ def test_add_new_entity(tmp_path):
         assert tom["commit_id"] == latest_commit.id
 
 
+def test_maps_with_same_filters_share_table_to_subquery_map(tmp_path):
+    url = "sqlite:///" + str(tmp_path / "db.sqlite")
+    with DatabaseMapping(url, create=True) as db_map:
+        db_map.add_alternative(name="other")
+        db_map.commit_session("Add alternative.")
+    filtered_url = append_filter_config(url, alternative_filter_config(["other"]))
+    with DatabaseMapping(filtered_url) as db_map, DatabaseMapping(filtered_url) as other_db_map:
+        table_to_sq_attr = db_map._get_table_to_sq_attr()
+        assert other_db_map._get_table_to_sq_attr() is table_to_sq_attr
+        assert "_alternative_sq" in table_to_sq_attr["alternative"]
+        assert [row.name for row in other_db_map.query(other_db_map.alternative_sq)] == ["other"]
+
+
 def test_add_stuff_thats_been_filtered_out(tmp_path):
     url = "sqlite:///" + str(tmp_path / "db.sqlite")
     with DatabaseMapping(url, create=True) as db_map:
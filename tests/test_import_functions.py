@@ -11,11 +11,13 @@
 ######################################################################################################################
 """Unit tests for import_functions.py."""
 
+from unittest import mock
 import pytest
 from spinedb_api.db_mapping import DatabaseMapping
 from spinedb_api.exception import NothingToCommit
 from spinedb_api.helpers import DisplayStatus
 from spinedb_api.import_functions import (
+    _ParameterValueReferences,
     import_alternatives,
     import_data,
     import_display_modes,
@@ -1286,6 +1288,60 @@ class TestImportParameterValue(AssertSuccessTestCase):
             expected = {"object1": b'"first"'}
             self.assertEqual(values, expected)
 
+    def test_reimporting_same_object_parameter_value_imports_nothing(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self.populate(db_map)
+            count = self._assert_imports(
+                import_object_parameter_values(db_map, [["object_class1", "object1", "parameter", 2.3]])
+            )
+            self.assertEqual(count, 1)
+            count = self._assert_imports(
+                import_object_parameter_values(db_map, [["object_class1", "object1", "parameter", 2.3]])
+            )
+            self.assertEqual(count, 0)
+
+    def test_imported_object_parameter_value_can_be_found_and_updated(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self.populate(db_map)
+            self._assert_imports(
+                import_object_parameter_values(db_map, [["object_class1", "object1", "parameter", 2.3]])
+            )
+            value_item = db_map.item(
+                db_map.mapped_table("parameter_value"),
+                entity_class_name="object_class1",
+                entity_byname=("object1",),
+                parameter_definition_name="parameter",
+                alternative_name="Base",
+            )
+            self.assertEqual(value_item["parsed_value"], 2.3)
+            value_item.update(parsed_value=5.0)
+            db_map.commit_session("test")
+            values = {v.object_name: v.value for v in db_map.query(db_map.object_parameter_value_sq)}
+            self.assertEqual(values, {"object1": b"5.0"})
+
+    def test_import_object_parameter_value_replaces_removed_value(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self.populate(db_map)
+            self._assert_imports(
+                import_object_parameter_values(db_map, [["object_class1", "object1", "parameter", 2.3]])
+            )
+            db_map.commit_session("Add value.")
+            value_item = db_map.item(
+                db_map.mapped_table("parameter_value"),
+                entity_class_name="object_class1",
+                entity_byname=("object1",),
+                parameter_definition_name="parameter",
+                alternative_name="Base",
+            )
+            value_item.remove()
+            count = self._assert_imports(
+                import_object_parameter_values(db_map, [["object_class1", "object1", "parameter", 5.0]])
+            )
+            self.assertEqual(count, 1)
+            db_map.commit_session("Replace value.")
+            values = {v.object_name: v.value for v in db_map.query(db_map.object_parameter_value_sq)}
+            self.assertEqual(values, {"object1": b"5.0"})
+
     def test_import_object_parameter_value_with_alternative(self):
         with DatabaseMapping("sqlite://", create=True) as db_map:
             self.populate(db_map)
@@ -1577,6 +1633,30 @@ class TestImportParameterValue(AssertSuccessTestCase):
             )
             self.assertEqual(time_series, expected_result)
 
+    def test_value_references_are_resolved_once_per_import(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            data = {
+                "entity_classes": [("Object",)],
+                "entities": [("Object", "widget")],
+                "parameter_definitions": [("Object", "y")],
+                "parameter_values": [("Object", "widget", "y", 2.3, "Base")],
+            }
+            with mock.patch(
+                "spinedb_api.import_functions._ParameterValueReferences", wraps=_ParameterValueReferences
+            ) as references_constructor:
+                count = self._assert_imports(import_data(db_map, **data))
+            self.assertEqual(count, 4)
+            references_constructor.assert_called_once_with(db_map)
+            self.assertEqual(
+                db_map.get_parameter_value_item(
+                    entity_class_name="Object",
+                    entity_byname=("widget",),
+                    parameter_definition_name="y",
+                    alternative_name="Base",
+                )["parsed_value"],
+                2.3,
+            )
+
 
 class TestImportParameterValueList(AssertSuccessTestCase):
     def test_list_with_single_value(self):
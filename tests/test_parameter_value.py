@@ -20,7 +20,10 @@ import dateutil.parser
 from dateutil.relativedelta import relativedelta
 import numpy as np
 import numpy.testing
+import pytest
+from spinedb_api.exception import ParameterValueFormatError
 from spinedb_api.parameter_value import (
+    NUMPY_DATETIME_DTYPE,
     Array,
     DateTime,
     Duration,
@@ -29,6 +32,8 @@ from spinedb_api.parameter_value import (
     TimeSeries,
     TimeSeriesFixedResolution,
     TimeSeriesVariableResolution,
+    ValueMetadata,
+    clear_parse_cache,
     convert_containers_to_maps,
     convert_leaf_maps_to_specialized_containers,
     convert_map_to_table,
@@ -36,10 +41,16 @@ from spinedb_api.parameter_value import (
     duration_to_relativedelta,
     fancy_type_to_type_and_rank,
     from_database,
+    is_binary_db_value,
+    load_db_value,
+    merge,
+    parse_cache_info,
     relativedelta_to_duration,
+    set_parse_cache_limits,
     to_database,
     type_and_rank_to_fancy_type,
     type_for_value,
+    value_metadata,
 )
 
 
@@ -1115,6 +1126,22 @@ class TestTimeSeriesVariableResolution:
         time_series.set_value(np.datetime64("2025-07-01T16:45"), -3.2)
         assert time_series.get_value(np.datetime64("2025-07-01T16:45")) == -3.2
 
+    def test_two_column_and_dictionary_formats_decode_identically(self):
+        stamps = ["2025-07-01T15:45:00", "2025-07-01T16:45:00", "2025-07-02T00:00:00"]
+        values = [2.3, 3.2, -1.0]
+        two_columns = json.dumps({"type": "time_series", "data": [list(pair) for pair in zip(stamps, values)]})
+        dictionary = json.dumps({"type": "time_series", "data": dict(zip(stamps, values))})
+        from_two_columns = from_database(two_columns.encode(), "time_series")
+        from_dictionary = from_database(dictionary.encode(), "time_series")
+        assert from_two_columns == from_dictionary
+        numpy.testing.assert_array_equal(from_dictionary.indexes, np.array(stamps, dtype=NUMPY_DATETIME_DTYPE))
+        numpy.testing.assert_array_equal(from_dictionary.values, np.array(values))
+
+    def test_invalid_time_stamp_raises(self):
+        dictionary = json.dumps({"type": "time_series", "data": {"2025-07-01T15:45": 2.3, "yesterday": 3.2}})
+        with pytest.raises(ParameterValueFormatError, match='"yesterday"'):
+            from_database(dictionary.encode(), "time_series")
+
 
 class TestTimeSeriesFixedResolution:
     def test_get_value(self):
@@ -1226,5 +1253,178 @@ class TestTypeForValue(unittest.TestCase):
         self.assertEqual(type_for_value(Map(["a", "b"], [Map(["i"], [2.3]), 23.0])), ("map", 2))
 
 
+class TestBinaryValueFormat(unittest.TestCase):
+    def _assert_round_trip(self, value):
+        db_value, value_type = to_database(value, binary=True)
+        self.assertTrue(is_binary_db_value(db_value))
+        self.assertEqual(value_type, value.TYPE)
+        self.assertEqual(from_database(db_value, value_type), value)
+        return db_value, value_type
+
+    def test_fixed_resolution_time_series(self):
+        value = TimeSeriesFixedResolution(
+            "2023-01-01T00:00", ["1h", "2h"], np.linspace(0.0, 1.0, 8760), False, True, "time"
+        )
+        db_value, _ = self._assert_round_trip(value)
+        decoded = from_database(db_value, "time_series")
+        decoded.set_value(np.datetime64("2023-01-01T00:00:00"), -1.0)
+        self.assertEqual(decoded.values[0], -1.0)
+
+    def test_variable_resolution_time_series(self):
+        value = TimeSeriesVariableResolution(
+            ["2023-01-01T00:00", "2023-01-01T01:00", "2023-01-03T00:00"], [1.0, np.nan, -2.3], True, False
+        )
+        self._assert_round_trip(value)
+
+    def test_float_array(self):
+        self._assert_round_trip(Array([1.0, 2.3, 4.5], index_name="idx"))
+
+    def test_flat_maps_of_floats(self):
+        self._assert_round_trip(Map([1.0, 2.0], [-1.0, 1.5], index_name="x1"))
+        self._assert_round_trip(Map([DateTime("2023-01-01T00:00"), DateTime("2023-01-02T00:00")], [2.3, 5.0]))
+
+    def test_values_without_binary_representation_fall_back_to_json(self):
+        for value in (
+            2.3,
+            "text",
+            None,
+            Array(["a", "b"]),
+            Map(["a"], [2.3]),
+            Map([1.0], [Map(["a"], [2.3])]),
+            Map([DateTime("2023-01-01T00:00:00.5")], [2.3]),
+            TimePattern(["D1-7"], [8.0]),
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(to_database(value, binary=True), to_database(value))
+
+    def test_load_db_value_gives_json_compatible_dict(self):
+        value = TimeSeriesVariableResolution(["2023-01-01T00:00", "2023-01-01T01:00"], [1.0, 2.0], False, False)
+        db_value, value_type = to_database(value, binary=True)
+        self.assertEqual(load_db_value(db_value, value_type), load_db_value(*to_database(value)))
+
+    def test_merge_keeps_format_of_recipient(self):
+        value = TimeSeriesVariableResolution(["2023-01-01T00:00"], [1.0], False, False)
+        other = TimeSeriesVariableResolution(["2023-01-01T01:00"], [2.0], False, False)
+        merged_value, merged_type = merge(to_database(value, binary=True), to_database(other))
+        self.assertTrue(is_binary_db_value(merged_value))
+        self.assertEqual(
+            from_database(merged_value, merged_type),
+            TimeSeriesVariableResolution(["2023-01-01T00:00", "2023-01-01T01:00"], [1.0, 2.0], False, False),
+        )
+        merged_value, _ = merge(to_database(value), to_database(other, binary=True))
+        self.assertFalse(is_binary_db_value(merged_value))
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self._limits = parse_cache_info()[-2:]
+        clear_parse_cache()
+
+    def tearDown(self):
+        set_parse_cache_limits(*self._limits)
+        clear_parse_cache()
+
+    def test_repeated_parsing_hits_cache(self):
+        time_series = TimeSeriesFixedResolution("2023-01-01T00:00", "1h", list(range(100)), False, False)
+        db_value, value_type = to_database(time_series)
+        first = from_database(db_value, value_type)
+        second = from_database(db_value, value_type)
+        self.assertEqual(first, second)
+        info = parse_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.entries, 1)
+        self.assertEqual(info.bytes, len(db_value))
+
+    def test_parsed_values_are_private_copies(self):
+        db_value, value_type = to_database(Map(list(map(str, range(20))), list(map(float, range(20)))))
+        value = from_database(db_value, value_type)
+        value.set_value("0", -1.0)
+        self.assertEqual(from_database(db_value, value_type).get_value("0"), 0.0)
+
+    def test_nested_maps_of_parsed_values_are_private_copies(self):
+        leaf = Map(list(map(str, range(20))), list(map(float, range(20))))
+        db_value, value_type = to_database(Map(["a", "b"], [leaf, deep_copy_value(leaf)]))
+        value = from_database(db_value, value_type)
+        value.get_value("a").set_value("0", -1.0)
+        cached_value = from_database(db_value, value_type)
+        self.assertEqual(cached_value.get_value("a").get_value("0"), 0.0)
+        cached_value.get_value("b").set_value("0", -1.0)
+        self.assertEqual(from_database(db_value, value_type).get_value("b").get_value("0"), 0.0)
+        self.assertEqual(parse_cache_info().hits, 2)
+
+    def test_small_values_are_not_cached(self):
+        db_value, value_type = to_database(2.3)
+        self.assertEqual(from_database(db_value, value_type), 2.3)
+        self.assertEqual(parse_cache_info().entries, 0)
+
+    def test_least_recently_used_values_are_evicted(self):
+        set_parse_cache_limits(2, 2**20)
+        db_values = [to_database(Array([float(i)] * 50)) for i in range(3)]
+        for db_value, value_type in db_values:
+            from_database(db_value, value_type)
+        self.assertEqual(parse_cache_info().entries, 2)
+        from_database(*db_values[0])
+        self.assertEqual(parse_cache_info().hits, 0)
+        from_database(*db_values[2])
+        self.assertEqual(parse_cache_info().hits, 1)
+
+    def test_zero_limit_disables_cache(self):
+        set_parse_cache_limits(0, 0)
+        db_value, value_type = to_database(Array([2.3] * 50))
+        from_database(db_value, value_type)
+        from_database(db_value, value_type)
+        info = parse_cache_info()
+        self.assertEqual(info.entries, 0)
+        self.assertEqual(info.hits, 0)
+
+
+class TestValueMetadata(unittest.TestCase):
+    def test_scalars(self):
+        self.assertEqual(value_metadata(*to_database(2.3)), ValueMetadata("float", 0, None, None, None))
+        self.assertEqual(value_metadata(*to_database(None)), ValueMetadata(None, 0, None, None, None))
+
+    def test_nested_map(self):
+        value = Map(["a", "b,]"], [Map([1.0, 2.0], [-1.0, -2.0]), 2.3], index_name="idx")
+        self.assertEqual(value_metadata(*to_database(value)), ValueMetadata("map", 2, 2, "str", "idx"))
+
+    def test_empty_map(self):
+        self.assertEqual(value_metadata(*to_database(Map([], [], str))), ValueMetadata("map", 1, 0, "str", "x"))
+
+    def test_time_series(self):
+        value = TimeSeriesFixedResolution("2023-01-01T00:00", "1h", [1.0, 2.0, 3.0], False, False)
+        self.assertEqual(value_metadata(*to_database(value)), ValueMetadata("time_series", 1, 3, None, "t"))
+        value = TimeSeriesVariableResolution(
+            ["2023-01-01T00:00", "2023-01-01T03:00"], [1.0, 2.0], True, False, index_name="stamp"
+        )
+        self.assertEqual(value_metadata(*to_database(value)), ValueMetadata("time_series", 1, 2, None, "stamp"))
+
+    def test_array_and_time_pattern(self):
+        self.assertEqual(value_metadata(*to_database(Array(["a", "b"]))), ValueMetadata("array", 1, 2, None, "i"))
+        value = TimePattern(["M1-6", "M7-12"], [1.0, 2.0], index_name="pattern")
+        self.assertEqual(value_metadata(*to_database(value)), ValueMetadata("time_pattern", 1, 2, None, "pattern"))
+
+    def test_binary_values(self):
+        value = Map([DateTime("2023-01-01T00:00"), DateTime("2023-01-02T00:00")], [2.3, 5.0], index_name="day")
+        self.assertEqual(
+            value_metadata(*to_database(value, binary=True)), ValueMetadata("map", 1, 2, "date_time", "day")
+        )
+        value = TimeSeriesFixedResolution("2023-01-01T00:00", "1h", [1.0, 2.0, 3.0], False, False)
+        self.assertEqual(
+            value_metadata(*to_database(value, binary=True)), ValueMetadata("time_series", 1, 3, None, "t")
+        )
+
+    def test_map_with_metadata_after_data_and_without_rank(self):
+        db_value = (
+            b'{"index_type": "str", "data": [["a", {"type": "map", "index_type": "float", "data": [[1.0, 2.0]]}]], '
+            b'"index_name": "idx"}'
+        )
+        self.assertEqual(value_metadata(db_value, "map"), ValueMetadata("map", 2, 1, "str", "idx"))
+
+    def test_invalid_json_raises(self):
+        with self.assertRaises(ParameterValueFormatError):
+            value_metadata(b'{"index_type": "str", "rank": 1, "data": [["a", 2.3]', "map")
+
+
 if __name__ == "__main__":
     unittest.main()
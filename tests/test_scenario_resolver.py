@@ -0,0 +1,102 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Database API contributors
+# This file is part of Spine Database API.
+# Spine Toolbox is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+import unittest
+from spinedb_api import DatabaseMapping, to_database
+
+
+class TestScenarioResolver(unittest.TestCase):
+    def _add_data(self, db_map):
+        db_map.add_entity_class(name="Widget", active_by_default=True)
+        db_map.add_entity(entity_class_name="Widget", name="gadget")
+        db_map.add_entity(entity_class_name="Widget", name="gizmo")
+        db_map.add_parameter_definition(entity_class_name="Widget", name="weight")
+        db_map.add_alternative(name="heavy")
+        db_map.add_scenario(name="scenario")
+        db_map.add_scenario_alternative(scenario_name="scenario", alternative_name="heavy", rank=2)
+        db_map.add_scenario_alternative(scenario_name="scenario", alternative_name="Base", rank=1)
+        for alternative_name, weight in (("Base", 1.0), ("heavy", 5.0)):
+            value, value_type = to_database(weight)
+            db_map.add_parameter_value(
+                entity_class_name="Widget",
+                entity_byname=("gadget",),
+                parameter_definition_name="weight",
+                alternative_name=alternative_name,
+                value=value,
+                type=value_type,
+            )
+        db_map.add_entity_alternative(
+            entity_class_name="Widget", entity_byname=("gizmo",), alternative_name="Base", active=False
+        )
+
+    def test_alternatives_are_sorted_by_rank(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._add_data(db_map)
+            scenario = db_map.scenario(name="scenario")
+            resolver = db_map.scenario_resolver
+            self.assertEqual(
+                resolver.alternative_ids(scenario["id"]),
+                [db_map.alternative(name="Base")["id"], db_map.alternative(name="heavy")["id"]],
+            )
+            self.assertEqual(scenario["alternative_name_list"], ["Base", "heavy"])
+
+    def test_parameter_value_of_highest_ranked_alternative_wins(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._add_data(db_map)
+            scenario_id = db_map.scenario(name="scenario")["id"]
+            gadget_id = db_map.entity(entity_class_name="Widget", name="gadget")["id"]
+            gizmo_id = db_map.entity(entity_class_name="Widget", name="gizmo")["id"]
+            definition_id = db_map.parameter_definition(entity_class_name="Widget", name="weight")["id"]
+            resolver = db_map.scenario_resolver
+            self.assertEqual(resolver.parameter_value(scenario_id, gadget_id, definition_id)["parsed_value"], 5.0)
+            self.assertIsNone(resolver.parameter_value(scenario_id, gizmo_id, definition_id))
+
+    def test_lookups_follow_changes_in_mapping(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._add_data(db_map)
+            scenario_id = db_map.scenario(name="scenario")["id"]
+            gadget_id = db_map.entity(entity_class_name="Widget", name="gadget")["id"]
+            definition_id = db_map.parameter_definition(entity_class_name="Widget", name="weight")["id"]
+            resolver = db_map.scenario_resolver
+            self.assertEqual(resolver.parameter_value(scenario_id, gadget_id, definition_id)["parsed_value"], 5.0)
+            db_map.parameter_value(
+                entity_class_name="Widget",
+                entity_byname=("gadget",),
+                parameter_definition_name="weight",
+                alternative_name="heavy",
+            ).remove()
+            self.assertEqual(resolver.parameter_value(scenario_id, gadget_id, definition_id)["parsed_value"], 1.0)
+            base_scenario_alternative = db_map.scenario_alternative(scenario_name="scenario", alternative_name="Base")
+            base_scenario_alternative.remove()
+            self.assertIsNone(resolver.parameter_value(scenario_id, gadget_id, definition_id))
+            self.assertEqual(resolver.alternative_ids(scenario_id), [db_map.alternative(name="heavy")["id"]])
+            base_scenario_alternative.restore()
+            self.assertEqual(resolver.parameter_value(scenario_id, gadget_id, definition_id)["parsed_value"], 1.0)
+
+    def test_entity_activity(self):
+        with DatabaseMapping("sqlite://", create=True) as db_map:
+            self._add_data(db_map)
+            scenario_id = db_map.scenario(name="scenario")["id"]
+            gadget_id = db_map.entity(entity_class_name="Widget", name="gadget")["id"]
+            gizmo = db_map.entity(entity_class_name="Widget", name="gizmo")
+            resolver = db_map.scenario_resolver
+            self.assertIsNone(resolver.entity_alternative_activity(scenario_id, gadget_id))
+            self.assertTrue(resolver.is_entity_active(scenario_id, gadget_id))
+            self.assertFalse(resolver.entity_alternative_activity(scenario_id, gizmo["id"]))
+            self.assertFalse(db_map.item_active_in_scenario(gizmo, scenario_id))
+            db_map.add_entity_alternative(
+                entity_class_name="Widget", entity_byname=("gizmo",), alternative_name="heavy", active=True
+            )
+            self.assertTrue(resolver.is_entity_active(scenario_id, gizmo["id"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Database API contributors
+# This file is part of Spine Database API.
+# Spine Database API is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser
+# General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+"""Unit tests for server_client_helpers module."""
+
+import socket
+import unittest
+from spinedb_api.server_client_helpers import (
+    decode,
+    decode_columnar_table,
+    encode,
+    encode_columnar_table,
+    receive_frame,
+    send_frame,
+)
+
+
+class TestEncodeDecode(unittest.TestCase):
+    def test_bytes_containing_separator_characters_survive_round_trip(self):
+        message = {"value": b"\x1f\x04\x1f", "type": "blob"}
+        self.assertEqual(decode(encode(message)), message)
+
+
+class TestFrames(unittest.TestCase):
+    def test_frames_are_received_in_order_they_were_sent(self):
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            send_frame(sender, 23, encode(["first", b"\x04"]), more=True)
+            send_frame(sender, 5, encode(["second", b"\x1f" * 10000]))
+            request_id, message, more = receive_frame(receiver)
+            self.assertEqual(request_id, 23)
+            self.assertEqual(decode(message), ["first", b"\x04"])
+            self.assertTrue(more)
+            request_id, message, more = receive_frame(receiver)
+            self.assertEqual(request_id, 5)
+            self.assertEqual(decode(message), ["second", b"\x1f" * 10000])
+            self.assertFalse(more)
+
+    def test_receive_frame_returns_none_when_connection_is_closed(self):
+        sender, receiver = socket.socketpair()
+        with receiver:
+            sender.close()
+            self.assertIsNone(receive_frame(receiver))
+
+    def test_receive_frame_raises_when_connection_closes_in_the_middle_of_message(self):
+        sender, receiver = socket.socketpair()
+        with receiver:
+            with sender:
+                sender.sendall(encode(["truncated"])[:4])
+            with self.assertRaises(ConnectionError):
+                receive_frame(receiver)
+
+
+class TestColumnarTable(unittest.TestCase):
+    def test_named_columns_survive_round_trip(self):
+        rows = [(1, "Widget", None), (2, "Gadget", b"\x00\x01")]
+        table = decode_columnar_table(encode_columnar_table(rows, ["id", "name", "blob"]))
+        self.assertEqual(table.column_names, ["id", "name", "blob"])
+        self.assertEqual(
+            table.to_pylist(),
+            [{"id": 1, "name": "Widget", "blob": None}, {"id": 2, "name": "Gadget", "blob": b"\x00\x01"}],
+        )
+
+    def test_empty_rows_with_column_names(self):
+        table = decode_columnar_table(encode_columnar_table([], ["id", "name"]))
+        self.assertEqual(table.column_names, ["id", "name"])
+        self.assertEqual(table.num_rows, 0)
+
+    def test_names_and_element_name_lists_in_same_column(self):
+        rows = [("Object", "widget"), ("Relationship", ("widget", "gadget"))]
+        table = decode_columnar_table(encode_columnar_table(rows))
+        self.assertEqual(table.column("0").to_pylist(), ["Object", "Relationship"])
+        self.assertEqual(table.column("1").to_pylist(), ["widget", ["widget", "gadget"]])
+
+    def test_heterogeneous_tuples_become_structs_and_short_rows_are_padded(self):
+        rows = [("Object", "widget", None, (1.0, 2.0, None, "circle", b"\x00")), ("Object", "gadget", "shiny")]
+        table = decode_columnar_table(encode_columnar_table(rows))
+        self.assertEqual(table.column("2").to_pylist(), [None, "shiny"])
+        self.assertEqual(
+            table.column("3").to_pylist(), [{"0": 1.0, "1": 2.0, "2": None, "3": "circle", "4": b"\x00"}, None]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
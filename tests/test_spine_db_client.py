@@ -10,9 +10,12 @@
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ######################################################################################################################
 import multiprocessing
+import socket
+import threading
 import pytest
-from spinedb_api import DatabaseMapping, create_new_spine_database
-from spinedb_api.spine_db_client import lock_db
+from spinedb_api import DatabaseMapping, SpineDBAPIError, create_new_spine_database
+from spinedb_api.server_client_helpers import ReceiveAllMixing, encode, receive_until_eot
+from spinedb_api.spine_db_client import SpineDBClient, lock_db
 from spinedb_api.spine_db_server import closing_spine_db_server, db_server_manager
 
 
@@ -57,3 +60,26 @@ class TestLockDB:
         with DatabaseMapping(db_url) as db_map:
             alternatives = db_map.find_alternatives()
             assert {alt["name"] for alt in alternatives} == {"Base", "visited", "visited again"}
+
+
+def _serve_without_answering(listening_socket, done):
+    connection, _ = listening_socket.accept()
+    with connection:
+        receive_until_eot(connection)
+        connection.sendall(encode({"result": 8}) + ReceiveAllMixing._BEOT)
+        done.wait(5.0)
+
+
+class TestSpineDBClient:
+    def test_request_times_out_when_server_does_not_answer(self):
+        with socket.create_server(("127.0.0.1", 0)) as listening_socket:
+            done = threading.Event()
+            server = threading.Thread(target=_serve_without_answering, args=(listening_socket, done))
+            server.start()
+            try:
+                client = SpineDBClient(listening_socket.getsockname(), timeout=0.1)
+                with pytest.raises(SpineDBAPIError, match="did not respond to 'get_db_url'"):
+                    client.get_db_url()
+            finally:
+                done.set()
+                server.join()